@@ -0,0 +1,239 @@
+"""
+Motor de backfill por bloques y reanudable.
+Divide rangos de cualquier longitud en bloques, registra las fechas completadas de cada
+bloque en un checkpoint local y, tras una caída, continúa donde se quedó sin volver a
+descargar las fechas ya completadas.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'cache', 'backfill_checkpoint.json')
+CHUNK_DAYS = 30
+
+
+class CheckpointStore:
+    """
+    Registro persistente de fechas completadas por trabajo de backfill.
+
+    Un trabajo se identifica por el conjunto de hojas que procesa, así un backfill de
+    otras hojas no se salta fechas que solo se completaron para un trabajo distinto.
+    """
+
+    def __init__(self, path: str = CHECKPOINT_FILE):
+        """
+        Args:
+            path (str): Archivo JSON del checkpoint
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Set[str]] = self._load()
+
+    @staticmethod
+    def job_key(sheets_to_extract: Optional[Iterable[str]]) -> str:
+        """
+        Clave del trabajo a partir de las hojas solicitadas ("*" para todas).
+        """
+        return ",".join(sorted(sheets_to_extract)) if sheets_to_extract else "*"
+
+    def _load(self) -> Dict[str, Set[str]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return {job: set(dates) for job, dates in json.load(f).items()}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Checkpoint de backfill ilegible, se empieza de cero: {e}")
+            return {}
+
+    def _save(self) -> None:
+        """
+        Escribe el checkpoint de forma atómica. Debe llamarse con el lock tomado.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({job: sorted(dates) for job, dates in self._jobs.items()}, f)
+        os.replace(tmp_path, self.path)
+
+    def completed(self, job: str) -> Set[str]:
+        """
+        Fechas ('DD-MM-YYYY') completadas para el trabajo.
+        """
+        with self._lock:
+            return set(self._jobs.get(job, ()))
+
+    def mark_completed(self, job: str, date_strs: Iterable[str]) -> None:
+        """
+        Registra fechas como completadas y persiste el checkpoint una sola vez.
+        BackfillEngine lo llama una vez por bloque, no por fecha.
+        """
+        date_strs = list(date_strs)
+        if not date_strs:
+            return
+        with self._lock:
+            self._jobs.setdefault(job, set()).update(date_strs)
+            self._save()
+
+    def reset(self, job: str) -> None:
+        """
+        Olvida el progreso de un trabajo (para forzar un backfill completo).
+        """
+        with self._lock:
+            self._jobs.pop(job, None)
+            self._save()
+
+
+def split_into_chunks(start_date: str, end_date: str, chunk_days: int = CHUNK_DAYS) -> List[Tuple[str, str]]:
+    """
+    Divide un rango de fechas en bloques consecutivos de como máximo chunk_days días.
+
+    Args:
+        start_date (str): Fecha de inicio en formato 'YYYY-MM-DD'
+        end_date (str): Fecha de fin en formato 'YYYY-MM-DD'
+        chunk_days (int): Días por bloque
+
+    Returns:
+        List[Tuple[str, str]]: Pares (inicio, fin) en formato 'YYYY-MM-DD'
+
+    Raises:
+        ValueError: Si las fechas no tienen formato válido o el inicio es posterior al fin
+
+    Example:
+        >>> split_into_chunks('2025-01-01', '2025-02-15', 30)
+        [('2025-01-01', '2025-01-30'), ('2025-01-31', '2025-02-15')]
+    """
+    try:
+        start = datetime.strptime(start_date, '%Y-%m-%d')
+        end = datetime.strptime(end_date, '%Y-%m-%d')
+    except ValueError:
+        raise ValueError("Las fechas deben estar en formato 'YYYY-MM-DD'")
+    if start > end:
+        raise ValueError("La fecha de inicio no puede ser mayor que la fecha de fin")
+
+    chunks = []
+    while start <= end:
+        chunk_end = min(start + timedelta(days=chunk_days - 1), end)
+        chunks.append((start.strftime('%Y-%m-%d'), chunk_end.strftime('%Y-%m-%d')))
+        start = chunk_end + timedelta(days=1)
+    return chunks
+
+
+class BackfillEngine:
+    """
+    Ejecuta backfills de rangos arbitrarios (sin el límite de 365 días) por bloques,
+    entregando cada libro a un handler y registrando las fechas completadas.
+
+    Una fecha solo se marca completada cuando se obtuvo su libro y el handler terminó
+    sin error; las fechas sin boletín las recuerda el calendario del scraper.
+    """
+
+    def __init__(self, scraper, checkpoint: Optional[CheckpointStore] = None, chunk_days: int = CHUNK_DAYS):
+        """
+        Args:
+            scraper (BVRDScraper): Scraper usado para descargar los libros
+            checkpoint (Optional[CheckpointStore]): Checkpoint de progreso. Si es None, usa CHECKPOINT_FILE.
+            chunk_days (int): Días por bloque
+        """
+        self.scraper = scraper
+        self.checkpoint = checkpoint or CheckpointStore()
+        self.chunk_days = chunk_days
+
+    def run(self, start_date: str, end_date: str,
+            handler: Optional[Callable[[str, Dict[str, pd.DataFrame]], None]] = None,
+            sheets_to_extract: Optional[List[str]] = None,
+            chunk_handler: Optional[Callable[[Dict[str, Dict[str, pd.DataFrame]]], None]] = None) -> int:
+        """
+        Ejecuta (o reanuda) el backfill del rango.
+
+        Args:
+            start_date (str): Fecha de inicio en formato 'YYYY-MM-DD'
+            end_date (str): Fecha de fin en formato 'YYYY-MM-DD'
+            handler (Callable): Función que recibe (fecha 'DD-MM-YYYY', DataFrames "{hoja}_{fecha}")
+                                de cada libro. Si lanza una excepción, la fecha no se marca completada.
+            sheets_to_extract (Optional[List[str]]): Hojas a extraer. Si es None, extrae todas.
+            chunk_handler (Optional[Callable]): Alternativa a handler que recibe todos los libros del
+                                                bloque ({fecha: DataFrames "{hoja}_{fecha}"}) en una sola
+                                                llamada. Si lanza una excepción, ninguna fecha del bloque
+                                                se marca completada.
+
+        Returns:
+            int: Número de fechas completadas en esta ejecución
+
+        Example:
+            >>> engine = BackfillEngine(BVRDScraper())
+            >>> engine.run('2015-01-01', '2025-12-31', handler, ['BB_RFMPOperDia'])
+        """
+        if (handler is None) == (chunk_handler is None):
+            raise ValueError("Se debe indicar handler o chunk_handler (solo uno)")
+        job = CheckpointStore.job_key(sheets_to_extract)
+        done = self.checkpoint.completed(job)
+        chunks = split_into_chunks(start_date, end_date, self.chunk_days)
+        completed_now = 0
+
+        for chunk_number, (chunk_start, chunk_end) in enumerate(chunks, start=1):
+            dates = [d.strftime('%d-%m-%Y') for d in pd.date_range(chunk_start, chunk_end)]
+            pending = [d for d in dates if d not in done]
+            logger.info(f"Bloque {chunk_number}/{len(chunks)} {chunk_start} → {chunk_end}: "
+                        f"{len(pending)} de {len(dates)} fechas pendientes")
+            if not pending:
+                continue
+
+            if chunk_handler is not None:
+                completed_now += self._run_chunk(job, pending, chunk_handler, sheets_to_extract)
+                continue
+
+            # El checkpoint se escribe una vez por bloque (también si el bloque se interrumpe)
+            chunk_completed = []
+            try:
+                for date_str, date_data in self.scraper.iter_workbooks(pending, sheets_to_extract):
+                    if not date_data:
+                        continue
+                    try:
+                        handler(date_str, date_data)
+                    except Exception as e:
+                        logger.error(f"Error procesando {date_str}, se reintentará en la próxima ejecución: {e}")
+                        continue
+                    chunk_completed.append(date_str)
+            finally:
+                self.checkpoint.mark_completed(job, chunk_completed)
+            completed_now += len(chunk_completed)
+
+        logger.info(f"Backfill {start_date} → {end_date}: {completed_now} fechas completadas en esta ejecución")
+        return completed_now
+
+    def _run_chunk(self, job: str, pending: List[str],
+                   chunk_handler: Callable[[Dict[str, Dict[str, pd.DataFrame]]], None],
+                   sheets_to_extract: Optional[List[str]]) -> int:
+        """
+        Descarga los libros pendientes de un bloque, los entrega juntos a chunk_handler y marca
+        sus fechas como completadas si terminó sin error.
+
+        Returns:
+            int: Número de fechas completadas
+        """
+        chunk_data = {
+            date_str: date_data
+            for date_str, date_data in self.scraper.iter_workbooks(pending, sheets_to_extract)
+            if date_data
+        }
+        if not chunk_data:
+            return 0
+        try:
+            chunk_handler(chunk_data)
+        except Exception as e:
+            dates = list(chunk_data)
+            logger.error(f"Error procesando el bloque {dates[0]} → {dates[-1]}, se reintentará en la próxima ejecución: {e}")
+            return 0
+        self.checkpoint.mark_completed(job, chunk_data)
+        return len(chunk_data)
@@ -0,0 +1,235 @@
+"""
+Caché local en disco de los boletines descargados.
+Guarda los bytes crudos de cada libro Excel direccionados por contenido (SHA-256),
+junto con su ETag/Last-Modified para revalidar con GET condicional.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import BinaryIO, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class BulletinCache:
+    """
+    Caché de boletines en disco con revalidación condicional y desalojo LRU por tamaño.
+
+    Estructura del directorio:
+        objects/<sha256>.xlsx   Bytes crudos del libro (direccionados por contenido)
+        index.json              url -> {sha256, etag, last_modified, size, accessed}
+
+    En modo offline la caché es de solo lectura y no se hace ninguna petición de red:
+    las fechas que no estén en caché simplemente no se devuelven.
+
+    Los accesos de get() se registran en memoria y el índice se escribe en put(), en el
+    desalojo, cada INDEX_FLUSH_SECONDS como máximo o al cerrar la caché (close()).
+    """
+
+    INDEX_FILE = "index.json"
+    OBJECTS_DIR = "objects"
+    COPY_CHUNK_SIZE = 64 * 1024
+    # Intervalo máximo entre escrituras del índice por accesos de lectura
+    INDEX_FLUSH_SECONDS = 30.0
+
+    def __init__(self, cache_dir: str, max_bytes: int, offline: bool = False):
+        """
+        Args:
+            cache_dir (str): Directorio raíz de la caché
+            max_bytes (int): Tamaño máximo de los objetos en disco antes de desalojar (LRU)
+            offline (bool): Si es True, sirve solo desde caché y nunca escribe
+        """
+        self.cache_dir = cache_dir
+        self.objects_dir = os.path.join(cache_dir, self.OBJECTS_DIR)
+        self.index_path = os.path.join(cache_dir, self.INDEX_FILE)
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self._lock = threading.Lock()
+        # Accesos registrados en memoria que aún no están en index.json
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+        if not offline:
+            os.makedirs(self.objects_dir, exist_ok=True)
+        self._index = self._load_index()
+
+    def _load_index(self) -> Dict[str, Dict]:
+        """
+        Carga el índice desde disco. Un índice ausente o corrupto equivale a caché vacía.
+        """
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Índice de caché ilegible, se ignora: {e}")
+            return {}
+
+    def _save_index(self) -> None:
+        """
+        Escribe el índice de forma atómica (archivo temporal + replace).
+        Debe llamarse con el lock tomado.
+        """
+        if self.offline:
+            return
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self.index_path)
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, f"{digest}.xlsx")
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Headers If-None-Match / If-Modified-Since para revalidar una URL ya cacheada.
+
+        Args:
+            url (str): URL del boletín
+
+        Returns:
+            Dict[str, str]: Headers condicionales (vacío si la URL no está en caché)
+        """
+        with self._lock:
+            entry = self._index.get(url)
+
+        if entry is None or not os.path.exists(self._object_path(entry["sha256"])):
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def get(self, url: str) -> Optional[bytes]:
+        """
+        Devuelve los bytes cacheados de una URL y marca el acceso para el LRU (en memoria).
+
+        Args:
+            url (str): URL del boletín
+
+        Returns:
+            Optional[bytes]: Contenido del libro o None si no está en caché
+        """
+        with self._lock:
+            entry = self._index.get(url)
+            if entry is None:
+                return None
+
+            try:
+                with open(self._object_path(entry["sha256"]), "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                # Objeto borrado por fuera: olvidar la entrada
+                if not self.offline:
+                    del self._index[url]
+                    self._save_index()
+                return None
+
+            # El acceso queda en memoria; el índice se escribe a lo sumo cada INDEX_FLUSH_SECONDS
+            entry["accessed"] = time.time()
+            self._dirty = True
+            if time.monotonic() - self._last_flush >= self.INDEX_FLUSH_SECONDS:
+                self._save_index()
+            return data
+
+    def flush(self) -> None:
+        """
+        Escribe el índice si hay accesos pendientes de guardar.
+        """
+        with self._lock:
+            if self._dirty:
+                self._save_index()
+
+    def close(self) -> None:
+        """
+        Guarda los accesos pendientes. La caché puede seguir usándose después.
+        """
+        self.flush()
+
+    def __enter__(self) -> "BulletinCache":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def put(self, url: str, content: Union[bytes, memoryview, BinaryIO], etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> None:
+        """
+        Guarda el contenido de una URL y sus validadores HTTP, desalojando si se excede el tamaño.
+
+        Args:
+            url (str): URL del boletín
+            content: Bytes crudos del libro, o un archivo abierto (se lee desde la posición actual)
+            etag (Optional[str]): Header ETag de la respuesta
+            last_modified (Optional[str]): Header Last-Modified de la respuesta
+        """
+        if self.offline:
+            return
+
+        # Escribir a un temporal calculando el hash en la misma pasada, sin copiar el contenido
+        hasher = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.objects_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            if hasattr(content, "read"):
+                for chunk in iter(lambda: content.read(self.COPY_CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+            else:
+                hasher.update(content)
+                f.write(content)
+                size = len(content)
+        digest = hasher.hexdigest()
+        object_path = self._object_path(digest)
+
+        with self._lock:
+            if os.path.exists(object_path):
+                os.remove(tmp_path)
+            else:
+                os.replace(tmp_path, object_path)
+
+            self._index[url] = {
+                "sha256": digest,
+                "etag": etag,
+                "last_modified": last_modified,
+                "size": size,
+                "accessed": time.time(),
+            }
+            self._evict()
+            self._save_index()
+
+    def _evict(self) -> None:
+        """
+        Desaloja las entradas menos usadas recientemente hasta quedar bajo max_bytes.
+        Los objetos compartidos por varias URLs solo se borran cuando ninguna los referencia.
+        Debe llamarse con el lock tomado.
+        """
+        sizes = {entry["sha256"]: entry["size"] for entry in self._index.values()}
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+
+        for url, entry in sorted(self._index.items(), key=lambda item: item[1]["accessed"]):
+            if total <= self.max_bytes:
+                break
+            del self._index[url]
+            digest = entry["sha256"]
+            if not any(other["sha256"] == digest for other in self._index.values()):
+                total -= sizes[digest]
+                try:
+                    os.remove(self._object_path(digest))
+                except FileNotFoundError:
+                    pass
+                logger.info(f"Caché: desalojado {url}")
@@ -0,0 +1,79 @@
+"""
+Comparación de motores de lectura de Excel sobre el boletín de ejemplo del repositorio.
+Verifica que todos los motores producen DataFrames idénticos y mide el tiempo de extracción.
+
+Uso:
+    python extraction/comparar_motores_excel.py [ruta_al_boletin.xlsx] [repeticiones]
+"""
+
+import os
+import sys
+import time
+from io import BytesIO
+from typing import Dict, List
+
+import pandas as pd
+
+# Agregar el directorio raíz del proyecto al path para importaciones
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from extraction.scraper import ScraperUtils
+
+BOLETIN_EJEMPLO = os.path.join(os.path.dirname(__file__), '..', '18-03-2025-Boletin+BVRD+Consolidado+excel.xlsx')
+FECHA_EJEMPLO = '18-03-2025'
+MOTORES = ["openpyxl", "calamine"]
+HOJAS = [
+    "BB_ResumenGeneralMercado",
+    "BB_RFVTransPuestoBolsaMP",
+    "BB_RFMPOperDia",
+    "BB_RFMPOperDiaFirme",
+    "BB_RFMSOperDia",
+    "BB_RFMSOperPlazos",
+    "BB_RentaFijaOperacionesFuturasA",
+    "BB_RFEmisionesCorpV",
+]
+
+
+def extraer(contenido: bytes, motor: str) -> Dict[str, pd.DataFrame]:
+    """
+    Extrae las hojas del pipeline con el motor indicado.
+    """
+    return ScraperUtils.extract_sheets_from_excel(BytesIO(contenido), FECHA_EJEMPLO, HOJAS, engine=motor)
+
+
+def comparar(ruta: str = BOLETIN_EJEMPLO, repeticiones: int = 5) -> bool:
+    """
+    Compara paridad y velocidad de los motores disponibles.
+
+    Args:
+        ruta (str): Ruta al boletín .xlsx
+        repeticiones (int): Número de extracciones por motor para promediar
+
+    Returns:
+        bool: True si todos los motores producen exactamente los mismos DataFrames
+    """
+    with open(ruta, 'rb') as f:
+        contenido = f.read()
+
+    motores: List[str] = [m for m in MOTORES if ScraperUtils.resolve_excel_engine(m) == m]
+    referencia = extraer(contenido, MOTORES[0])
+    paridad = True
+
+    for motor in motores:
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            resultado = extraer(contenido, motor)
+        promedio = (time.perf_counter() - inicio) / repeticiones
+
+        diferentes = [key for key in referencia if key not in resultado or not referencia[key].equals(resultado[key])]
+        paridad = paridad and not diferentes and resultado.keys() == referencia.keys()
+        estado = "idéntico" if not diferentes else f"DIFERENCIAS en {diferentes}"
+        print(f"{motor:>10}: {promedio * 1000:8.1f} ms por libro ({len(resultado)} hojas, {estado})")
+
+    return paridad
+
+
+if __name__ == "__main__":
+    ruta = sys.argv[1] if len(sys.argv) > 1 else BOLETIN_EJEMPLO
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    sys.exit(0 if comparar(ruta, repeticiones) else 1)
@@ -1,86 +1,443 @@
-from scraper import main
-import datetime
-import sys
-import os
-
-# Agregar el directorio raíz del proyecto al path para importaciones
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-
-# Importar funciones de inserción
-from loading.BB_ResumenGeneralMercado_import import insert_data as insert_resumen_general
-from loading.BB_RFVTransPuestoBolsaMP_import import insert_data as insert_rfv_trans_puesto
-from loading.BB_RFMPOperDia_import import insert_data as insert_rfmp_oper_dia
-
-def get_dataset(start_date, end_date, sheet_name):
-    """
-    Descarga y retorna solo el DataFrame de la hoja solicitada.
-    """
-    data = main(start_date, end_date, [sheet_name])
-    
-    for key, df in data.items():
-        if sheet_name in key:
-            return df
-    return None
-
-def data_manager(start_date, end_date):
-    """
-    Gestiona la extracción, transformación e inserción de datos de los boletines.
-    """
-    # Importar transformadores aquí para evitar importación circular
-    from transformers.Sheet_transformers.BB_ResumenGeneralMercado import transform_resumen_general_mercado
-    from transformers.Sheet_transformers.BB_RFVTransPuestoBolsaMP import transform_rfv_trans_puesto_bolsa_mp
-    from transformers.Sheet_transformers.BB_RFMPOperDia import transform_rfmp_oper_dia
-    
-    data_sets = {
-        "BB_ResumenGeneralMercado",
-        "BB_RFVTransPuestoBolsaMP",
-        "BB_RFMPOperDia",
-        "BB_RFMPOperDiaFirme",
-        "BB_RFMSOperDia",
-        "BB_RFMSOperPlazos",
-        "BB_RentaFijaOperacionesFuturasA",
-        "BB_RFEmisionesCorpV"
-    }
-    
-    # Diccionario de transformadores
-    transformers = {
-        "BB_ResumenGeneralMercado": transform_resumen_general_mercado,
-        "BB_RFVTransPuestoBolsaMP": transform_rfv_trans_puesto_bolsa_mp,
-        "BB_RFMPOperDia": transform_rfmp_oper_dia,
-        # Agregar más transformadores aquí cuando estén disponibles
-    }
-    
-    # Diccionario de funciones de inserción
-    inserters = {
-        "BB_ResumenGeneralMercado": insert_resumen_general,
-        "BB_RFVTransPuestoBolsaMP": insert_rfv_trans_puesto,
-        "BB_RFMPOperDia": insert_rfmp_oper_dia,
-        # Agregar más funciones de inserción aquí cuando estén disponibles
-    }
-    
-    sheets_to_extract = list(data_sets)
-    datos = main(start_date, end_date, sheets_to_extract)
-    
-    for sheet_name, df in datos.items():
-        # Obtener el nombre base de la hoja (sin fecha)
-        base_name = next((name for name in data_sets if name in sheet_name), sheet_name)
-        
-        # Si existe un transformador para esta hoja, aplicarlo
-        if base_name in transformers:
-            try:
-                df_transformed = transformers[base_name](df)
-                print(f"\nTransformación exitosa para {base_name}")
-                
-                # Intentar insertar los datos transformados
-                if inserters[base_name](df_transformed):
-                    print(f"Datos insertados exitosamente para {base_name}")
-                else:
-                    print(f"Error al insertar datos para {base_name}")
-                    
-            except Exception as e:
-                print(f"Error al procesar {base_name}: {e}")
-
-if __name__ == "__main__":
-    start_date = "2025-03-17"
-    end_date = "2025-03-17"
-    data_manager(start_date, end_date) 
\ No newline at end of file
+from scraper import main, BVRDScraper
+import datetime
+import pandas as pd
+import sys
+import os
+
+# Agregar el directorio raíz del proyecto al path para importaciones
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Importar funciones de inserción
+from loading.BB_ResumenGeneralMercado_import import insert_data as insert_resumen_general
+from loading.BB_RFVTransPuestoBolsaMP_import import insert_data as insert_rfv_trans_puesto
+from loading.BB_RFMPOperDia_import import insert_data as insert_rfmp_oper_dia
+from loading.conexion_db import get_max_fechas
+from extraction.backfill import BackfillEngine, CHUNK_DAYS
+from extraction.fingerprint_ledger import FingerprintLedger, fingerprint_dataframe
+from transformers.base_transformer import use_output_sort, use_transform_backend
+from transformers.category_dictionary import get_category_dictionary
+from transformers.parallel_executor import ParallelTransformExecutor
+
+def get_dataset(start_date, end_date, sheet_name):
+    """
+    Descarga y retorna solo el DataFrame de la hoja solicitada.
+    """
+    data = main(start_date, end_date, [sheet_name])
+    
+    for key, df in data.items():
+        if sheet_name in key:
+            return df
+    return None
+
+# Fecha desde la que empieza el modo incremental cuando una tabla está vacía
+INCREMENTAL_DEFAULT_START = "2025-01-03"
+
+def get_pipeline():
+    """
+    Devuelve las hojas a extraer y los transformadores e insertadores disponibles por hoja.
+    """
+    # Importar transformadores aquí para evitar importación circular
+    from transformers.Sheet_transformers.BB_ResumenGeneralMercado import transform_resumen_general_mercado
+    from transformers.Sheet_transformers.BB_RFVTransPuestoBolsaMP import transform_rfv_trans_puesto_bolsa_mp
+    from transformers.Sheet_transformers.BB_RFMPOperDia import transform_rfmp_oper_dia
+    
+    data_sets = {
+        "BB_ResumenGeneralMercado",
+        "BB_RFVTransPuestoBolsaMP",
+        "BB_RFMPOperDia",
+        "BB_RFMPOperDiaFirme",
+        "BB_RFMSOperDia",
+        "BB_RFMSOperPlazos",
+        "BB_RentaFijaOperacionesFuturasA",
+        "BB_RFEmisionesCorpV"
+    }
+    
+    # Diccionario de transformadores
+    transformers = {
+        "BB_ResumenGeneralMercado": transform_resumen_general_mercado,
+        "BB_RFVTransPuestoBolsaMP": transform_rfv_trans_puesto_bolsa_mp,
+        "BB_RFMPOperDia": transform_rfmp_oper_dia,
+        # Agregar más transformadores aquí cuando estén disponibles
+    }
+    
+    # Diccionario de funciones de inserción
+    inserters = {
+        "BB_ResumenGeneralMercado": insert_resumen_general,
+        "BB_RFVTransPuestoBolsaMP": insert_rfv_trans_puesto,
+        "BB_RFMPOperDia": insert_rfmp_oper_dia,
+        # Agregar más funciones de inserción aquí cuando estén disponibles
+    }
+    
+    return data_sets, transformers, inserters
+
+def get_read_specs():
+    """
+    Devuelve la especificación de lectura parcial de cada hoja que la declara en su transformador,
+    para que la extracción solo materialice las celdas que el transformador usa.
+    """
+    from transformers.Sheet_transformers.BB_ResumenGeneralMercado import READ_SPEC as resumen_spec
+    from transformers.Sheet_transformers.BB_RFVTransPuestoBolsaMP import READ_SPEC as rfv_trans_puesto_spec
+    
+    return {
+        "BB_ResumenGeneralMercado": resumen_spec,
+        "BB_RFVTransPuestoBolsaMP": rfv_trans_puesto_spec,
+    }
+
+def get_spec_versions():
+    """
+    Devuelve la versión de la especificación de transformación de cada hoja con transformador,
+    que se agrega a su huella para que un cambio de SheetSpec o READ_SPEC vuelva a cargarla.
+    """
+    from transformers.Sheet_transformers.BB_ResumenGeneralMercado import SPEC as resumen_spec
+    from transformers.Sheet_transformers.BB_RFVTransPuestoBolsaMP import SPEC as rfv_trans_puesto_spec
+    from transformers.Sheet_transformers.BB_RFMPOperDia import SPEC as rfmp_oper_dia_spec
+    
+    return {
+        "BB_ResumenGeneralMercado": resumen_spec.version(),
+        "BB_RFVTransPuestoBolsaMP": rfv_trans_puesto_spec.version(),
+        "BB_RFMPOperDia": rfmp_oper_dia_spec.version(),
+    }
+
+def get_batch_transformers():
+    """
+    Devuelve los transformadores por lotes (varias fechas en una sola pasada) disponibles por hoja.
+    """
+    from transformers.Sheet_transformers.BB_ResumenGeneralMercado import transform_resumen_general_mercado_batch
+    from transformers.Sheet_transformers.BB_RFVTransPuestoBolsaMP import transform_rfv_trans_puesto_bolsa_mp_batch
+    from transformers.Sheet_transformers.BB_RFMPOperDia import transform_rfmp_oper_dia_batch
+    
+    return {
+        "BB_ResumenGeneralMercado": transform_resumen_general_mercado_batch,
+        "BB_RFVTransPuestoBolsaMP": transform_rfv_trans_puesto_bolsa_mp_batch,
+        "BB_RFMPOperDia": transform_rfmp_oper_dia_batch,
+    }
+
+def insert_transformed(base_name, etiqueta, df_transformed, inserters):
+    """
+    Inserta una hoja ya transformada. etiqueta identifica la fecha o el rango en los mensajes.
+    Retorna False si falló la inserción.
+    """
+    try:
+        if inserters[base_name](df_transformed):
+            print(f"Datos insertados exitosamente para {base_name} ({etiqueta})")
+            return True
+        print(f"Error al insertar datos para {base_name} ({etiqueta})")
+        return False
+    
+    except Exception as e:
+        print(f"Error al procesar {base_name} ({etiqueta}): {e}")
+        return False
+
+def process_sheet(base_name, fecha, df, transformers, inserters):
+    """
+    Transforma e inserta una hoja de un boletín.
+    Retorna False si la hoja tenía transformador y falló la transformación o la inserción.
+    """
+    # Si existe un transformador para esta hoja, aplicarlo
+    if base_name not in transformers:
+        return True
+    
+    try:
+        df_transformed = transformers[base_name](df)
+    except Exception as e:
+        print(f"Error al procesar {base_name} ({fecha}): {e}")
+        return False
+    
+    print(f"\nTransformación exitosa para {base_name} ({fecha})")
+    return insert_transformed(base_name, fecha, df_transformed, inserters)
+
+def batch_label(partitions):
+    """
+    Etiqueta de un lote de (fecha, DataFrame) para los mensajes.
+    """
+    fechas = [fecha for fecha, _ in partitions]
+    return f"{fechas[0]} → {fechas[-1]}, {len(fechas)} fechas"
+
+def process_sheet_batch(base_name, partitions, batch_transformers, inserters):
+    """
+    Transforma todas las fechas de una hoja en una sola pasada y las inserta con una sola llamada.
+    partitions es una lista de (fecha, DataFrame). Retorna False si falló la transformación o la
+    inserción (en ese caso ninguna de las fechas se considera cargada).
+    """
+    if base_name not in batch_transformers or not partitions:
+        return True
+    
+    rango = batch_label(partitions)
+    try:
+        df_transformed = batch_transformers[base_name]([df for _, df in partitions])
+    except Exception as e:
+        print(f"Error al procesar {base_name} ({rango}): {e}")
+        return False
+    
+    print(f"\nTransformación por lotes exitosa para {base_name} ({rango}): {len(df_transformed)} filas")
+    return insert_transformed(base_name, rango, df_transformed, inserters)
+
+def process_batches(pending, batch_transformers, inserters, executor=None):
+    """
+    Procesa los lotes {hoja: [(fecha, DataFrame), ...]} de varias hojas.
+    Con un ParallelTransformExecutor las hojas se transforman a la vez en su pool de procesos;
+    las inserciones siempre se hacen en este proceso, en el orden de las hojas.
+    Retorna {hoja: True si se cargó}.
+    """
+    if executor is None:
+        return {
+            base_name: process_sheet_batch(base_name, partitions, batch_transformers, inserters)
+            for base_name, partitions in pending.items()
+        }
+    
+    results = {base_name: True for base_name in pending if base_name not in batch_transformers}
+    tasks = (
+        (base_name, batch_transformers[base_name], [df for _, df in partitions])
+        for base_name, partitions in pending.items() if base_name in batch_transformers and partitions
+    )
+    for base_name, df_transformed, error in executor.map(tasks):
+        rango = batch_label(pending[base_name])
+        if error is not None:
+            print(f"Error al procesar {base_name} ({rango}): {error}")
+            results[base_name] = False
+            continue
+        print(f"\nTransformación por lotes exitosa para {base_name} ({rango}): {len(df_transformed)} filas")
+        results[base_name] = insert_transformed(base_name, rango, df_transformed, inserters)
+    return results
+
+def data_manager(start_date, end_date, force=False, batch=False, transform_workers=0, dtype_backend=None,
+                 transform_backend=None, sort_output=True):
+    """
+    Gestiona la extracción, transformación e inserción de datos de los boletines.
+    Las hojas cuyo contenido crudo y cuya especificación de transformación no cambiaron desde
+    la última carga exitosa (según el registro de huellas) no se vuelven a transformar ni a
+    cargar, salvo con force=True.
+    Con batch=True se acumulan las fechas de cada hoja y se transforman e insertan en una sola
+    llamada por hoja al terminar la extracción, en lugar de una por hoja y fecha.
+    Con transform_workers > 0 las transformaciones se reparten en ese número de procesos
+    (por hoja y fecha, o por hoja con batch=True); las inserciones siguen en este proceso.
+    Con dtype_backend="pyarrow" las hojas se extraen, transforman y cargan con columnas Arrow.
+    transform_backend elige el motor de las transformaciones ("pandas" por defecto o "polars") y
+    sort_output=False omite el orden final de cada hoja, que la carga no necesita.
+    """
+    use_transform_backend(transform_backend)
+    use_output_sort(sort_output)
+    data_sets, transformers, inserters = get_pipeline()
+    batch_transformers = get_batch_transformers() if batch else {}
+    sheets_to_extract = list(data_sets)
+    ledger = FingerprintLedger()
+    spec_versions = get_spec_versions()
+    executor = ParallelTransformExecutor(transform_workers) if transform_workers else None
+    skipped = 0
+    
+    def changed_sheets(scraper):
+        # Hojas con transformador cuyo contenido cambió desde la última carga
+        nonlocal skipped
+        for fecha, base_name, df in scraper.scrape_iter(start_date, end_date, sheets_to_extract):
+            if base_name not in transformers:
+                continue
+            fingerprint = fingerprint_dataframe(df, spec_versions.get(base_name, ""))
+            if not force and ledger.is_unchanged(base_name, fecha, fingerprint):
+                skipped += 1
+                continue
+            yield fecha, base_name, df, fingerprint
+    
+    def settle(base_name, fecha, fingerprint, loaded):
+        if loaded:
+            ledger.record(base_name, fecha, fingerprint)
+        else:
+            ledger.forget(base_name, fecha)
+    
+    # Cada hoja se transforma e inserta en cuanto se procesa su libro,
+    # sin esperar a que termine la descarga de todo el rango
+    try:
+        with BVRDScraper(read_specs=get_read_specs(), dtype_backend=dtype_backend) as scraper:
+            if batch:
+                pending = {}
+                for fecha, base_name, df, fingerprint in changed_sheets(scraper):
+                    pending.setdefault(base_name, []).append((fecha, df, fingerprint))
+                loaded = process_batches(
+                    {base_name: [(fecha, df) for fecha, df, _ in partitions] for base_name, partitions in pending.items()},
+                    batch_transformers, inserters, executor
+                )
+                for base_name, partitions in pending.items():
+                    for fecha, _, fingerprint in partitions:
+                        settle(base_name, fecha, fingerprint, loaded[base_name])
+            
+            elif executor is not None:
+                tasks = (
+                    ((fecha, base_name, fingerprint), transformers[base_name], df)
+                    for fecha, base_name, df, fingerprint in changed_sheets(scraper)
+                )
+                for (fecha, base_name, fingerprint), df_transformed, error in executor.map(tasks):
+                    if error is not None:
+                        print(f"Error al procesar {base_name} ({fecha}): {error}")
+                        settle(base_name, fecha, fingerprint, False)
+                        continue
+                    print(f"\nTransformación exitosa para {base_name} ({fecha})")
+                    settle(base_name, fecha, fingerprint, insert_transformed(base_name, fecha, df_transformed, inserters))
+            
+            else:
+                for fecha, base_name, df, fingerprint in changed_sheets(scraper):
+                    settle(base_name, fecha, fingerprint, process_sheet(base_name, fecha, df, transformers, inserters))
+    finally:
+        ledger.flush()
+        get_category_dictionary().flush()
+        if executor is not None:
+            executor.close()
+    
+    if skipped:
+        print(f"\n{skipped} hojas sin cambios desde la última carga (omitidas)")
+
+def backfill_manager(start_date, end_date, chunk_days=CHUNK_DAYS, parse_workers=None, batch=False,
+                     transform_workers=0, dtype_backend=None, transform_backend=None, sort_output=True):
+    """
+    Backfill reanudable de un rango de cualquier longitud (p. ej. 2015-2025).
+    Procesa el rango por bloques y registra cada fecha completada en el checkpoint local;
+    si se interrumpe, la siguiente ejecución continúa sin volver a descargar lo completado.
+    Los libros se parsean en parse_workers procesos mientras siguen las descargas; por defecto
+    uno por núcleo menos el que usa este proceso para transformar y cargar (0 en equipos de un núcleo).
+    Con batch=True cada hoja se transforma e inserta una vez por bloque (chunk_days) en lugar de una
+    vez por fecha; si falla, ninguna fecha del bloque queda completada. Con batch=True y
+    transform_workers > 0, las hojas de cada bloque se transforman a la vez en procesos separados.
+    Con dtype_backend="pyarrow" las hojas se extraen, transforman y cargan con columnas Arrow.
+    transform_backend elige el motor de las transformaciones ("pandas" por defecto o "polars") y
+    sort_output=False omite el orden final de cada hoja, que la carga no necesita.
+    """
+    use_transform_backend(transform_backend)
+    use_output_sort(sort_output)
+    if parse_workers is None:
+        parse_workers = (os.cpu_count() or 1) - 1
+    data_sets, transformers, inserters = get_pipeline()
+    sheets_to_extract = sorted(data_sets)
+    
+    def process_workbook(fecha, date_data):
+        suffix = f"_{fecha}"
+        failed = [
+            key for key, df in date_data.items()
+            if not process_sheet(key[:-len(suffix)], fecha, df, transformers, inserters)
+        ]
+        if failed:
+            # Lanzar para que la fecha no quede marcada como completada
+            raise RuntimeError(f"Hojas con error: {failed}")
+    
+    batch_transformers = get_batch_transformers()
+    
+    def process_chunk(chunk_data):
+        partitions = {}
+        for fecha, date_data in chunk_data.items():
+            suffix = f"_{fecha}"
+            for key, df in date_data.items():
+                partitions.setdefault(key[:-len(suffix)], []).append((fecha, df))
+        loaded = process_batches(partitions, batch_transformers, inserters, executor)
+        failed = [base_name for base_name, ok in loaded.items() if not ok]
+        if failed:
+            # Lanzar para que ninguna fecha del bloque quede marcada como completada
+            raise RuntimeError(f"Hojas con error: {failed}")
+    
+    executor = ParallelTransformExecutor(transform_workers) if batch and transform_workers else None
+    try:
+        with BVRDScraper(parse_workers=parse_workers, read_specs=get_read_specs(), dtype_backend=dtype_backend) as scraper:
+            engine = BackfillEngine(scraper, chunk_days=chunk_days)
+            if batch:
+                return engine.run(start_date, end_date, sheets_to_extract=sheets_to_extract, chunk_handler=process_chunk)
+            return engine.run(start_date, end_date, process_workbook, sheets_to_extract)
+    finally:
+        get_category_dictionary().flush()
+        if executor is not None:
+            executor.close()
+
+def incremental_manager(end_date=None, default_start_date=INCREMENTAL_DEFAULT_START, dtype_backend=None,
+                        transform_backend=None, sort_output=True):
+    """
+    Procesa solo los días hábiles posteriores a la última fecha cargada de cada tabla.
+    Las fechas máximas se leen en una sola consulta; cada hoja se transforma e inserta
+    únicamente para las fechas mayores a su propia marca de agua.
+    
+    Si una fecha falla para una hoja, esa hoja no se procesa para las fechas siguientes:
+    la marca de agua (MAX(fecha)) nunca pasa por encima de una fecha sin cargar, así que la
+    próxima ejecución la reintenta. Una descarga o un parseo fallidos cuentan como fallo de
+    todas las hojas pendientes, y una hoja que falta en un libro válido como fallo de esa hoja;
+    solo un día confirmado sin boletín (404) se salta. Las hojas detenidas se informan al final.
+    
+    Args:
+        end_date: Última fecha a procesar 'YYYY-MM-DD' (por defecto hoy)
+        default_start_date: Fecha inicial 'YYYY-MM-DD' para tablas todavía vacías
+        dtype_backend: "pyarrow" para extraer, transformar y cargar con columnas Arrow
+        transform_backend: Motor de las transformaciones ("pandas" por defecto o "polars")
+        sort_output: Ordenar la salida de las transformaciones (sort_by); la carga no lo necesita
+    
+    Returns:
+        int: Fechas cuyas hojas pendientes se cargaron todas sin error
+    """
+    use_transform_backend(transform_backend)
+    use_output_sort(sort_output)
+    data_sets, transformers, inserters = get_pipeline()
+    end = pd.Timestamp(end_date or datetime.date.today()).date()
+    default_start = pd.Timestamp(default_start_date).date()
+    
+    watermarks = get_max_fechas(inserters.keys())
+    # Primer día pendiente de cada hoja con cargador
+    next_dates = {
+        sheet: (watermarks.get(sheet) + datetime.timedelta(days=1)) if watermarks.get(sheet) else default_start
+        for sheet in inserters
+    }
+    start = min(next_dates.values())
+    if start > end:
+        print("No hay fechas nuevas que procesar")
+        return 0
+    
+    print(f"Marcas de agua: {watermarks}. Procesando {start} → {end}")
+    dates = [d.strftime('%d-%m-%Y') for d in pd.date_range(start, end)]
+    sheets_to_extract = sorted(sheet for sheet in inserters if next_dates[sheet] <= end)
+    processed = 0
+    # Hoja -> primera fecha que no se pudo cargar
+    failed = {}
+    
+    try:
+        with BVRDScraper(read_specs=get_read_specs(), dtype_backend=dtype_backend) as scraper:
+            for fecha, date_data in scraper.iter_workbooks(dates, sheets_to_extract):
+                fecha_dt = datetime.datetime.strptime(fecha, '%d-%m-%Y').date()
+                # Solo las hojas cuya marca de agua es anterior a esta fecha y que no fallaron antes
+                pending = [
+                    base_name for base_name in sheets_to_extract
+                    if base_name not in failed and next_dates[base_name] <= fecha_dt
+                ]
+                if date_data is None:
+                    # Descarga o parseo fallidos: la fecha queda pendiente para todas las hojas
+                    print(f"No se pudo obtener el boletín de {fecha}")
+                    failed.update((base_name, fecha) for base_name in pending)
+                elif date_data:
+                    loaded = None
+                    for base_name in pending:
+                        df = date_data.get(f"{base_name}_{fecha}")
+                        if df is None:
+                            # Hoja solicitada que falta en un libro válido (no encontrada o ilegible)
+                            print(f"La hoja {base_name} no está en el boletín de {fecha}")
+                            ok = False
+                        else:
+                            ok = process_sheet(base_name, fecha, df, transformers, inserters)
+                        if ok:
+                            loaded = loaded is not False
+                        else:
+                            failed[base_name] = fecha
+                            loaded = False
+                    if loaded:
+                        processed += 1
+                if failed and len(failed) == len(sheets_to_extract):
+                    print("Todas las hojas tienen una fecha con error, se detiene el procesamiento")
+                    break
+    finally:
+        get_category_dictionary().flush()
+    
+    for base_name, fecha in failed.items():
+        print(f"{base_name}: error al cargar {fecha}; se reintentará desde esa fecha en la próxima ejecución")
+    return processed
+
+if __name__ == "__main__":
+    # Uso: python database_manager.py [incremental | fecha_inicio fecha_fin]
+    # "incremental" procesa solo lo posterior a la última fecha cargada;
+    # con fechas explícitas ejecuta un backfill reanudable por bloques
+    if len(sys.argv) == 2 and sys.argv[1] == "incremental":
+        incremental_manager()
+    elif len(sys.argv) == 3:
+        backfill_manager(sys.argv[1], sys.argv[2])
+    else:
+        start_date = "2025-03-17"
+        end_date = "2025-03-17"
+        data_manager(start_date, end_date)
@@ -0,0 +1,128 @@
+"""
+Registro local de huellas (fingerprints) por hoja y fecha.
+Permite saltar la transformación y la carga de las hojas cuyo contenido crudo
+no cambió desde la última vez que se cargaron correctamente.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Dict, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+LEDGER_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'cache', 'fingerprints.json')
+
+
+def fingerprint_dataframe(df: pd.DataFrame, version: str = "") -> str:
+    """
+    Huella SHA-256 de las celdas crudas de una hoja (valores, columnas y tipos) y de la
+    versión de su transformación, para que un cambio de especificación recargue la hoja.
+
+    Args:
+        df (pd.DataFrame): Hoja tal como sale de la extracción
+        version (str): Versión de la transformación de la hoja (ver SheetSpec.version)
+
+    Returns:
+        str: Hash hexadecimal del contenido
+
+    Example:
+        >>> fingerprint_dataframe(df) == fingerprint_dataframe(df.copy())
+        True
+    """
+    hasher = hashlib.sha256()
+    hasher.update(version.encode("utf-8"))
+    hasher.update(repr([(str(col), str(dtype)) for col, dtype in df.dtypes.items()]).encode("utf-8"))
+    # Un hash de 64 bits por fila (vectorizado), en lugar de serializar cada celda
+    hasher.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return hasher.hexdigest()
+
+
+class FingerprintLedger:
+    """
+    Huellas de las particiones (hoja, fecha) cargadas con éxito en la base de datos.
+
+    Las escrituras se acumulan en memoria y se persisten con flush(); si el proceso se
+    cae antes, esas particiones simplemente se vuelven a cargar (el MERGE es idempotente).
+    """
+
+    def __init__(self, path: str = LEDGER_FILE):
+        """
+        Args:
+            path (str): Archivo JSON del registro
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._fingerprints: Dict[str, str] = self._load()
+        self._dirty = False
+
+    @staticmethod
+    def _key(sheet_name: str, date_str: str) -> str:
+        return f"{sheet_name}|{date_str}"
+
+    def _load(self) -> Dict[str, str]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Registro de huellas ilegible, se recargarán todas las hojas: {e}")
+            return {}
+
+    def get(self, sheet_name: str, date_str: str) -> Optional[str]:
+        """
+        Huella registrada para la partición, o None si nunca se cargó.
+        """
+        with self._lock:
+            return self._fingerprints.get(self._key(sheet_name, date_str))
+
+    def is_unchanged(self, sheet_name: str, date_str: str, fingerprint: str) -> bool:
+        """
+        Indica si la partición ya se cargó con exactamente este contenido.
+
+        Args:
+            sheet_name (str): Nombre de la hoja (p. ej. 'BB_RFMPOperDia')
+            date_str (str): Fecha en formato 'DD-MM-YYYY'
+            fingerprint (str): Huella actual (ver fingerprint_dataframe)
+
+        Returns:
+            bool: True si la huella coincide con la registrada
+        """
+        return self.get(sheet_name, date_str) == fingerprint
+
+    def record(self, sheet_name: str, date_str: str, fingerprint: str) -> None:
+        """
+        Registra la huella de una partición cargada con éxito (se persiste en flush()).
+        """
+        with self._lock:
+            self._fingerprints[self._key(sheet_name, date_str)] = fingerprint
+            self._dirty = True
+
+    def forget(self, sheet_name: str, date_str: str) -> None:
+        """
+        Olvida una partición para forzar su recarga en la próxima ejecución.
+        """
+        with self._lock:
+            if self._fingerprints.pop(self._key(sheet_name, date_str), None) is not None:
+                self._dirty = True
+
+    def flush(self) -> None:
+        """
+        Escribe el registro de forma atómica si hubo cambios.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._fingerprints, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
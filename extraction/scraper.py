@@ -1,406 +1,1332 @@
-"""
-Scraper para descargar archivos Excel de la Bolsa de Valores de República Dominicana.
-Módulo de extracción de datos que descarga y procesa archivos Excel por rango de fechas.
-"""
-
-import logging
-import time
-from datetime import datetime, date
-from io import BytesIO
-from typing import Dict, List, Optional
-import pandas as pd
-import requests
-
-# Configurar logging
-logging.basicConfig(level=logging.WARNING)  # Cambiar a WARNING para reducir ruido
-logger = logging.getLogger(__name__)
-
-
-class ScraperBase:
-    """Clase base que contiene toda la configuración y constantes."""
-    
-    # URLs y headers
-    BASE_URL = "https://boletin.bvrd.com.do/BOLETINES+Y+PRECIOS+{year}/Boletin+Consolidado/{month_number}.+{month_name}/{day_number}-{month_number1}-{year}-Boletin+BVRD+Consolidado+excel.xlsx"
-    HEADERS = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Referer": "https://boletin.bvrd.com.do/"
-    }
-    
-    # Configuración de descarga
-    DOWNLOAD_TIMEOUT = 30
-    MAX_RETRY_ATTEMPTS = 3
-    RETRY_DELAY = 2
-    
-    # Mapeo de meses
-    MESES_ES = {
-        "January": "Enero", "February": "Febrero", "March": "Marzo", "April": "Abril",
-        "May": "Mayo", "June": "Junio", "July": "Julio", "August": "Agosto",
-        "September": "Septiembre", "October": "Octubre", "November": "Noviembre", "December": "Diciembre"
-    }
-
-
-class ScraperUtils:
-    """Clase con funciones de utilidad para validación y procesamiento."""
-    
-    @staticmethod
-    def validate_date_format(date_str: str) -> bool:
-        """
-        Valida que una fecha esté en el formato correcto 'YYYY-MM-DD'.
-        
-        Args:
-            date_str (str): Fecha a validar
-            
-        Returns:
-            bool: True si el formato es válido, False en caso contrario
-            
-        Example:
-            >>> validate_date_format('2025-01-03')
-            True
-            >>> validate_date_format('2025/01/03')
-            False
-        """
-        try:
-            datetime.strptime(date_str, '%Y-%m-%d')
-            return True
-        except ValueError:
-            return False
-    
-    @staticmethod
-    def validate_date_range(start_date: str, end_date: str) -> bool:
-        """
-        Valida que el rango de fechas sea válido.
-        
-        Args:
-            start_date (str): Fecha de inicio en formato 'YYYY-MM-DD'
-            end_date (str): Fecha de fin en formato 'YYYY-MM-DD'
-            
-        Returns:
-            bool: True si el rango es válido, False en caso contrario
-            
-        Raises:
-            ValueError: Si las fechas no están en formato correcto o el rango es inválido
-        """
-        if not ScraperUtils.validate_date_format(start_date) or not ScraperUtils.validate_date_format(end_date):
-            raise ValueError("Las fechas deben estar en formato 'YYYY-MM-DD'")
-        
-        start = datetime.strptime(start_date, '%Y-%m-%d')
-        end = datetime.strptime(end_date, '%Y-%m-%d')
-        
-        if start > end:
-            raise ValueError("La fecha de inicio no puede ser mayor que la fecha de fin")
-        
-        days_diff = (end - start).days
-        if days_diff > 365:
-            raise ValueError("El rango máximo permitido es de 365 días")
-        
-        return True
-    
-    @staticmethod
-    def create_date_range(start_date: str, end_date: str) -> List[str]:
-        """
-        Genera una lista de fechas entre start_date y end_date.
-        
-        Args:
-            start_date (str): Fecha de inicio en formato 'YYYY-MM-DD'
-            end_date (str): Fecha de fin en formato 'YYYY-MM-DD'
-        
-        Returns:
-            List[str]: Lista de fechas en formato 'DD-MM-YYYY'
-        
-        Example:
-            >>> create_date_range('2025-01-01', '2025-01-03')
-            ['01-01-2025', '02-01-2025', '03-01-2025']
-        """
-        date_range = pd.date_range(start=start_date, end=end_date)
-        return [date.strftime('%d-%m-%Y') for date in date_range]
-    
-    @staticmethod
-    def build_file_url(date_str: str) -> str:
-        """
-        Construye la URL del archivo Excel para una fecha específica.
-        Con esta funcion podremos crear tantas urls como fechas tengamos en el rango de fechas.
-        
-        Args:
-            date_str (str): Fecha en formato 'DD-MM-YYYY'
-            
-        Returns:
-            str: URL completa del archivo Excel
-            
-        Example:
-            >>> build_file_url('03-01-2025')
-            'https://boletin.bvrd.com.do/BOLETINES+Y+PRECIOS+2025/Boletin+Consolidado/1.+Enero/03-01-2025-Boletin+BVRD+Consolidado+excel.xlsx'
-        """
-        date_obj = datetime.strptime(date_str, '%d-%m-%Y')
-        year = date_obj.year # Año del archivo
-        month_name = ScraperBase.MESES_ES[date_obj.strftime('%B')] # Nombre del mes en español
-        month_number = date_obj.month # Mes sin ceros a la izquierda
-        day_number = f"{date_obj.day:02d}"  # Día con ceros a la izquierda
-        month_number_padded = f"{date_obj.month:02d}" # Mes con ceros a la izquierda
-        
-        return ScraperBase.BASE_URL.format(
-            year=year,
-            month_number=month_number,
-            month_name=month_name,
-            day_number=day_number,
-            month_number1=month_number_padded
-        )
-    
-    @staticmethod
-    def download_excel_file(url: str) -> Optional[BytesIO]:
-        """
-        Descarga un archivo Excel desde la URL proporcionada.
-        
-        Args:
-            url (str): URL del archivo Excel a descargar
-            
-        Returns:
-            Optional[BytesIO]: Contenido del archivo o None si falla la descarga
-            
-        Example:
-            >>> file_content = download_excel_file('https://example.com/file.xlsx')
-            >>> if file_content:
-            ...     print("Archivo descargado exitosamente")
-        """
-        try:
-            logger.info(f"Descargando archivo: {url}")
-            response = requests.get(url, headers=ScraperBase.HEADERS, timeout=ScraperBase.DOWNLOAD_TIMEOUT)
-            response.raise_for_status()
-            
-            # Verificar que sea un archivo Excel
-            content_type = response.headers.get("Content-Type", "")
-            if "html" in content_type:
-                logger.warning(f"Servidor devolvió HTML en lugar de Excel: {url}")
-                return None
-            
-            logger.info(f"Archivo descargado exitosamente: {len(response.content)} bytes")
-            return BytesIO(response.content)
-            
-        except requests.exceptions.ConnectionError:
-            logger.error(f"Error de conexión al descargar: {url}")
-            return None
-        except requests.exceptions.Timeout:
-            logger.error(f"Timeout al descargar: {url}")
-            return None
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"Error HTTP {e.response.status_code}: {url}")
-            return None
-        except Exception as e:
-            logger.error(f"Error inesperado al descargar {url}: {e}")
-            return None
-    
-    @staticmethod
-    def extract_sheets_from_excel(file: BytesIO, date: str, sheets_to_extract: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
-        """
-        Extrae hojas específicas de un archivo Excel y las convierte en DataFrames.
-        
-        Args:
-            file (BytesIO): Archivo Excel en memoria
-            date (str): Fecha del archivo en formato 'DD-MM-YYYY'
-            sheets_to_extract (Optional[List[str]]): Lista de nombres de hojas a extraer. 
-                                                   Si es None, extrae todas las hojas.
-            
-        Returns:
-            Dict[str, pd.DataFrame]: Diccionario con DataFrames de cada hoja
-            
-        Example:
-            >>> with open('file.xlsx', 'rb') as f:
-            ...     file_content = BytesIO(f.read())
-            ...     sheets = extract_sheets_from_excel(file_content, '03-01-2025', ['BB_ResumenGeneralMercado'])
-            >>> print(f"Se extrajeron {len(sheets)} hojas")
-        """
-        sheets_data = {}
-        
-        try:
-            excel_data = pd.ExcelFile(file)
-            available_sheets = excel_data.sheet_names
-            
-            # Si no se especifica lista, extraer todas las hojas
-            if sheets_to_extract is None:
-                sheets_to_process = available_sheets
-                sheet_mapping = {sheet: sheet for sheet in available_sheets}
-            else:
-                # Crear mapeo entre nombres solicitados y nombres reales de hojas
-                sheet_mapping = {}
-                sheets_to_process = []
-                
-                for requested_sheet in sheets_to_extract:
-                    # Buscar la hoja exacta primero
-                    if requested_sheet in available_sheets:
-                        sheets_to_process.append(requested_sheet)
-                        sheet_mapping[requested_sheet] = requested_sheet
-                        logger.info(f"Encontrada hoja exacta: '{requested_sheet}'")
-                    else:
-                        # Si no se encuentra, intentar sin prefijo BB_
-                        actual_sheet_name = requested_sheet.replace("BB_", "")
-                        if actual_sheet_name in available_sheets:
-                            sheets_to_process.append(actual_sheet_name)
-                            sheet_mapping[actual_sheet_name] = requested_sheet
-                            logger.info(f"Mapeando '{actual_sheet_name}' -> '{requested_sheet}'")
-                        else:
-                            logger.warning(f"Hoja '{requested_sheet}' no encontrada en el archivo")
-                
-                logger.info(f"Filtrando hojas: {sheets_to_process} de {available_sheets}")
-            
-            logger.info(f"Procesando archivo con {len(sheets_to_process)} hojas de {len(available_sheets)} disponibles")
-            
-            for sheet_name in sheets_to_process:
-                try:
-                    df = pd.read_excel(file, sheet_name=sheet_name)
-                    if not df.empty:
-                        # Agregar columna de fecha
-                        df['Fecha'] = date
-                        # Usar el nombre mapeado
-                        output_key = sheet_mapping[sheet_name]
-                        sheets_data[f"{output_key}_{date}"] = df
-                        logger.info(f"Hoja '{sheet_name}' procesada: {df.shape}")
-                    else:
-                        logger.warning(f"Hoja '{sheet_name}' está vacía")
-                except Exception as e:
-                    logger.error(f"Error procesando hoja '{sheet_name}': {e}")
-                    continue
-            
-            logger.info(f"Archivo procesado exitosamente: {len(sheets_data)} hojas extraídas")
-            return sheets_data
-            
-        except Exception as e:
-            logger.error(f"Error procesando archivo Excel para {date}: {e}")
-            return {}
-
-
-class BVRDScraper:
-    """Clase principal que ejecuta el scraping."""
-    
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
-    
-    def scrape_single_date(self, date_str: str, sheets_to_extract: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
-        """
-        Descarga y procesa un archivo Excel para una fecha específica.
-        
-        Args:
-            date_str (str): Fecha en formato 'DD-MM-YYYY'
-            sheets_to_extract (Optional[List[str]]): Lista de nombres de hojas a extraer.
-                                                   Si es None, extrae todas las hojas.
-            
-        Returns:
-            Dict[str, pd.DataFrame]: DataFrames extraídos o diccionario vacío si falla
-            
-        Example:
-            >>> scraper = BVRDScraper()
-            >>> data = scraper.scrape_single_date('03-01-2025', ['ResumenGeneralMercado'])
-            >>> if data:
-            ...     print(f"Se extrajeron {len(data)} datasets")
-        """
-        url = ScraperUtils.build_file_url(date_str)
-        file_content = ScraperUtils.download_excel_file(url)
-        
-        if file_content is None:
-            self.logger.warning(f"No se pudo descargar archivo para {date_str}")
-            return {}
-        
-        return ScraperUtils.extract_sheets_from_excel(file_content, date_str, sheets_to_extract)
-    
-    def scrape_date_range(self, start_date: str, end_date: str, sheets_to_extract: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
-        """
-        Descarga y procesa archivos Excel para un rango de fechas.
-        
-        Args:
-            start_date (str): Fecha de inicio en formato 'YYYY-MM-DD'
-            end_date (str): Fecha de fin en formato 'YYYY-MM-DD'
-            sheets_to_extract (Optional[List[str]]): Lista de nombres de hojas a extraer.
-                                                   Si es None, extrae todas las hojas.
-            
-        Returns:
-            Dict[str, pd.DataFrame]: Todos los DataFrames extraídos del rango
-            
-        Raises:
-            ValueError: Si el rango de fechas es inválido
-            
-        Example:
-            >>> scraper = BVRDScraper()
-            >>> all_data = scraper.scrape_date_range('2025-01-01', '2025-01-03', ['ResumenGeneralMercado'])
-            >>> print(f"Total de datasets extraídos: {len(all_data)}")
-        """
-        # Validar rango de fechas
-        ScraperUtils.validate_date_range(start_date, end_date)
-        
-        self.logger.info(f"Iniciando scraping para rango: {start_date} → {end_date}")
-        
-        all_data = {}
-        date_range = ScraperUtils.create_date_range(start_date, end_date)
-        
-        for date_str in date_range:
-            self.logger.info(f"Procesando fecha: {date_str}")
-            date_data = self.scrape_single_date(date_str, sheets_to_extract)
-            all_data.update(date_data)
-            
-            # Pequeña pausa para no sobrecargar el servidor
-            time.sleep(0.5)
-        
-        self.logger.info(f"Scraping completado: {len(all_data)} datasets extraídos")
-        return all_data
-
-
-# ===============================================
-# FUNCIÓN DE COMPATIBILIDAD (para mantener interfaz existente)
-# ===============================================
-
-def main(start_date: str, end_date: str, sheets_to_extract: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
-    """
-    Función principal para mantener compatibilidad con código existente.
-    
-    Args:
-        start_date (str): Fecha de inicio en formato 'YYYY-MM-DD'
-        end_date (str): Fecha de fin en formato 'YYYY-MM-DD'
-        sheets_to_extract (Optional[List[str]]): Lista de nombres de hojas a extraer.
-                                               Si es None, extrae todas las hojas.
-        
-    Returns:
-        Dict[str, pd.DataFrame]: Todos los DataFrames extraídos
-        
-    Example:
-        >>> data = main('2025-01-01', '2025-01-03', ['ResumenGeneralMercado'])
-        >>> for key, df in data.items():
-        ...     print(f"{key}: {df.shape}")
-    """
-    scraper = BVRDScraper()
-    return scraper.scrape_date_range(start_date, end_date, sheets_to_extract)
-
-
-# ===============================================
-# CÓDIGO DE EJECUCIÓN
-# ===============================================
-
-if __name__ == "__main__":
-    # Configurar logging para ejecución directa
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    
-    # Ejemplo de uso
-    start_date = "2025-01-03"
-    end_date = date.today().strftime('%Y-%m-%d')
-    
-    try:
-        logger.info("Iniciando scraping de BVRD")
-        data = main(start_date, end_date)
-        
-        # Mostrar resumen de resultados
-        logger.info("=" * 50)
-        logger.info("RESUMEN DE EXTRACCIÓN")
-        logger.info("=" * 50)
-        
-        for key, df in data.items():
-            logger.info(f"{key}: {df.shape}")
-        
-        logger.info(f"Total de datasets extraídos: {len(data)}")
-        
-    except ValueError as e:
-        logger.error(f"Error de validación: {e}")
-    except Exception as e:
-        logger.error(f"Error inesperado: {e}")
-        import traceback
-        traceback.print_exc()
-
-
+"""
+Scraper para descargar archivos Excel de la Bolsa de Valores de República Dominicana.
+Módulo de extracción de datos que descarga y procesa archivos Excel por rango de fechas.
+"""
+
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, date
+import io
+import tempfile
+from io import BytesIO
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow es opcional: solo lo requiere DTYPE_BACKEND = "pyarrow"
+    pa = None
+
+# Agregar el directorio raíz del proyecto al path para importaciones
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from extraction.bulletin_cache import BulletinCache
+from extraction.trading_calendar import TradingCalendar
+from extraction.sheet_read_spec import SheetReadSpec
+
+# Configurar logging
+logging.basicConfig(level=logging.WARNING)  # Cambiar a WARNING para reducir ruido
+logger = logging.getLogger(__name__)
+
+
+class ScraperBase:
+    """Clase base que contiene toda la configuración y constantes."""
+    
+    # URLs y headers
+    BASE_URL = "https://boletin.bvrd.com.do/BOLETINES+Y+PRECIOS+{year}/Boletin+Consolidado/{month_number}.+{month_name}/{day_number}-{month_number1}-{year}-Boletin+BVRD+Consolidado+excel.xlsx"
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        "Referer": "https://boletin.bvrd.com.do/"
+    }
+    
+    # Configuración de descarga
+    DOWNLOAD_TIMEOUT = 30
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024  # Tamaño de cada bloque leído del socket
+    MAX_DOWNLOAD_BYTES = 50 * 1024 * 1024  # Límite de tamaño de un boletín (50 MB)
+    SPOOL_THRESHOLD_BYTES = 8 * 1024 * 1024  # Por encima de esto el boletín se vuelca a un temporal en disco
+    MAX_RETRY_ATTEMPTS = 3
+    RETRY_DELAY = 2  # Espera base del backoff exponencial (segundos)
+    RETRY_MAX_DELAY = 30  # Tope de espera entre reintentos (segundos)
+    
+    # Circuit breaker: tras N fallos transitorios seguidos se pausan todas las descargas
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    CIRCUIT_RESET_TIMEOUT = 60  # Segundos de pausa antes de volver a probar el servidor
+    
+    # Configuración de concurrencia
+    MAX_WORKERS = 4  # Descargas simultáneas
+    REQUESTS_PER_SECOND = 4.0  # Límite global de peticiones al servidor
+    RATE_LIMIT_BURST = 4  # Peticiones que pueden salir de golpe
+    
+    # Pool de conexiones HTTP (keep-alive)
+    HTTP_POOL_SIZE = 8  # Conexiones persistentes máximas hacia el servidor
+    
+    # Pipeline productor/consumidor: descargas en hilos, parseo de libros en procesos
+    PARSE_WORKERS = 0  # Procesos de parseo (0 = parsear en los mismos hilos de descarga)
+    PARSE_QUEUE_SIZE = 8  # Libros descargados en espera de parseo como máximo
+    
+    # Caché local de boletines
+    CACHE_ENABLED = True
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'cache', 'boletines')
+    CACHE_MAX_BYTES = 1024 * 1024 * 1024  # 1 GB
+    
+    # Motor de lectura de Excel: "calamine" (Rust, mucho más rápido) u "openpyxl" (comportamiento original).
+    # Si el motor elegido no está instalado o falla al abrir el libro, se usa DEFAULT_EXCEL_ENGINE.
+    EXCEL_ENGINE = "calamine"
+    DEFAULT_EXCEL_ENGINE = "openpyxl"
+    
+    # Tipos de las hojas extraídas: None (columnas object, comportamiento original) o "pyarrow"
+    # (columnas Arrow de texto, número y fecha que los transformadores y cargadores conservan).
+    # Si pyarrow no está instalado se extrae con los tipos originales.
+    DTYPE_BACKEND = None
+    
+    # Calendario bursátil (evita pedir fines de semana, feriados y fechas sin boletín)
+    USE_TRADING_CALENDAR = True
+    NO_BULLETIN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'cache', 'fechas_sin_boletin.json')
+    EXTRA_HOLIDAYS = []  # Cierres adicionales de la bolsa (datetime.date)
+    
+    # Mapeo de meses
+    MESES_ES = {
+        "January": "Enero", "February": "Febrero", "March": "Marzo", "April": "Abril",
+        "May": "Mayo", "June": "Junio", "July": "Julio", "August": "Agosto",
+        "September": "Septiembre", "October": "Octubre", "November": "Noviembre", "December": "Diciembre"
+    }
+
+
+class BulletinNotFoundError(Exception):
+    """El servidor no tiene boletín para la fecha (404 o página HTML en lugar del Excel)."""
+
+
+class DownloadTooLargeError(Exception):
+    """El boletín supera ScraperBase.MAX_DOWNLOAD_BYTES."""
+
+
+class MemoryViewReader(io.RawIOBase):
+    """
+    Archivo de solo lectura sobre un buffer en memoria, sin copiarlo.
+    El parser de Excel lee directamente del buffer donde se descargó el boletín
+    (a diferencia de BytesIO(bytes(...)), que obligaría a tener dos copias).
+    """
+    
+    def __init__(self, buffer):
+        self._view = memoryview(buffer)
+        self._pos = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def readinto(self, b) -> int:
+        n = max(0, min(len(b), len(self._view) - self._pos))
+        b[:n] = self._view[self._pos:self._pos + n]
+        self._pos += n
+        return n
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        elif whence == io.SEEK_END:
+            self._pos = len(self._view) + offset
+        else:
+            raise ValueError(f"whence inválido: {whence}")
+        if self._pos < 0:
+            raise ValueError("Posición negativa")
+        return self._pos
+    
+    def tell(self) -> int:
+        return self._pos
+    
+    def getbuffer(self) -> memoryview:
+        """
+        Vista sobre el contenido completo (sin copia).
+        """
+        return self._view
+
+
+class TokenBucket:
+    """
+    Limitador de tasa global (token bucket) compartido por todos los hilos de descarga.
+    Reemplaza la pausa fija entre fechas: cada petición consume un token y los tokens
+    se reponen a razón de `rate` por segundo hasta un máximo de `capacity`.
+    """
+    
+    def __init__(self, rate: float, capacity: int = 1):
+        """
+        Args:
+            rate (float): Tokens repuestos por segundo. Si es <= 0 no se limita la tasa.
+            capacity (int): Máximo de tokens acumulables (ráfaga permitida)
+        """
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """
+        Bloquea hasta que haya un token disponible y lo consume.
+        """
+        if self.rate <= 0:
+            return
+        
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                wait = (1 - self._tokens) / self.rate
+            
+            time.sleep(wait)
+
+
+class RetryPolicy:
+    """
+    Política de reintentos con backoff exponencial y jitter completo.
+    Solo se reintentan errores transitorios: timeouts, conexiones caídas/reseteadas,
+    respuestas 5xx y 429. Un 404 o una respuesta HTML son permanentes.
+    """
+    
+    RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+    
+    def __init__(self, max_attempts: Optional[int] = None, base_delay: Optional[float] = None,
+                 max_delay: Optional[float] = None):
+        """
+        Args:
+            max_attempts (Optional[int]): Intentos totales por descarga. Si es None, usa ScraperBase.MAX_RETRY_ATTEMPTS.
+            base_delay (Optional[float]): Espera base en segundos. Si es None, usa ScraperBase.RETRY_DELAY.
+            max_delay (Optional[float]): Espera máxima en segundos. Si es None, usa ScraperBase.RETRY_MAX_DELAY.
+        """
+        self.max_attempts = max(1, max_attempts or ScraperBase.MAX_RETRY_ATTEMPTS)
+        self.base_delay = ScraperBase.RETRY_DELAY if base_delay is None else base_delay
+        self.max_delay = ScraperBase.RETRY_MAX_DELAY if max_delay is None else max_delay
+    
+    def is_retryable(self, error: Exception) -> bool:
+        """
+        Indica si el error es transitorio y vale la pena reintentar.
+        """
+        if isinstance(error, requests.exceptions.HTTPError):
+            return error.response is not None and (
+                error.response.status_code in self.RETRYABLE_STATUS or error.response.status_code >= 500
+            )
+        return isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError,
+                                  requests.exceptions.ChunkedEncodingError))
+    
+    def backoff(self, attempt: int) -> float:
+        """
+        Segundos a esperar antes del siguiente intento (jitter completo sobre 2^intento).
+        
+        Args:
+            attempt (int): Número del intento que acaba de fallar (desde 1)
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker compartido por todos los hilos de descarga.
+    
+    Tras `failure_threshold` fallos transitorios consecutivos el circuito se abre y todas
+    las descargas esperan `reset_timeout` segundos. Después se deja pasar una petición de
+    prueba (semiabierto): si tiene éxito el circuito se cierra, si falla se vuelve a abrir.
+    """
+    
+    def __init__(self, failure_threshold: Optional[int] = None, reset_timeout: Optional[float] = None):
+        """
+        Args:
+            failure_threshold (Optional[int]): Fallos seguidos que abren el circuito.
+                                               Si es None, usa ScraperBase.CIRCUIT_FAILURE_THRESHOLD.
+            reset_timeout (Optional[float]): Segundos con el circuito abierto.
+                                             Si es None, usa ScraperBase.CIRCUIT_RESET_TIMEOUT.
+        """
+        self.failure_threshold = max(1, failure_threshold or ScraperBase.CIRCUIT_FAILURE_THRESHOLD)
+        self.reset_timeout = ScraperBase.CIRCUIT_RESET_TIMEOUT if reset_timeout is None else reset_timeout
+        self._failures = 0
+        self._open_until = 0.0
+        self._half_open = False
+        self._lock = threading.Lock()
+    
+    def wait(self) -> None:
+        """
+        Bloquea mientras el circuito esté abierto; en semiabierto deja pasar un solo hilo.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self._open_until:
+                    if self._failures < self.failure_threshold:
+                        return
+                    if not self._half_open:
+                        # Primera petición tras la pausa: petición de prueba
+                        self._half_open = True
+                        logger.info("Circuit breaker semiabierto: probando el servidor")
+                        return
+                    wait = 1.0
+                else:
+                    wait = self._open_until - now
+            time.sleep(wait)
+    
+    def record_success(self) -> None:
+        """
+        El servidor respondió: cerrar el circuito.
+        """
+        with self._lock:
+            if self._failures >= self.failure_threshold:
+                logger.info("Circuit breaker cerrado: el servidor responde de nuevo")
+            self._failures = 0
+            self._half_open = False
+    
+    def record_failure(self) -> None:
+        """
+        Registra un fallo transitorio; abre el circuito al alcanzar el umbral.
+        """
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold and (self._half_open or self._open_until <= time.monotonic()):
+                self._open_until = time.monotonic() + self.reset_timeout
+                self._half_open = False
+                logger.warning(f"Circuit breaker abierto: {self._failures} fallos seguidos, "
+                               f"pausando descargas {self.reset_timeout}s")
+
+
+class HttpSessionPool:
+    """
+    Pool de conexiones HTTP keep-alive compartido por todos los hilos de descarga.
+    
+    requests.Session no es seguro entre hilos, así que cada hilo usa su propia sesión,
+    pero todas montan el mismo HTTPAdapter: el pool de conexiones de urllib3 (que sí es
+    seguro entre hilos) se comparte y las conexiones TCP/TLS se reutilizan entre descargas.
+    """
+    
+    def __init__(self, pool_size: Optional[int] = None, headers: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            pool_size (Optional[int]): Conexiones persistentes máximas. Si es None, usa ScraperBase.HTTP_POOL_SIZE.
+            headers (Optional[Dict[str, str]]): Headers por defecto. Si es None, usa ScraperBase.HEADERS.
+        """
+        self.pool_size = max(1, pool_size or ScraperBase.HTTP_POOL_SIZE)
+        self.headers = headers or ScraperBase.HEADERS
+        # pool_block=True: si todos los hilos están ocupados se espera una conexión libre
+        # en lugar de abrir conexiones extra que luego se descartan
+        self.adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, pool_block=True)
+        self._local = threading.local()
+    
+    @property
+    def session(self) -> requests.Session:
+        """
+        Sesión del hilo actual, creada bajo demanda sobre el adaptador compartido.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            session.mount("https://", self.adapter)
+            session.mount("http://", self.adapter)
+            self._local.session = session
+        return session
+    
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Ejecuta un GET reutilizando las conexiones del pool.
+        """
+        return self.session.get(url, **kwargs)
+    
+    def close(self) -> None:
+        """
+        Cierra todas las conexiones del pool.
+        """
+        self.adapter.close()
+
+
+class ScraperUtils:
+    """Clase con funciones de utilidad para validación y procesamiento."""
+    
+    @staticmethod
+    def validate_date_format(date_str: str) -> bool:
+        """
+        Valida que una fecha esté en el formato correcto 'YYYY-MM-DD'.
+        
+        Args:
+            date_str (str): Fecha a validar
+            
+        Returns:
+            bool: True si el formato es válido, False en caso contrario
+            
+        Example:
+            >>> validate_date_format('2025-01-03')
+            True
+            >>> validate_date_format('2025/01/03')
+            False
+        """
+        try:
+            datetime.strptime(date_str, '%Y-%m-%d')
+            return True
+        except ValueError:
+            return False
+    
+    @staticmethod
+    def validate_date_range(start_date: str, end_date: str) -> bool:
+        """
+        Valida que el rango de fechas sea válido.
+        
+        Args:
+            start_date (str): Fecha de inicio en formato 'YYYY-MM-DD'
+            end_date (str): Fecha de fin en formato 'YYYY-MM-DD'
+            
+        Returns:
+            bool: True si el rango es válido, False en caso contrario
+            
+        Raises:
+            ValueError: Si las fechas no están en formato correcto o el rango es inválido
+        """
+        if not ScraperUtils.validate_date_format(start_date) or not ScraperUtils.validate_date_format(end_date):
+            raise ValueError("Las fechas deben estar en formato 'YYYY-MM-DD'")
+        
+        start = datetime.strptime(start_date, '%Y-%m-%d')
+        end = datetime.strptime(end_date, '%Y-%m-%d')
+        
+        if start > end:
+            raise ValueError("La fecha de inicio no puede ser mayor que la fecha de fin")
+        
+        days_diff = (end - start).days
+        if days_diff > 365:
+            raise ValueError("El rango máximo permitido es de 365 días")
+        
+        return True
+    
+    @staticmethod
+    def create_date_range(start_date: str, end_date: str) -> List[str]:
+        """
+        Genera una lista de fechas entre start_date y end_date.
+        
+        Args:
+            start_date (str): Fecha de inicio en formato 'YYYY-MM-DD'
+            end_date (str): Fecha de fin en formato 'YYYY-MM-DD'
+        
+        Returns:
+            List[str]: Lista de fechas en formato 'DD-MM-YYYY'
+        
+        Example:
+            >>> create_date_range('2025-01-01', '2025-01-03')
+            ['01-01-2025', '02-01-2025', '03-01-2025']
+        """
+        date_range = pd.date_range(start=start_date, end=end_date)
+        return [date.strftime('%d-%m-%Y') for date in date_range]
+    
+    @staticmethod
+    def build_file_url(date_str: str) -> str:
+        """
+        Construye la URL del archivo Excel para una fecha específica.
+        Con esta funcion podremos crear tantas urls como fechas tengamos en el rango de fechas.
+        
+        Args:
+            date_str (str): Fecha en formato 'DD-MM-YYYY'
+            
+        Returns:
+            str: URL completa del archivo Excel
+            
+        Example:
+            >>> build_file_url('03-01-2025')
+            'https://boletin.bvrd.com.do/BOLETINES+Y+PRECIOS+2025/Boletin+Consolidado/1.+Enero/03-01-2025-Boletin+BVRD+Consolidado+excel.xlsx'
+        """
+        date_obj = datetime.strptime(date_str, '%d-%m-%Y')
+        year = date_obj.year # Año del archivo
+        month_name = ScraperBase.MESES_ES[date_obj.strftime('%B')] # Nombre del mes en español
+        month_number = date_obj.month # Mes sin ceros a la izquierda
+        day_number = f"{date_obj.day:02d}"  # Día con ceros a la izquierda
+        month_number_padded = f"{date_obj.month:02d}" # Mes con ceros a la izquierda
+        
+        return ScraperBase.BASE_URL.format(
+            year=year,
+            month_number=month_number,
+            month_name=month_name,
+            day_number=day_number,
+            month_number1=month_number_padded
+        )
+    
+    @staticmethod
+    def read_response_body(response: requests.Response) -> BinaryIO:
+        """
+        Lee el cuerpo de una respuesta en streaming, sin mantener dos copias del libro.
+        
+        Con Content-Length conocido y pequeño, los bloques se escriben en un bytearray
+        preasignado del tamaño exacto y se entregan como MemoryViewReader. Si el tamaño es
+        desconocido o supera SPOOL_THRESHOLD_BYTES, se vuelcan a un SpooledTemporaryFile
+        (en memoria hasta el umbral, en disco por encima).
+        
+        Args:
+            response (requests.Response): Respuesta abierta con stream=True
+            
+        Returns:
+            BinaryIO: Archivo posicionado al inicio con el contenido del libro
+            
+        Raises:
+            DownloadTooLargeError: Si el boletín supera ScraperBase.MAX_DOWNLOAD_BYTES
+        """
+        max_bytes = ScraperBase.MAX_DOWNLOAD_BYTES
+        declared = response.headers.get("Content-Length")
+        # Con Content-Encoding el tamaño declarado es el comprimido, no el final
+        expected = int(declared) if declared and declared.isdigit() and not response.headers.get("Content-Encoding") else None
+        
+        if expected is not None and expected > max_bytes:
+            raise DownloadTooLargeError(f"{expected} bytes declarados (máximo {max_bytes})")
+        
+        chunks = response.iter_content(chunk_size=ScraperBase.DOWNLOAD_CHUNK_SIZE)
+        
+        if expected is not None and expected <= ScraperBase.SPOOL_THRESHOLD_BYTES:
+            buffer = bytearray(expected)
+            pos = 0
+            for chunk in chunks:
+                end = pos + len(chunk)
+                if end > expected:
+                    # El servidor envió más de lo declarado: seguir en un temporal
+                    spooled = tempfile.SpooledTemporaryFile(max_size=ScraperBase.SPOOL_THRESHOLD_BYTES)
+                    spooled.write(memoryview(buffer)[:pos])
+                    spooled.write(chunk)
+                    return ScraperUtils._spool_remaining(spooled, chunks, end)
+                buffer[pos:end] = chunk
+                pos = end
+            return MemoryViewReader(memoryview(buffer)[:pos])
+        
+        spooled = tempfile.SpooledTemporaryFile(max_size=ScraperBase.SPOOL_THRESHOLD_BYTES)
+        return ScraperUtils._spool_remaining(spooled, chunks, 0)
+    
+    @staticmethod
+    def _spool_remaining(spooled, chunks, size: int) -> BinaryIO:
+        """
+        Vuelca los bloques restantes al temporal aplicando el límite de tamaño.
+        """
+        for chunk in chunks:
+            size += len(chunk)
+            if size > ScraperBase.MAX_DOWNLOAD_BYTES:
+                spooled.close()
+                raise DownloadTooLargeError(f"más de {ScraperBase.MAX_DOWNLOAD_BYTES} bytes recibidos")
+            spooled.write(chunk)
+        spooled.seek(0)
+        return spooled
+    
+    @staticmethod
+    def download_excel_file(url: str, http: Optional[HttpSessionPool] = None,
+                            cache: Optional[BulletinCache] = None, raise_not_found: bool = False,
+                            retry_policy: Optional[RetryPolicy] = None,
+                            circuit_breaker: Optional[CircuitBreaker] = None) -> Optional[BinaryIO]:
+        """
+        Descarga un archivo Excel desde la URL proporcionada.
+        Si se pasa una caché, revalida con GET condicional (un 304 sirve la copia local)
+        y en modo offline solo lee de la caché sin tocar la red.
+        Los errores transitorios se reintentan con backoff exponencial y jitter.
+        El cuerpo se lee en streaming (ver read_response_body) con límite de tamaño.
+        
+        Args:
+            url (str): URL del archivo Excel a descargar
+            http (Optional[HttpSessionPool]): Pool de conexiones a reutilizar.
+                                              Si es None, abre una conexión nueva.
+            cache (Optional[BulletinCache]): Caché local de boletines. Si es None, siempre descarga.
+            raise_not_found (bool): Si es True, un 404 o una respuesta HTML lanzan
+                                    BulletinNotFoundError en lugar de devolver None.
+            retry_policy (Optional[RetryPolicy]): Política de reintentos. Si es None, usa la configuración de ScraperBase.
+            circuit_breaker (Optional[CircuitBreaker]): Circuit breaker compartido entre descargas.
+            
+        Returns:
+            Optional[BinaryIO]: Contenido del archivo o None si falla la descarga
+            
+        Raises:
+            BulletinNotFoundError: Si raise_not_found es True y no existe boletín para la URL
+            
+        Example:
+            >>> file_content = download_excel_file('https://example.com/file.xlsx')
+            >>> if file_content:
+            ...     print("Archivo descargado exitosamente")
+        """
+        headers = ScraperBase.HEADERS
+        if cache is not None:
+            if cache.offline:
+                cached = cache.get(url)
+                if cached is None:
+                    logger.info(f"Modo offline: boletín no disponible en caché: {url}")
+                    return None
+                return BytesIO(cached)
+            headers = {**headers, **cache.conditional_headers(url)}
+        
+        retry_policy = retry_policy or RetryPolicy()
+        client = http or requests
+        attempt = 0
+        
+        while True:
+            attempt += 1
+            if circuit_breaker is not None:
+                circuit_breaker.wait()
+            
+            try:
+                logger.info(f"Descargando archivo: {url}")
+                response = client.get(url, headers=headers, timeout=ScraperBase.DOWNLOAD_TIMEOUT, stream=True)
+                
+                if response.status_code == 304 and cache is not None:
+                    response.close()
+                    cached = cache.get(url)
+                    if cached is not None:
+                        logger.info(f"Boletín sin cambios (304), usando caché: {url}")
+                        if circuit_breaker is not None:
+                            circuit_breaker.record_success()
+                        return BytesIO(cached)
+                    # La copia local desapareció entre la revalidación y la lectura
+                    headers = ScraperBase.HEADERS
+                    response = client.get(url, headers=headers, timeout=ScraperBase.DOWNLOAD_TIMEOUT, stream=True)
+                
+                try:
+                    response.raise_for_status()
+                    if circuit_breaker is not None:
+                        circuit_breaker.record_success()
+                    
+                    # Verificar que sea un archivo Excel (antes de leer el cuerpo)
+                    content_type = response.headers.get("Content-Type", "")
+                    if "html" in content_type:
+                        logger.warning(f"Servidor devolvió HTML en lugar de Excel: {url}")
+                        if raise_not_found:
+                            raise BulletinNotFoundError(url)
+                        return None
+                    
+                    content = ScraperUtils.read_response_body(response)
+                finally:
+                    # Devuelve la conexión al pool aunque el cuerpo no se haya leído
+                    response.close()
+                
+                size = content.seek(0, io.SEEK_END)
+                content.seek(0)
+                logger.info(f"Archivo descargado exitosamente: {size} bytes")
+                if cache is not None:
+                    body = content.getbuffer() if isinstance(content, MemoryViewReader) else content
+                    cache.put(url, body, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+                    content.seek(0)
+                return content
+                
+            except requests.exceptions.RequestException as e:
+                retryable = retry_policy.is_retryable(e)
+                if circuit_breaker is not None:
+                    # Un 404 también prueba que el servidor responde
+                    if retryable:
+                        circuit_breaker.record_failure()
+                    else:
+                        circuit_breaker.record_success()
+                
+                if retryable and attempt < retry_policy.max_attempts:
+                    delay = retry_policy.backoff(attempt)
+                    logger.warning(f"Intento {attempt}/{retry_policy.max_attempts} fallido ({type(e).__name__}), "
+                                   f"reintentando en {delay:.1f}s: {url}")
+                    time.sleep(delay)
+                    continue
+                
+                if isinstance(e, requests.exceptions.Timeout):
+                    logger.error(f"Timeout al descargar: {url}")
+                elif isinstance(e, requests.exceptions.ConnectionError):
+                    logger.error(f"Error de conexión al descargar: {url}")
+                elif isinstance(e, requests.exceptions.HTTPError):
+                    logger.error(f"Error HTTP {e.response.status_code}: {url}")
+                    if raise_not_found and e.response.status_code == 404:
+                        raise BulletinNotFoundError(url) from e
+                else:
+                    logger.error(f"Error inesperado al descargar {url}: {e}")
+                return None
+            except BulletinNotFoundError:
+                raise
+            except DownloadTooLargeError as e:
+                logger.error(f"Boletín demasiado grande ({e}): {url}")
+                return None
+            except Exception as e:
+                if circuit_breaker is not None:
+                    circuit_breaker.record_failure()
+                logger.error(f"Error inesperado al descargar {url}: {e}")
+                return None
+    
+    @staticmethod
+    def resolve_excel_engine(engine: Optional[str] = None) -> str:
+        """
+        Determina el motor de lectura a usar, cayendo al motor por defecto si el elegido no está instalado.
+        
+        Args:
+            engine (Optional[str]): Motor solicitado. Si es None, usa ScraperBase.EXCEL_ENGINE.
+            
+        Returns:
+            str: Nombre del motor para pd.ExcelFile
+        """
+        engine = engine or ScraperBase.EXCEL_ENGINE
+        if engine == "calamine":
+            try:
+                import python_calamine  # noqa: F401
+            except ImportError:
+                logger.info("python-calamine no está instalado, usando openpyxl")
+                return ScraperBase.DEFAULT_EXCEL_ENGINE
+        return engine
+    
+    @staticmethod
+    def open_excel_file(file: BinaryIO, engine: Optional[str] = None) -> pd.ExcelFile:
+        """
+        Abre un libro Excel con el motor elegido; si falla, reintenta con el motor por defecto.
+        
+        Args:
+            file (BinaryIO): Archivo Excel (BytesIO, MemoryViewReader o temporal)
+            engine (Optional[str]): Motor solicitado. Si es None, usa ScraperBase.EXCEL_ENGINE.
+            
+        Returns:
+            pd.ExcelFile: Libro abierto
+        """
+        engine = ScraperUtils.resolve_excel_engine(engine)
+        try:
+            return pd.ExcelFile(file, engine=engine)
+        except Exception as e:
+            if engine == ScraperBase.DEFAULT_EXCEL_ENGINE:
+                raise
+            logger.warning(f"Motor '{engine}' no pudo abrir el libro ({e}), usando {ScraperBase.DEFAULT_EXCEL_ENGINE}")
+            file.seek(0)
+            return pd.ExcelFile(file, engine=ScraperBase.DEFAULT_EXCEL_ENGINE)
+    
+    @staticmethod
+    def resolve_dtype_backend(dtype_backend: Optional[str] = None) -> Optional[str]:
+        """
+        Determina los tipos con que se extraen las hojas, cayendo a los originales si pyarrow no está instalado.
+        
+        Args:
+            dtype_backend (Optional[str]): "pyarrow" o None. Si es None, usa ScraperBase.DTYPE_BACKEND.
+            
+        Returns:
+            Optional[str]: "pyarrow" o None (columnas object)
+        """
+        dtype_backend = dtype_backend or ScraperBase.DTYPE_BACKEND
+        if dtype_backend == "pyarrow" and pa is None:
+            logger.info("pyarrow no está instalado, se extrae con los tipos originales")
+            return None
+        return dtype_backend
+    
+    @staticmethod
+    def parse_sheet(excel_data: pd.ExcelFile, sheet_name: str, dtype_backend: Optional[str] = None,
+                    **kwargs) -> pd.DataFrame:
+        """
+        Lee una hoja con los tipos indicados. Con "pyarrow" las columnas mixtas quedan como texto
+        Arrow y las columnas vacías (tipo null) se pasan a texto, para que los transformadores
+        puedan limpiarlas como al resto.
+        """
+        if dtype_backend is None:
+            return excel_data.parse(sheet_name=sheet_name, **kwargs)
+        
+        df = excel_data.parse(sheet_name=sheet_name, dtype_backend=dtype_backend, **kwargs)
+        for position, dtype in enumerate(df.dtypes):
+            if isinstance(dtype, pd.ArrowDtype) and pa.types.is_null(dtype.pyarrow_dtype):
+                df.isetitem(position, df.iloc[:, position].astype(pd.ArrowDtype(pa.string())))
+        return df
+    
+    @staticmethod
+    def read_sheet(excel_data: pd.ExcelFile, sheet_name: str, spec: Optional[SheetReadSpec] = None,
+                   dtype_backend: Optional[str] = None) -> pd.DataFrame:
+        """
+        Lee una hoja completa o, si hay especificación, solo sus columnas y la ventana de filas entre anclas.
+        
+        Args:
+            excel_data (pd.ExcelFile): Libro abierto
+            sheet_name (str): Nombre real de la hoja
+            spec (Optional[SheetReadSpec]): Especificación de lectura parcial
+            dtype_backend (Optional[str]): "pyarrow" para columnas Arrow, None para columnas object
+            
+        Returns:
+            pd.DataFrame: Hoja leída. Si las anclas no aparecen, se lee completa para que el
+                          transformador decida (con un aviso en el log).
+        """
+        if spec is None:
+            return ScraperUtils.parse_sheet(excel_data, sheet_name, dtype_backend)
+        
+        # Las anclas obligan a recorrer su columna, así que las filas se acotan sobre el
+        # DataFrame estrecho (solo usecols) en lugar de materializar la hoja completa
+        usecols = spec.read_columns()
+        try:
+            df = ScraperUtils.parse_sheet(excel_data, sheet_name, dtype_backend, usecols=usecols)
+            return spec.cut(df, usecols if usecols is not None else range(df.shape[1]))
+        except ValueError as e:
+            logger.warning(f"Lectura parcial de '{sheet_name}' no aplicable ({e}), se lee la hoja completa")
+            return ScraperUtils.parse_sheet(excel_data, sheet_name, dtype_backend)
+    
+    @staticmethod
+    def extract_sheets_from_excel(file: BinaryIO, date: str, sheets_to_extract: Optional[List[str]] = None,
+                                  engine: Optional[str] = None,
+                                  read_specs: Optional[Dict[str, SheetReadSpec]] = None,
+                                  dtype_backend: Optional[str] = None,
+                                  raise_errors: bool = False) -> Dict[str, pd.DataFrame]:
+        """
+        Extrae hojas específicas de un archivo Excel y las convierte en DataFrames.
+        
+        Args:
+            file (BinaryIO): Archivo Excel (BytesIO, MemoryViewReader o temporal)
+            date (str): Fecha del archivo en formato 'DD-MM-YYYY'
+            sheets_to_extract (Optional[List[str]]): Lista de nombres de hojas a extraer. 
+                                                   Si es None, extrae todas las hojas.
+            engine (Optional[str]): Motor de lectura ("calamine" u "openpyxl").
+                                    Si es None, usa ScraperBase.EXCEL_ENGINE.
+            read_specs (Optional[Dict[str, SheetReadSpec]]): Lectura parcial por hoja solicitada.
+                                                             Las hojas sin especificación se leen completas.
+            dtype_backend (Optional[str]): "pyarrow" para extraer columnas Arrow (incluida 'Fecha').
+                                           Si es None, usa ScraperBase.DTYPE_BACKEND.
+            raise_errors (bool): Si es True, un libro que no se puede abrir lanza la excepción en lugar
+                                 de devolver un diccionario vacío (que no se distingue de un libro sin hojas).
+            
+        Returns:
+            Dict[str, pd.DataFrame]: Diccionario con DataFrames de cada hoja
+            
+        Raises:
+            Exception: Si raise_errors es True y el libro no se pudo procesar
+            
+        Example:
+            >>> with open('file.xlsx', 'rb') as f:
+            ...     file_content = BytesIO(f.read())
+            ...     sheets = extract_sheets_from_excel(file_content, '03-01-2025', ['BB_ResumenGeneralMercado'])
+            >>> print(f"Se extrajeron {len(sheets)} hojas")
+        """
+        sheets_data = {}
+        dtype_backend = ScraperUtils.resolve_dtype_backend(dtype_backend)
+        
+        excel_data = None
+        try:
+            # El libro se abre una sola vez: el zip, sharedStrings y estilos se parsean
+            # una vez y todas las hojas se leen desde este mismo handle
+            excel_data = ScraperUtils.open_excel_file(file, engine)
+            available_sheets = excel_data.sheet_names
+            
+            # Si no se especifica lista, extraer todas las hojas
+            if sheets_to_extract is None:
+                sheets_to_process = available_sheets
+                sheet_mapping = {sheet: sheet for sheet in available_sheets}
+            else:
+                # Crear mapeo entre nombres solicitados y nombres reales de hojas
+                sheet_mapping = {}
+                sheets_to_process = []
+                
+                for requested_sheet in sheets_to_extract:
+                    # Buscar la hoja exacta primero
+                    if requested_sheet in available_sheets:
+                        sheets_to_process.append(requested_sheet)
+                        sheet_mapping[requested_sheet] = requested_sheet
+                        logger.info(f"Encontrada hoja exacta: '{requested_sheet}'")
+                    else:
+                        # Si no se encuentra, intentar sin prefijo BB_
+                        actual_sheet_name = requested_sheet.replace("BB_", "")
+                        if actual_sheet_name in available_sheets:
+                            sheets_to_process.append(actual_sheet_name)
+                            sheet_mapping[actual_sheet_name] = requested_sheet
+                            logger.info(f"Mapeando '{actual_sheet_name}' -> '{requested_sheet}'")
+                        else:
+                            logger.warning(f"Hoja '{requested_sheet}' no encontrada en el archivo")
+                
+                logger.info(f"Filtrando hojas: {sheets_to_process} de {available_sheets}")
+            
+            logger.info(f"Procesando archivo con {len(sheets_to_process)} hojas de {len(available_sheets)} disponibles")
+            
+            for sheet_name in sheets_to_process:
+                try:
+                    spec = read_specs.get(sheet_mapping[sheet_name]) if read_specs else None
+                    df = ScraperUtils.read_sheet(excel_data, sheet_name, spec, dtype_backend)
+                    if not df.empty:
+                        # Agregar columna de fecha
+                        if dtype_backend == "pyarrow":
+                            df['Fecha'] = pd.Series(date, index=df.index, dtype=pd.ArrowDtype(pa.string()))
+                        else:
+                            df['Fecha'] = date
+                        # Usar el nombre mapeado
+                        output_key = sheet_mapping[sheet_name]
+                        sheets_data[f"{output_key}_{date}"] = df
+                        logger.info(f"Hoja '{sheet_name}' procesada: {df.shape}")
+                    else:
+                        logger.warning(f"Hoja '{sheet_name}' está vacía")
+                except Exception as e:
+                    logger.error(f"Error procesando hoja '{sheet_name}': {e}")
+                    continue
+            
+            logger.info(f"Archivo procesado exitosamente: {len(sheets_data)} hojas extraídas")
+            return sheets_data
+            
+        except Exception as e:
+            logger.error(f"Error procesando archivo Excel para {date}: {e}")
+            if raise_errors:
+                raise
+            return {}
+        finally:
+            if excel_data is not None:
+                excel_data.close()
+
+
+def parse_workbook_bytes(content: bytes, date: str, sheets_to_extract: Optional[List[str]] = None,
+                         engine: Optional[str] = None,
+                         read_specs: Optional[Dict[str, SheetReadSpec]] = None,
+                         dtype_backend: Optional[str] = None, raise_errors: bool = False) -> Dict[str, pd.DataFrame]:
+    """
+    Extrae las hojas de un libro a partir de sus bytes crudos.
+    Es una función de módulo para que el pool de procesos de BVRDScraper pueda enviarla
+    a otro proceso (los métodos de una instancia con sesiones HTTP no son serializables).
+    
+    Args:
+        content (bytes): Contenido del archivo Excel
+        date (str): Fecha en formato 'DD-MM-YYYY'
+        sheets_to_extract (Optional[List[str]]): Lista de nombres de hojas a extraer.
+                                               Si es None, extrae todas las hojas.
+        engine (Optional[str]): Motor de lectura de Excel
+        read_specs (Optional[Dict[str, SheetReadSpec]]): Lectura parcial por hoja
+        dtype_backend (Optional[str]): "pyarrow" para columnas Arrow, None para columnas object
+        raise_errors (bool): Lanzar la excepción si el libro no se puede abrir
+        
+    Returns:
+        Dict[str, pd.DataFrame]: DataFrames "{hoja}_{fecha}" del libro
+    """
+    return ScraperUtils.extract_sheets_from_excel(BytesIO(content), date, sheets_to_extract, engine, read_specs,
+                                                  dtype_backend, raise_errors)
+
+
+class BVRDScraper:
+    """Clase principal que ejecuta el scraping."""
+    
+    def __init__(self, max_workers: Optional[int] = None, requests_per_second: Optional[float] = None,
+                 pool_size: Optional[int] = None, use_cache: Optional[bool] = None, offline: bool = False,
+                 calendar: Optional[TradingCalendar] = None, excel_engine: Optional[str] = None,
+                 parse_workers: Optional[int] = None, parse_queue_size: Optional[int] = None,
+                 read_specs: Optional[Dict[str, SheetReadSpec]] = None, dtype_backend: Optional[str] = None):
+        """
+        Args:
+            max_workers (Optional[int]): Número de descargas simultáneas. 1 = modo secuencial.
+                                         Si es None, usa ScraperBase.MAX_WORKERS.
+            requests_per_second (Optional[float]): Límite global de peticiones por segundo.
+                                                   Si es None, usa ScraperBase.REQUESTS_PER_SECOND.
+            pool_size (Optional[int]): Conexiones keep-alive del pool HTTP.
+                                       Si es None, usa ScraperBase.HTTP_POOL_SIZE.
+            use_cache (Optional[bool]): Usar la caché local de boletines.
+                                        Si es None, usa ScraperBase.CACHE_ENABLED.
+            offline (bool): Leer solo de la caché, sin acceder a la red (implica use_cache).
+            calendar (Optional[TradingCalendar]): Calendario bursátil a consultar antes de cada petición.
+                                                  Si es None, se crea uno según ScraperBase.USE_TRADING_CALENDAR.
+            excel_engine (Optional[str]): Motor de lectura de Excel. Si es None, usa ScraperBase.EXCEL_ENGINE.
+            parse_workers (Optional[int]): Procesos que parsean los libros descargados. 0 = parsear en los
+                                           hilos de descarga. Si es None, usa ScraperBase.PARSE_WORKERS.
+            parse_queue_size (Optional[int]): Libros descargados que pueden esperar parseo a la vez.
+                                              Si es None, usa ScraperBase.PARSE_QUEUE_SIZE.
+            read_specs (Optional[Dict[str, SheetReadSpec]]): Lectura parcial por hoja (columnas y filas
+                                                             entre anclas). Las hojas sin especificación se leen completas.
+            dtype_backend (Optional[str]): "pyarrow" para extraer columnas Arrow que se conservan hasta la carga.
+                                           Si es None, usa ScraperBase.DTYPE_BACKEND.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.max_workers = max(1, max_workers or ScraperBase.MAX_WORKERS)
+        self.rate_limiter = TokenBucket(
+            requests_per_second if requests_per_second is not None else ScraperBase.REQUESTS_PER_SECOND,
+            ScraperBase.RATE_LIMIT_BURST
+        )
+        self.http = HttpSessionPool(pool_size)
+        self.retry_policy = RetryPolicy()
+        self.circuit_breaker = CircuitBreaker()
+        
+        if offline or (ScraperBase.CACHE_ENABLED if use_cache is None else use_cache):
+            self.cache = BulletinCache(ScraperBase.CACHE_DIR, ScraperBase.CACHE_MAX_BYTES, offline=offline)
+        else:
+            self.cache = None
+        
+        if calendar is None and ScraperBase.USE_TRADING_CALENDAR:
+            calendar = TradingCalendar(ScraperBase.NO_BULLETIN_FILE, ScraperBase.EXTRA_HOLIDAYS)
+        self.calendar = calendar
+        self.excel_engine = excel_engine
+        self.parse_workers = max(0, ScraperBase.PARSE_WORKERS if parse_workers is None else parse_workers)
+        self.parse_queue_size = max(1, parse_queue_size or ScraperBase.PARSE_QUEUE_SIZE)
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self.read_specs = read_specs
+        self.dtype_backend = dtype_backend
+    
+    def close(self) -> None:
+        """
+        Libera las conexiones HTTP y el pool de procesos de parseo del scraper,
+        y guarda los accesos pendientes del índice de la caché.
+        """
+        self.http.close()
+        if self.cache is not None:
+            self.cache.close()
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=True, cancel_futures=True)
+            self._parse_pool = None
+    
+    def __enter__(self) -> "BVRDScraper":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def scrape_single_date(self, date_str: str, sheets_to_extract: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Descarga y procesa un archivo Excel para una fecha específica.
+        
+        Args:
+            date_str (str): Fecha en formato 'DD-MM-YYYY'
+            sheets_to_extract (Optional[List[str]]): Lista de nombres de hojas a extraer.
+                                                   Si es None, extrae todas las hojas.
+            
+        Returns:
+            Dict[str, pd.DataFrame]: DataFrames extraídos o diccionario vacío si falla
+            
+        Example:
+            >>> scraper = BVRDScraper()
+            >>> data = scraper.scrape_single_date('03-01-2025', ['ResumenGeneralMercado'])
+            >>> if data:
+            ...     print(f"Se extrajeron {len(data)} datasets")
+        """
+        return self._scrape_workbook(date_str, sheets_to_extract) or {}
+    
+    def _scrape_workbook(self, date_str: str,
+                         sheets_to_extract: Optional[List[str]]) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Como scrape_single_date, pero distingue un día sin boletín (diccionario vacío)
+        de una descarga o un parseo fallidos (None).
+        """
+        try:
+            file_content = self.download_single_date(date_str, raise_not_found=True)
+        except BulletinNotFoundError:
+            return {}
+        if file_content is None:
+            return None
+        
+        try:
+            return ScraperUtils.extract_sheets_from_excel(file_content, date_str, sheets_to_extract,
+                                                          self.excel_engine, self.read_specs, self.dtype_backend,
+                                                          raise_errors=True)
+        except Exception:
+            return None
+    
+    def download_single_date(self, date_str: str, raise_not_found: bool = False) -> Optional[BinaryIO]:
+        """
+        Descarga (o lee de la caché) el libro de una fecha sin parsearlo.
+        Respeta el límite de peticiones y registra en el calendario las fechas sin boletín.
+        
+        Args:
+            date_str (str): Fecha en formato 'DD-MM-YYYY'
+            raise_not_found (bool): Si es True, un día sin boletín lanza BulletinNotFoundError
+                                    en lugar de devolver None como una descarga fallida.
+            
+        Returns:
+            Optional[BinaryIO]: Contenido del archivo o None si no se pudo obtener
+            
+        Raises:
+            BulletinNotFoundError: Si raise_not_found es True y no hay boletín para la fecha
+        """
+        url = ScraperUtils.build_file_url(date_str)
+        if self.cache is None or not self.cache.offline:
+            self.rate_limiter.acquire()
+        try:
+            file_content = ScraperUtils.download_excel_file(
+                url, self.http, self.cache, raise_not_found=True,
+                retry_policy=self.retry_policy, circuit_breaker=self.circuit_breaker
+            )
+        except BulletinNotFoundError:
+            self.logger.info(f"No hay boletín para {date_str}")
+            if self.calendar is not None:
+                self.calendar.mark_no_bulletin(date_str)
+            if raise_not_found:
+                raise
+            return None
+        
+        if file_content is None:
+            self.logger.warning(f"No se pudo descargar archivo para {date_str}")
+        return file_content
+    
+    def _download_bytes(self, date_str: str) -> Optional[bytes]:
+        """
+        Descarga el libro de una fecha y devuelve sus bytes, listos para enviarse al pool de procesos.
+        Devuelve None si la descarga falló y lanza BulletinNotFoundError si no hay boletín.
+        """
+        self.logger.info(f"Descargando fecha: {date_str}")
+        file_content = self.download_single_date(date_str, raise_not_found=True)
+        if file_content is None:
+            return None
+        try:
+            file_content.seek(0)
+            return file_content.read()
+        finally:
+            file_content.close()
+    
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """
+        Pool de procesos de parseo, creado la primera vez que se usa y reutilizado entre rangos.
+        """
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+        return self._parse_pool
+    
+    def scrape_iter(self, start_date: str, end_date: str, sheets_to_extract: Optional[List[str]] = None,
+                    max_workers: Optional[int] = None) -> Iterator[Tuple[str, str, pd.DataFrame]]:
+        """
+        Descarga y procesa archivos Excel para un rango de fechas, entregando cada hoja
+        en cuanto se procesa su libro.
+        Las fechas se descargan en paralelo (limitadas por el token bucket global) y se
+        entregan en orden de fecha. Como mucho se mantienen 2 * max_workers libros en vuelo,
+        así la memoria no crece con el tamaño del rango.
+        
+        Args:
+            start_date (str): Fecha de inicio en formato 'YYYY-MM-DD'
+            end_date (str): Fecha de fin en formato 'YYYY-MM-DD'
+            sheets_to_extract (Optional[List[str]]): Lista de nombres de hojas a extraer.
+                                                   Si es None, extrae todas las hojas.
+            max_workers (Optional[int]): Descargas simultáneas para esta ejecución.
+                                         Si es None, usa el valor del scraper.
+            
+        Yields:
+            Tuple[str, str, pd.DataFrame]: (fecha 'DD-MM-YYYY', nombre de hoja, DataFrame)
+            
+        Raises:
+            ValueError: Si el rango de fechas es inválido
+            
+        Example:
+            >>> scraper = BVRDScraper()
+            >>> for fecha, hoja, df in scraper.scrape_iter('2025-01-01', '2025-01-03', ['BB_ResumenGeneralMercado']):
+            ...     print(fecha, hoja, df.shape)
+        """
+        # Validar rango de fechas
+        ScraperUtils.validate_date_range(start_date, end_date)
+        
+        self.logger.info(f"Iniciando scraping para rango: {start_date} → {end_date}")
+        
+        date_range = ScraperUtils.create_date_range(start_date, end_date)
+        
+        for date_str, date_data in self.iter_workbooks(date_range, sheets_to_extract, max_workers):
+            if date_data is None:
+                continue
+            suffix = f"_{date_str}"
+            for key, df in date_data.items():
+                yield date_str, key[:-len(suffix)], df
+    
+    def iter_workbooks(self, date_range: List[str], sheets_to_extract: Optional[List[str]] = None,
+                       max_workers: Optional[int] = None) -> Iterator[Tuple[str, Optional[Dict[str, pd.DataFrame]]]]:
+        """
+        Procesa una lista explícita de fechas y entrega las hojas de cada libro juntas, en orden de fecha.
+        No aplica el límite de 365 días: es la base de scrape_iter y de los backfills por bloques.
+        
+        Args:
+            date_range (List[str]): Fechas en formato 'DD-MM-YYYY'
+            sheets_to_extract (Optional[List[str]]): Lista de nombres de hojas a extraer.
+                                                   Si es None, extrae todas las hojas.
+            max_workers (Optional[int]): Descargas simultáneas. Si es None, usa el valor del scraper.
+            
+        Yields:
+            Tuple[str, Optional[Dict[str, pd.DataFrame]]]: (fecha, DataFrames "{hoja}_{fecha}" del libro).
+                El diccionario está vacío si no hay boletín para la fecha y es None si la descarga o
+                el parseo fallaron, para que quien consume no dé por procesada una fecha que hay que reintentar.
+                Las hojas que no se encontraron o no se pudieron leer faltan del diccionario.
+        
+        Si el scraper tiene parse_workers > 0, la descarga y el parseo se separan en etapas
+        (ver _iter_workbooks_pipeline); si no, cada hilo descarga y parsea su fecha.
+        """
+        if self.calendar is not None:
+            total_days = len(date_range)
+            date_range = self.calendar.trading_days(date_range)
+            self.logger.info(f"Calendario bursátil: {len(date_range)} de {total_days} fechas con boletín esperado")
+        
+        workers = min(max(1, max_workers or self.max_workers), len(date_range))
+        
+        if self.parse_workers > 0 and date_range:
+            yield from self._iter_workbooks_pipeline(date_range, sheets_to_extract, workers)
+            return
+        
+        def process_date(date_str: str) -> Optional[Dict[str, pd.DataFrame]]:
+            self.logger.info(f"Procesando fecha: {date_str}")
+            return self._scrape_workbook(date_str, sheets_to_extract)
+        
+        if workers <= 1:
+            for date_str in date_range:
+                yield date_str, process_date(date_str)
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bvrd-download")
+        pending = deque()
+        try:
+            for date_str in date_range:
+                pending.append((date_str, executor.submit(process_date, date_str)))
+                # Ventana acotada: no adelantar más de 2 * workers libros sin consumir
+                if len(pending) >= 2 * workers:
+                    done_date, future = pending.popleft()
+                    yield done_date, future.result()
+            while pending:
+                done_date, future = pending.popleft()
+                yield done_date, future.result()
+        finally:
+            # Si el consumidor abandona el generador, no seguir descargando
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _iter_workbooks_pipeline(self, date_range: List[str], sheets_to_extract: Optional[List[str]],
+                                 workers: int) -> Iterator[Tuple[str, Optional[Dict[str, pd.DataFrame]]]]:
+        """
+        Pipeline productor/consumidor: los hilos de descarga (E/S de red) alimentan una cola
+        acotada de libros crudos y el pool de procesos los parsea (CPU) fuera del GIL.
+        
+        Cada etapa tiene su propio tamaño: workers descargas simultáneas con una ventana de
+        2 * workers libros adelantados, y como mucho parse_queue_size libros esperando parseo.
+        Mientras el consumidor procesa un libro, las dos etapas siguen trabajando en segundo plano.
+        Los libros se entregan en orden de fecha.
+        """
+        downloader = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bvrd-download")
+        parse_pool = self._get_parse_pool()
+        dates = iter(date_range)
+        downloads = deque()  # (fecha, Future[Optional[bytes]])
+        parsing = deque()    # (fecha, Future[Dict[str, pd.DataFrame]] o resultado sin parseo: {} o None)
+        
+        def fill_downloads() -> None:
+            for date_str in dates:
+                downloads.append((date_str, downloader.submit(self._download_bytes, date_str)))
+                if len(downloads) >= 2 * workers:
+                    return
+        
+        def next_parsed() -> Tuple[str, Optional[Dict[str, pd.DataFrame]]]:
+            date_str, parsed = parsing.popleft()
+            if not isinstance(parsed, Future):
+                return date_str, parsed
+            try:
+                return date_str, parsed.result()
+            except Exception as e:
+                self.logger.error(f"Error parseando el libro de {date_str}: {e}")
+                return date_str, None
+        
+        try:
+            fill_downloads()
+            while downloads:
+                date_str, download = downloads.popleft()
+                try:
+                    content = download.result()
+                except BulletinNotFoundError:
+                    parsed = {}
+                else:
+                    parsed = None
+                    if content is not None:
+                        parsed = parse_pool.submit(parse_workbook_bytes, content, date_str, sheets_to_extract,
+                                                   self.excel_engine, self.read_specs, self.dtype_backend, True)
+                fill_downloads()
+                parsing.append((date_str, parsed))
+                
+                # Cola acotada: con la etapa de parseo llena, entregar antes de aceptar otro libro
+                while len(parsing) >= self.parse_queue_size:
+                    yield next_parsed()
+            while parsing:
+                yield next_parsed()
+        finally:
+            # Si el consumidor abandona el generador, no seguir descargando ni parseando
+            for _, parsed in parsing:
+                if isinstance(parsed, Future):
+                    parsed.cancel()
+            downloader.shutdown(wait=True, cancel_futures=True)
+    
+    def scrape_date_range(self, start_date: str, end_date: str, sheets_to_extract: Optional[List[str]] = None,
+                          max_workers: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Descarga y procesa archivos Excel para un rango de fechas.
+        Envoltorio de scrape_iter que acumula todos los DataFrames en un diccionario.
+        
+        Args:
+            start_date (str): Fecha de inicio en formato 'YYYY-MM-DD'
+            end_date (str): Fecha de fin en formato 'YYYY-MM-DD'
+            sheets_to_extract (Optional[List[str]]): Lista de nombres de hojas a extraer.
+                                                   Si es None, extrae todas las hojas.
+            max_workers (Optional[int]): Descargas simultáneas para esta ejecución.
+                                         Si es None, usa el valor del scraper.
+            
+        Returns:
+            Dict[str, pd.DataFrame]: Todos los DataFrames extraídos del rango, en orden de fecha
+            
+        Raises:
+            ValueError: Si el rango de fechas es inválido
+            
+        Example:
+            >>> scraper = BVRDScraper()
+            >>> all_data = scraper.scrape_date_range('2025-01-01', '2025-01-03', ['ResumenGeneralMercado'])
+            >>> print(f"Total de datasets extraídos: {len(all_data)}")
+        """
+        all_data = {
+            f"{sheet_name}_{date_str}": df
+            for date_str, sheet_name, df in self.scrape_iter(start_date, end_date, sheets_to_extract, max_workers)
+        }
+        
+        self.logger.info(f"Scraping completado: {len(all_data)} datasets extraídos")
+        return all_data
+
+
+# ===============================================
+# FUNCIÓN DE COMPATIBILIDAD (para mantener interfaz existente)
+# ===============================================
+
+def main(start_date: str, end_date: str, sheets_to_extract: Optional[List[str]] = None,
+         max_workers: Optional[int] = None, offline: bool = False,
+         excel_engine: Optional[str] = None, parse_workers: Optional[int] = None,
+         dtype_backend: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Función principal para mantener compatibilidad con código existente.
+    
+    Args:
+        start_date (str): Fecha de inicio en formato 'YYYY-MM-DD'
+        end_date (str): Fecha de fin en formato 'YYYY-MM-DD'
+        sheets_to_extract (Optional[List[str]]): Lista de nombres de hojas a extraer.
+                                               Si es None, extrae todas las hojas.
+        max_workers (Optional[int]): Descargas simultáneas. Si es None, usa ScraperBase.MAX_WORKERS.
+        offline (bool): Reprocesar solo desde la caché local, sin acceder a la red.
+        excel_engine (Optional[str]): Motor de lectura de Excel ("calamine" u "openpyxl").
+        parse_workers (Optional[int]): Procesos de parseo. Si es None, usa ScraperBase.PARSE_WORKERS.
+        dtype_backend (Optional[str]): "pyarrow" para columnas Arrow. Si es None, usa ScraperBase.DTYPE_BACKEND.
+        
+    Returns:
+        Dict[str, pd.DataFrame]: Todos los DataFrames extraídos
+        
+    Example:
+        >>> data = main('2025-01-01', '2025-01-03', ['ResumenGeneralMercado'])
+        >>> for key, df in data.items():
+        ...     print(f"{key}: {df.shape}")
+    """
+    with BVRDScraper(max_workers=max_workers, offline=offline, excel_engine=excel_engine,
+                     parse_workers=parse_workers, dtype_backend=dtype_backend) as scraper:
+        return scraper.scrape_date_range(start_date, end_date, sheets_to_extract)
+
+
+# ===============================================
+# CÓDIGO DE EJECUCIÓN
+# ===============================================
+
+if __name__ == "__main__":
+    # Configurar logging para ejecución directa
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    # Ejemplo de uso
+    start_date = "2025-01-03"
+    end_date = date.today().strftime('%Y-%m-%d')
+    
+    try:
+        logger.info("Iniciando scraping de BVRD")
+        data = main(start_date, end_date)
+        
+        # Mostrar resumen de resultados
+        logger.info("=" * 50)
+        logger.info("RESUMEN DE EXTRACCIÓN")
+        logger.info("=" * 50)
+        
+        for key, df in data.items():
+            logger.info(f"{key}: {df.shape}")
+        
+        logger.info(f"Total de datasets extraídos: {len(data)}")
+        
+    except ValueError as e:
+        logger.error(f"Error de validación: {e}")
+    except Exception as e:
+        logger.error(f"Error inesperado: {e}")
+        import traceback
+        traceback.print_exc()
+
+
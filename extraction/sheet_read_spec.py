@@ -0,0 +1,217 @@
+"""
+Especificaciones de lectura parcial de hojas.
+Describen qué columnas y qué ventana de filas (delimitada por anclas de texto) necesita
+cada transformador, para que la extracción solo materialice esas celdas.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Marca en DataFrame.attrs de las hojas ya recortadas según su especificación
+PARTIAL_READ_ATTR = "partial_read"
+
+# Ancla de sección: texto (primera coincidencia) o (texto, n-ésima coincidencia)
+Anchor = Union[str, Tuple[str, int]]
+
+
+class SectionLocator:
+    """
+    Localizador de secciones de una hoja a partir de anclas de texto en una columna.
+
+    La columna se normaliza una sola vez (minúsculas, sin espacios en los extremos) y todas
+    las anclas pedidas se buscan juntas: cada ancla se compara solo con los valores distintos
+    de la columna y las coincidencias se reparten a las filas en una única pasada. Las
+    posiciones encontradas quedan en caché, así que recortar varios bloques de la misma hoja
+    no vuelve a recorrerla. La coincidencia es parcial y literal (sin expresiones regulares).
+
+    Example:
+        >>> locator = SectionLocator(df.iloc[:, 0])
+        >>> locator.sections([(("Participante", 1), ("Total", 1)), (("Participante", 2), ("Total", 2))])
+        [(5, 17), (21, 33)]
+    """
+
+    def __init__(self, values: pd.Series):
+        """
+        Args:
+            values (pd.Series): Columna donde se buscan las anclas
+        """
+        normalized = values.astype(str).str.lower().str.strip()
+        self._codes, uniques = pd.factorize(normalized)
+        self._uniques = [str(value) for value in uniques]
+        self._positions: Dict[str, np.ndarray] = {}
+
+    @staticmethod
+    def _split(anchor: Anchor) -> Tuple[str, int]:
+        return (anchor, 1) if isinstance(anchor, str) else (anchor[0], anchor[1])
+
+    def matches(self, texts: Sequence[str]) -> Dict[str, np.ndarray]:
+        """
+        Posiciones (ordenadas) de las filas que contienen cada texto, buscando todos a la vez.
+
+        Args:
+            texts (Sequence[str]): Textos a buscar
+
+        Returns:
+            Dict[str, np.ndarray]: Texto pedido -> posiciones de fila
+        """
+        keys = {text: text.lower() for text in texts}
+        missing = [key for key in dict.fromkeys(keys.values()) if key not in self._positions]
+        if missing:
+            # Coincidencias sobre los valores distintos; la fila extra (sin coincidencias) es la de los nulos (código -1)
+            hits = np.zeros((len(self._uniques) + 1, len(missing)), dtype=bool)
+            for i, value in enumerate(self._uniques):
+                hits[i] = [key in value for key in missing]
+            rows, which = np.nonzero(hits[self._codes])
+            for k, key in enumerate(missing):
+                self._positions[key] = rows[which == k]
+        return {text: self._positions[key] for text, key in keys.items()}
+
+    def locate(self, anchors: Sequence[Anchor]) -> List[int]:
+        """
+        Posición de la n-ésima coincidencia de cada ancla, buscadas en una sola pasada.
+
+        Args:
+            anchors (Sequence[Anchor]): Anclas como texto o (texto, n-ésima coincidencia)
+
+        Returns:
+            List[int]: Posición de fila de cada ancla, en el mismo orden
+
+        Raises:
+            ValueError: Si no se encuentra la coincidencia requerida de alguna ancla
+        """
+        anchors = [self._split(anchor) for anchor in anchors]
+        found = self.matches([text for text, _ in anchors])
+        result = []
+        for text, occurrence in anchors:
+            positions = found[text]
+            if len(positions) < occurrence:
+                raise ValueError(f"No se encontró la {occurrence}-ésima coincidencia para '{text}'")
+            result.append(int(positions[occurrence - 1]))
+        return result
+
+    def sections(self, bounds: Sequence[Tuple[Anchor, Optional[Anchor]]],
+                 skip_rows_after_start: int = 0) -> List[Tuple[int, Optional[int]]]:
+        """
+        Ventanas de filas [inicio, fin) de varios bloques, resolviendo todas sus anclas juntas.
+        Las filas de las anclas quedan fuera de cada ventana.
+
+        Args:
+            bounds (Sequence[Tuple[Anchor, Optional[Anchor]]]): (ancla inicial, ancla final o None = hasta el final)
+            skip_rows_after_start (int): Filas adicionales a descartar tras cada ancla inicial
+
+        Returns:
+            List[Tuple[int, Optional[int]]]: Posiciones de inicio y fin de cada bloque
+        """
+        anchors = [anchor for start, end in bounds for anchor in (start, end) if anchor is not None]
+        rows = iter(self.locate(anchors))
+        windows = []
+        for start, end in bounds:
+            first = next(rows) + 1 + skip_rows_after_start if start is not None else 0
+            last = next(rows) if end is not None else None
+            windows.append((first, last))
+        return windows
+
+
+class SheetReadSpec:
+    """
+    Lectura parcial de una hoja: subconjunto de columnas y ventana de filas entre dos anclas.
+
+    Las anclas se buscan en anchor_column con SectionLocator (coincidencia parcial, sin
+    distinguir mayúsculas ni espacios en los extremos) y se usa la n-ésima coincidencia de
+    cada una. Las filas de las anclas quedan fuera de la ventana.
+
+    Las posiciones de columna son las de la hoja original. La columna 'Fecha' que agrega la
+    extracción siempre se conserva al final.
+
+    Example:
+        >>> spec = SheetReadSpec(columns=[0, 1, 2, 3], start_anchor="Participante",
+        ...                      end_anchor="Total", start_occurrence=2)
+    """
+
+    def __init__(self, columns: Optional[List[int]] = None, start_anchor: Optional[str] = None,
+                 end_anchor: Optional[str] = None, start_occurrence: int = 1, end_occurrence: int = 1,
+                 anchor_column: int = 0, skip_rows_after_start: int = 0):
+        """
+        Args:
+            columns (Optional[List[int]]): Posiciones de las columnas a conservar, en orden.
+                                           Si es None, se conservan todas.
+            start_anchor (Optional[str]): Texto que marca la fila anterior al inicio de la ventana
+            end_anchor (Optional[str]): Texto que marca la fila posterior al fin de la ventana
+            start_occurrence (int): Coincidencia de start_anchor a usar (1 = la primera)
+            end_occurrence (int): Coincidencia de end_anchor a usar (1 = la primera)
+            anchor_column (int): Posición de la columna donde se buscan las anclas
+            skip_rows_after_start (int): Filas adicionales a descartar tras el ancla inicial (p. ej. encabezados)
+        """
+        self.columns = list(columns) if columns is not None else None
+        self.start_anchor = start_anchor
+        self.end_anchor = end_anchor
+        self.start_occurrence = start_occurrence
+        self.end_occurrence = end_occurrence
+        self.anchor_column = anchor_column
+        self.skip_rows_after_start = skip_rows_after_start
+
+    def read_columns(self) -> Optional[List[int]]:
+        """
+        Columnas que hay que leer de la hoja (las conservadas más la de anclas), para usecols.
+        """
+        if self.columns is None:
+            return None
+        return sorted(set(self.columns) | {self.anchor_column})
+
+    def row_window(self, anchor_values: pd.Series) -> Tuple[int, Optional[int]]:
+        """
+        Ventana de filas [inicio, fin) según las anclas.
+
+        Args:
+            anchor_values (pd.Series): Valores de la columna de anclas
+
+        Returns:
+            Tuple[int, Optional[int]]: Posiciones de inicio y fin (None = hasta el final)
+
+        Raises:
+            ValueError: Si no se encuentra la coincidencia requerida de alguna ancla
+        """
+        start = (self.start_anchor, self.start_occurrence) if self.start_anchor else None
+        end = (self.end_anchor, self.end_occurrence) if self.end_anchor else None
+        if start is None and end is None:
+            return 0, None
+        return SectionLocator(anchor_values).sections([(start, end)], self.skip_rows_after_start)[0]
+
+    def cut(self, df: pd.DataFrame, positions: Sequence[Optional[int]]) -> pd.DataFrame:
+        """
+        Recorta un DataFrame según la especificación.
+
+        Args:
+            df (pd.DataFrame): Hoja leída (completa o solo con read_columns())
+            positions (Sequence[Optional[int]]): Posición en la hoja original de cada columna de df;
+                                                 None para columnas agregadas por la extracción ('Fecha')
+
+        Returns:
+            pd.DataFrame: Filas de la ventana con las columnas de la especificación y las agregadas al final
+        """
+        location = {position: i for i, position in enumerate(positions) if position is not None}
+        start, end = self.row_window(df.iloc[:, location[self.anchor_column]])
+
+        if self.columns is None:
+            keep = list(location.values())
+        else:
+            keep = [location[position] for position in self.columns]
+        keep += [i for i, position in enumerate(positions) if position is None]
+
+        result = df.iloc[start:end, keep].reset_index(drop=True)
+        result.attrs[PARTIAL_READ_ATTR] = True
+        return result
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Aplica la especificación a una hoja leída completa, como la devuelve la extracción sin
+        especificación. Si la hoja ya viene recortada, se devuelve sin cambios.
+        """
+        if df.attrs.get(PARTIAL_READ_ATTR):
+            return df
+        positions: List[Optional[int]] = list(range(df.shape[1]))
+        if len(df.columns) and df.columns[-1] == 'Fecha':
+            positions[-1] = None
+        return self.cut(df, positions)
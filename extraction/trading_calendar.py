@@ -0,0 +1,197 @@
+"""
+Calendario bursátil de la BVRD.
+Determina qué fechas pueden tener boletín (días hábiles) para no pedir al servidor
+fines de semana, feriados ni fechas que ya sabemos que no tienen boletín.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+def _easter_sunday(year: int) -> date:
+    """
+    Domingo de Pascua (algoritmo anónimo gregoriano).
+    """
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _trasladar_feriado(fecha: date) -> date:
+    """
+    Aplica la Ley 139-97: los feriados que caen martes o miércoles se trasladan al lunes
+    anterior y los que caen jueves o viernes al lunes siguiente.
+    """
+    weekday = fecha.weekday()
+    if weekday in (1, 2):
+        return fecha - timedelta(days=weekday)
+    if weekday in (3, 4):
+        return fecha + timedelta(days=7 - weekday)
+    return fecha
+
+
+def dominican_holidays(year: int) -> Set[date]:
+    """
+    Feriados nacionales de República Dominicana para un año.
+
+    Args:
+        year (int): Año
+
+    Returns:
+        Set[date]: Fechas feriadas (ya trasladadas según la Ley 139-97)
+
+    Example:
+        >>> date(2025, 2, 27) in dominican_holidays(2025)
+        True
+    """
+    easter = _easter_sunday(year)
+    feriados = {
+        date(year, 1, 1),               # Año Nuevo
+        date(year, 1, 21),              # Nuestra Señora de la Altagracia
+        date(year, 2, 27),              # Día de la Independencia
+        easter - timedelta(days=2),     # Viernes Santo
+        easter + timedelta(days=60),    # Corpus Christi
+        date(year, 8, 16),              # Día de la Restauración
+        date(year, 9, 24),              # Nuestra Señora de las Mercedes
+        date(year, 12, 25),             # Navidad
+    }
+    # Feriados trasladables
+    feriados.update(_trasladar_feriado(date(year, month, day)) for month, day in [
+        (1, 6),                         # Día de los Santos Reyes
+        (1, 26),                        # Día de Duarte
+        (5, 1),                         # Día del Trabajo
+        (11, 6),                        # Día de la Constitución
+    ])
+    return feriados
+
+
+class TradingCalendar:
+    """
+    Calendario de días con boletín: excluye fines de semana, feriados y las fechas
+    aprendidas como "sin boletín" (404/HTML) en ejecuciones anteriores.
+
+    Las fechas sin boletín se guardan en un archivo JSON para que las siguientes
+    ejecuciones no vuelvan a pedirlas. Las fechas recientes (dentro de grace_days)
+    no se persisten porque el boletín puede publicarse con retraso.
+    """
+
+    def __init__(self, no_bulletin_file: Optional[str] = None, holidays: Optional[Iterable[date]] = None,
+                 grace_days: int = 7):
+        """
+        Args:
+            no_bulletin_file (Optional[str]): Archivo JSON con las fechas sin boletín.
+                                              Si es None, el aprendizaje solo dura la ejecución.
+            holidays (Optional[Iterable[date]]): Feriados adicionales a los nacionales
+                                                 (p. ej. cierres extraordinarios de la bolsa).
+            grace_days (int): Días recientes cuyo 404 no se persiste
+        """
+        self.no_bulletin_file = no_bulletin_file
+        self.extra_holidays = set(holidays or [])
+        self.grace_days = grace_days
+        self._holidays_by_year: Dict[int, Set[date]] = {}
+        self._lock = threading.Lock()
+        self._no_bulletin = self._load()
+        self._no_bulletin_recent: Set[date] = set()  # Solo en memoria
+
+    def _load(self) -> Set[date]:
+        """
+        Carga las fechas sin boletín desde disco.
+        """
+        if not self.no_bulletin_file:
+            return set()
+        try:
+            with open(self.no_bulletin_file, "r", encoding="utf-8") as f:
+                return {datetime.strptime(d, '%Y-%m-%d').date() for d in json.load(f)}
+        except FileNotFoundError:
+            return set()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Archivo de fechas sin boletín ilegible, se ignora: {e}")
+            return set()
+
+    def _save(self) -> None:
+        """
+        Escribe las fechas sin boletín de forma atómica. Debe llamarse con el lock tomado.
+        """
+        directory = os.path.dirname(os.path.abspath(self.no_bulletin_file))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(sorted(d.strftime('%Y-%m-%d') for d in self._no_bulletin), f, indent=0)
+        os.replace(tmp_path, self.no_bulletin_file)
+
+    @staticmethod
+    def _to_date(value) -> date:
+        """
+        Acepta date, datetime o string 'DD-MM-YYYY' (formato usado por el scraper).
+        """
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        return datetime.strptime(value, '%d-%m-%Y').date()
+
+    def is_holiday(self, value) -> bool:
+        """
+        Indica si la fecha es feriado nacional o feriado adicional configurado.
+        """
+        fecha = self._to_date(value)
+        if fecha.year not in self._holidays_by_year:
+            self._holidays_by_year[fecha.year] = dominican_holidays(fecha.year)
+        return fecha in self._holidays_by_year[fecha.year] or fecha in self.extra_holidays
+
+    def is_trading_day(self, value) -> bool:
+        """
+        Indica si se espera boletín para la fecha.
+
+        Args:
+            value: Fecha (date, datetime o 'DD-MM-YYYY')
+
+        Returns:
+            bool: False para fines de semana, feriados y fechas conocidas sin boletín
+        """
+        fecha = self._to_date(value)
+        if fecha.weekday() >= 5 or self.is_holiday(fecha):
+            return False
+        with self._lock:
+            return fecha not in self._no_bulletin and fecha not in self._no_bulletin_recent
+
+    def trading_days(self, dates: Iterable[str]) -> List[str]:
+        """
+        Filtra una lista de fechas 'DD-MM-YYYY' dejando solo los días con boletín esperado.
+        """
+        return [d for d in dates if self.is_trading_day(d)]
+
+    def mark_no_bulletin(self, value) -> None:
+        """
+        Registra que una fecha no tiene boletín (el servidor respondió 404/HTML).
+
+        Args:
+            value: Fecha (date, datetime o 'DD-MM-YYYY')
+        """
+        fecha = self._to_date(value)
+        persist = self.no_bulletin_file and fecha < date.today() - timedelta(days=self.grace_days)
+
+        with self._lock:
+            if persist:
+                if fecha in self._no_bulletin:
+                    return
+                self._no_bulletin.add(fecha)
+                self._save()
+            else:
+                self._no_bulletin_recent.add(fecha)
+        logger.info(f"Fecha sin boletín registrada: {fecha}")
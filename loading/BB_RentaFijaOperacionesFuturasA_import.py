@@ -1,99 +1,64 @@
-import pandas as pd
-import pyodbc
-
-def get_db_connection():
-    """
-    Crea la conexión a la base de datos usando autenticación de Windows.
-    """
-    conn_str = (
-        "Driver={SQL Server};"
-        "Server=F_CASTILLO;"
-        "Database=bolsa_valores;"
-        "Trusted_Connection=yes;"
-    )
-    return pyodbc.connect(conn_str)
-
-def check_table_contents():
-    """
-    Verifica el contenido de la tabla BB_RentaFijaOperacionesFuturasA.
-    """
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT COUNT(*) FROM BB_RentaFijaOperacionesFuturasA")
-        count = cursor.fetchone()[0]
-        
-        cursor.close()
-        conn.close()
-        
-    except Exception as e:
-        pass
-
-def insert_data(df: pd.DataFrame) -> bool:
-    """
-    Inserta los datos en la tabla BB_RentaFijaOperacionesFuturasA usando pyodbc.
-    Si ya existe un registro con la misma clave primaria, lo actualiza.
-    """
-    try:
-        # TODO: Implementar lógica específica para BB_RentaFijaOperacionesFuturasA
-        # Convertir tipos de datos según las columnas específicas de esta tabla
-        # df['fecha'] = pd.to_datetime(df['fecha'], dayfirst=True)
-        # df['columna_numerica'] = pd.to_numeric(df['columna_numerica'])
-        
-        # Crear conexión
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        inserted_count = 0
-        updated_count = 0
-        skipped_count = 0
-
-        # TODO: Implementar lógica de inserción específica para esta tabla
-        # Insertar datos uno por uno para mejor control de errores
-        for index, row in df.iterrows():
-            try:
-                # TODO: Implementar MERGE específico para BB_RentaFijaOperacionesFuturasA
-                # cursor.execute("""
-                #     MERGE BB_RentaFijaOperacionesFuturasA AS target
-                #     USING (SELECT ? AS campo1, ? AS fecha) AS source
-                #     ON target.campo1 = source.campo1 AND target.fecha = source.fecha
-                #     WHEN MATCHED THEN
-                #         UPDATE SET 
-                #             campo2 = ?,
-                #             campo3 = ?
-                #     WHEN NOT MATCHED THEN
-                #         INSERT (campo1, campo2, campo3, fecha)
-                #         VALUES (?, ?, ?, ?);
-                # """, (
-                #     row['campo1'],
-                #     row['fecha'].strftime('%Y-%m-%d'),
-                #     float(row['campo2']),
-                #     float(row['campo3']),
-                #     row['campo1'],
-                #     float(row['campo2']),
-                #     float(row['campo3']),
-                #     row['fecha'].strftime('%Y-%m-%d')
-                # ))
-                
-                pass  # Placeholder - implementar lógica real
-                
-            except Exception as row_error:
-                skipped_count += 1
-                continue
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
-        
-        check_table_contents()
-        return True
-        
-    except Exception as e:
-        try:
-            cursor.close()
-            conn.close()
-        except:
-            pass
-        
+import pandas as pd
+import pyodbc
+from loading.conexion_db import get_db_connection
+
+def check_table_contents():
+    """
+    Verifica el contenido de la tabla BB_RentaFijaOperacionesFuturasA.
+    """
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("SELECT COUNT(*) FROM BB_RentaFijaOperacionesFuturasA")
+        count = cursor.fetchone()[0]
+        
+        cursor.close()
+        conn.close()
+        
+    except Exception as e:
+        pass
+
+def insert_data(df: pd.DataFrame) -> bool:
+    """
+    Inserta los datos en la tabla BB_RentaFijaOperacionesFuturasA usando pyodbc.
+    Si ya existe un registro con la misma clave primaria, lo actualiza.
+    """
+    try:
+        # TODO: Implementar lógica específica para BB_RentaFijaOperacionesFuturasA
+        # Convertir tipos de datos según las columnas específicas de esta tabla
+        # df['fecha'] = pd.to_datetime(df['fecha'], dayfirst=True)
+        # df['columna_numerica'] = pd.to_numeric(df['columna_numerica'])
+        
+        # Crear conexión
+        conn = get_db_connection()
+        cursor = conn.cursor()
+
+        inserted_count = 0
+        updated_count = 0
+        skipped_count = 0
+
+        # TODO: Implementar lógica de inserción específica para esta tabla
+        # Carga masiva: tabla temporal y una sola MERGE por lote (ver conexion_db.bulk_merge)
+        # bulk_merge(conn, df, "BB_RentaFijaOperacionesFuturasA", keys=["campo1", "fecha"], columns={
+        #     "campo1": "campo1",
+        #     "campo2": "campo2",
+        #     "campo3": "campo3",
+        #     "fecha": "fecha",
+        # })
+        
+        conn.commit()
+        cursor.close()
+        conn.close()
+        
+        check_table_contents()
+        return True
+        
+    except Exception as e:
+        try:
+            cursor.close()
+            conn.close()
+        except:
+            pass
+        
         return False
\ No newline at end of file
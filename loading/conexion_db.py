@@ -1,15 +1,191 @@
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__)))
-import pyodbc
-def get_db_connection():
-    """
-    Crea la conexión a la base de datos usando autenticación de Windows.
-    """
-    conn_str = (
-        "Driver={SQL Server};"
-        "Server=F_CASTILLO;"
-        "Database=bolsa_valores;"
-        "Trusted_Connection=yes;"
-    )
-    return pyodbc.connect(conn_str)
\ No newline at end of file
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+import pyodbc
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+from datetime import date
+import pandas as pd
+from pandas.api.types import is_datetime64_dtype
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow es opcional: solo hace falta con columnas Arrow
+    pa = None
+
+# Filas por lote de la carga masiva: una inserción fast_executemany y una MERGE por lote
+BULK_BATCH_ROWS = 50000
+
+# Driver ODBC por defecto, presente en todos los equipos Windows. No admite fast_executemany
+# (bulk_merge envía las filas una por una); los drivers "ODBC Driver 17/18 for SQL Server" sí,
+# pero hay que instalarlos: se eligen con el argumento driver= o la variable de entorno DB_DRIVER_ENV
+DB_DRIVER = "SQL Server"
+DB_DRIVER_ENV = "BVRD_DB_DRIVER"
+
+# Archivos de los drivers "ODBC Driver 17/18 for SQL Server" (msodbcsql17.dll, libmsodbcsql-18...)
+FAST_EXECUTEMANY_DRIVERS = ("msodbcsql",)
+
+def get_db_connection(driver: Optional[str] = None):
+    """
+    Crea la conexión a la base de datos usando autenticación de Windows.
+    
+    Args:
+        driver (Optional[str]): Driver ODBC (p. ej. "ODBC Driver 18 for SQL Server").
+                                Si es None, el de la variable de entorno BVRD_DB_DRIVER o, si
+                                no está definida, DB_DRIVER.
+    """
+    driver = driver or os.environ.get(DB_DRIVER_ENV) or DB_DRIVER
+    conn_str = (
+        f"Driver={{{driver}}};"
+        "Server=F_CASTILLO;"
+        "Database=bolsa_valores;"
+        "Trusted_Connection=yes;"
+    )
+    return pyodbc.connect(conn_str)
+
+def supports_fast_executemany(conn) -> bool:
+    """
+    Indica si el driver de la conexión admite fast_executemany (los drivers "ODBC Driver
+    17/18 for SQL Server"; no el antiguo "SQL Server").
+    """
+    try:
+        driver = conn.getinfo(pyodbc.SQL_DRIVER_NAME)
+    except pyodbc.Error:
+        return False
+    return any(name in str(driver).lower() for name in FAST_EXECUTEMANY_DRIVERS)
+
+def get_max_fechas(tables: Iterable[str]) -> Dict[str, Optional[date]]:
+    """
+    Obtiene la fecha máxima cargada (columna fecha) de cada tabla en una sola consulta.
+    Retorna None para las tablas vacías.
+    """
+    tables = list(tables)
+    if not tables:
+        return {}
+    
+    # Los nombres de tabla vienen del pipeline (no del usuario), se interpolan entre corchetes
+    query = " UNION ALL ".join(
+        f"SELECT ? AS tabla, MAX(fecha) AS max_fecha FROM [{table}]" for table in tables
+    )
+    
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(query, *tables)
+        rows = cursor.fetchall()
+        cursor.close()
+    finally:
+        conn.close()
+    
+    return {
+        tabla: (pd.Timestamp(max_fecha).date() if max_fecha is not None else None)
+        for tabla, max_fecha in rows
+    }
+
+def column_values(values: pd.Series) -> list:
+    """
+    Valores de una columna listos para enviarse como parámetros con pyodbc: los nulos
+    (NaN, NaT, NA) como None, las fechas como datetime.date y los números como float o int.
+    Las columnas Arrow se leen directamente de su buffer (to_pylist ya entrega None y date),
+    sin pasar cada valor por pandas.
+    
+    Args:
+        values (pd.Series): Columna del DataFrame transformado
+        
+    Returns:
+        list: Un valor de Python por fila
+    """
+    if isinstance(values.dtype, pd.ArrowDtype):
+        return pa.array(values).to_pylist()
+    if is_datetime64_dtype(values.dtype):
+        values = values.dt.date
+    else:
+        values = values.astype(object)
+    return values.where(values.notna(), None).tolist()
+
+def parameter_rows(df: pd.DataFrame, columns: Sequence[str]) -> List[tuple]:
+    """
+    Filas de parámetros para una sentencia con marcadores ?, en el orden de columns.
+    Una columna puede repetirse (p. ej. la clave en el USING y en el INSERT de un MERGE);
+    cada columna se convierte una sola vez.
+    
+    Args:
+        df (pd.DataFrame): DataFrame a cargar
+        columns (Sequence[str]): Columna de cada marcador de la sentencia
+        
+    Returns:
+        List[tuple]: Una tupla de parámetros por fila
+        
+    Example:
+        >>> for params in parameter_rows(df, ['mercado', 'fecha', 'transado_usd']):
+        ...     cursor.execute(sql, params)
+    """
+    converted = {col: column_values(df[col]) for col in dict.fromkeys(columns)}
+    return list(zip(*(converted[col] for col in columns)))
+
+def bulk_merge(conn, df: pd.DataFrame, table: str, keys: Sequence[str], columns: Mapping[str, str],
+               batch_rows: int = BULK_BATCH_ROWS) -> int:
+    """
+    Inserta o actualiza (upsert) un DataFrame completo con operaciones de conjunto: las filas se
+    cargan en una tabla temporal con fast_executemany (si el driver lo admite, ver
+    supports_fast_executemany) y se aplican con una sola MERGE por lote, en lugar de un viaje a
+    la base de datos y una MERGE por fila.
+    
+    La tabla temporal se crea con SELECT TOP 0 ... INTO a partir de la tabla destino, así que
+    tiene sus mismos tipos. Si la clave se repite en el DataFrame, queda la última fila (como
+    con la MERGE fila por fila). No hace commit: la carga completa es una sola transacción de
+    quien llama, y si una fila es rechazada se lanza la excepción.
+    
+    Args:
+        conn: Conexión pyodbc
+        df (pd.DataFrame): Datos a cargar
+        table (str): Tabla destino (se interpola en el SQL: solo nombres fijos del pipeline)
+        keys (Sequence[str]): Columnas de la tabla que identifican un registro
+        columns (Mapping[str, str]): Columna de la tabla -> columna del DataFrame, incluidas las claves
+        batch_rows (int): Filas por lote
+        
+    Returns:
+        int: Filas insertadas o actualizadas
+        
+    Example:
+        >>> bulk_merge(conn, df, "BB_RFVTransPuestoBolsaMP", keys=["participante", "fecha"],
+        ...            columns={"participante": "participante", "transado_usd": "transado_usd",
+        ...                     "fecha": "fecha"})
+    """
+    targets = list(columns)
+    sources = [columns[col] for col in targets]
+    stage = f"#stage_{table}"
+    column_list = ", ".join(f"[{col}]" for col in targets)
+    updates = [col for col in targets if col not in keys]
+    
+    merge_sql = (
+        f"MERGE [{table}] WITH (HOLDLOCK) AS target "
+        f"USING [{stage}] AS source "
+        f"ON {' AND '.join(f'target.[{col}] = source.[{col}]' for col in keys)} "
+        + (f"WHEN MATCHED THEN UPDATE SET {', '.join(f'target.[{col}] = source.[{col}]' for col in updates)} "
+           if updates else "")
+        + f"WHEN NOT MATCHED THEN INSERT ({column_list}) "
+        f"VALUES ({', '.join(f'source.[{col}]' for col in targets)});"
+    )
+    insert_sql = f"INSERT INTO [{stage}] ({column_list}) VALUES ({', '.join('?' for _ in targets)})"
+    
+    # La MERGE no admite dos filas de origen para el mismo registro destino
+    df = df.drop_duplicates(subset=[columns[col] for col in keys], keep='last')
+    if df.empty:
+        return 0
+    
+    cursor = conn.cursor()
+    try:
+        # Una carga fallida en la misma conexión pudo dejar la tabla temporal creada
+        cursor.execute(f"IF OBJECT_ID('tempdb..[{stage}]') IS NOT NULL DROP TABLE [{stage}]")
+        cursor.execute(f"SELECT TOP 0 {column_list} INTO [{stage}] FROM [{table}]")
+        cursor.fast_executemany = supports_fast_executemany(conn)
+        merged = 0
+        for start in range(0, len(df), batch_rows):
+            cursor.executemany(insert_sql, parameter_rows(df.iloc[start:start + batch_rows], sources))
+            cursor.execute(merge_sql)
+            merged += max(cursor.rowcount, 0)
+            cursor.execute(f"TRUNCATE TABLE [{stage}]")
+        cursor.execute(f"DROP TABLE [{stage}]")
+        return merged
+    finally:
+        cursor.close()
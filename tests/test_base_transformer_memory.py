@@ -0,0 +1,192 @@
+"""
+Pico de memoria de BaseTransformer medido con tracemalloc.
+
+Cotas comprobadas:
+    - execute_plan: el pico es la salida (lo que el resultado retiene al terminar) más las
+      posiciones de fila y una columna en conversión (códigos, resultado y la tabla hash de
+      un bloque): a lo sumo PLAN_PEAK_RATIO veces la salida, y menos de la mitad del pico de
+      la misma transformación materializando un DataFrame por paso.
+    - Utilidades (clean_numeric_columns → clean_date_columns → standardize_column_names →
+      add_metadata), con y sin inplace=True: el pico son las columnas convertidas más una
+      columna en conversión, sin copiar las demás (una fracción de la cadena con copias).
+
+Uso:
+    python -m pytest -q tests/test_base_transformer_memory.py
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from transformers.base_transformer import BaseTransformer, SpecTransformer, use_transform_backend
+from transformers.date_parser import parse_dates
+from transformers.numeric_parser import parse_numeric
+from transformers.sheet_spec import SheetSpec
+
+ROWS = 200_000
+
+# Pico de execute_plan sobre lo que retiene el resultado (medido: 1.31 con 200k filas)
+PLAN_PEAK_RATIO = 1.4
+# Frente a materializar un DataFrame por paso (medido: ~0.25)
+PLAN_REDUCTION_RATIO = 0.5
+# Utilidades frente a la cadena con una copia profunda por paso (medido: ~0.09)
+HELPERS_REDUCTION_RATIO = 0.3
+# Columnas de 8 bytes por fila que ocupa una conversión en curso (medido: ~2)
+CONVERSION_COLUMNS = 2.5
+
+SPEC = SheetSpec(
+    name="PruebaMemoria",
+    columns={0: "participante", 1: "instrumento", 2: "fecha_venc", 3: "monto", 4: "precio",
+             5: "tasa", 6: "cantidad", 7: "moneda", "Fecha": "fecha"},
+    exclude_rows={0: ["Total"]},
+    strip_columns=["participante"],
+    upper_columns=["moneda"],
+    date_columns=["fecha_venc", "fecha"],
+    numeric_columns=["monto", "precio", "tasa", "cantidad"],
+    percent_columns=["tasa"],
+    critical_columns=["monto"],
+    drop_trailing_rows=1,
+)
+
+
+def raw_sheet(rows: int = ROWS) -> pd.DataFrame:
+    """
+    Hoja cruda como la entrega la extracción: texto con espacios, números y fechas como texto,
+    subtotales y filas sin monto.
+    """
+    rng = np.random.default_rng(0)
+    data = {
+        0: rng.choice([" PUESTO A ", "PUESTO B", "Total general", " PUESTO C"], rows),
+        1: rng.choice(["BONO-1", "BONO-2", "LETRA-3"], rows),
+        2: rng.choice(["15/01/2030", "01/06/2027", "30/09/2026"], rows),
+        3: rng.choice(["1,234,567.50", "(2,500.00)", "98,000.25", None], rows),
+        4: rng.choice(["101.25", "99.875", "100"], rows),
+        5: rng.choice(["5.25%", "10.5%", "7%"], rows),
+        6: rng.choice(["10", "250", "1,000"], rows),
+        7: rng.choice(["dop", "usd "], rows),
+    }
+    df = pd.DataFrame({key: pd.Series(values, dtype=object) for key, values in data.items()})
+    df["Fecha"] = "18/03/2025"
+    return df
+
+
+def traced(func, *args, **kwargs):
+    """
+    Ejecuta func con tracemalloc y devuelve (resultado, bytes retenidos, pico).
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func(*args, **kwargs)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current, peak
+
+
+def materialize_each_step(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Misma transformación que SPEC, materializando un DataFrame por paso: copia de la
+    entrada, columnas convertidas completas, filtro, filas finales y reset_index.
+    """
+    df = df.copy()
+    df.columns = list(SPEC.columns.values())
+    df = df[~df["participante"].str.contains("Total", na=False)]
+    df["participante"] = df["participante"].str.strip()
+    df["moneda"] = df["moneda"].str.strip().str.upper()
+    for col in SPEC.date_columns:
+        df[col], _ = parse_dates(df[col])
+    for col in SPEC.numeric_columns:
+        df[col] = parse_numeric(df[col], percent=col in SPEC.percent_columns)
+    df = df.dropna(subset=SPEC.critical_columns)
+    df = df.iloc[:-1]
+    return df.reset_index(drop=True)
+
+
+class HelperTransformer(BaseTransformer):
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df
+
+
+def helper_chain(transformer: BaseTransformer, df: pd.DataFrame, inplace: bool) -> pd.DataFrame:
+    df = transformer.clean_numeric_columns(df, ["Monto"], inplace=inplace)
+    df = transformer.clean_date_columns(df, ["Fecha Op"], inplace=inplace)
+    df = transformer.standardize_column_names(df, inplace=inplace)
+    return transformer.add_metadata(df, {"fuente": "BVRD"}, inplace=inplace)
+
+
+def deep_copy_chain(transformer: BaseTransformer, df: pd.DataFrame) -> pd.DataFrame:
+    # Cadena equivalente con una copia profunda por paso (el comportamiento anterior)
+    for step in (lambda d: transformer.clean_numeric_columns(d, ["Monto"], inplace=True),
+                 lambda d: transformer.clean_date_columns(d, ["Fecha Op"], inplace=True),
+                 lambda d: transformer.standardize_column_names(d, inplace=True),
+                 lambda d: transformer.add_metadata(d, {"fuente": "BVRD"}, inplace=True)):
+        df = step(df.copy())
+    return df
+
+
+def helper_frame(rows: int = ROWS) -> pd.DataFrame:
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({f"Col {i}": pd.Series(rng.choice(["a", "b", "c"], rows), dtype=object) for i in range(10)})
+    df["Monto"] = pd.Series(rng.choice(["1,234.5", "7.25"], rows), dtype=object)
+    df["Fecha Op"] = pd.Series(rng.choice(["18/03/2025", "19/03/2025"], rows), dtype=object)
+    return df
+
+
+@pytest.fixture(autouse=True)
+def pandas_backend():
+    previous = use_transform_backend("pandas")
+    yield
+    use_transform_backend(previous)
+
+
+def test_execute_plan_peak_is_about_one_output_frame():
+    df = raw_sheet()
+    before = df.copy()
+    transformer = SpecTransformer(SPEC)
+    transformer.execute_plan(df)  # infiere y guarda los formatos de fecha
+
+    result, retained, peak = traced(transformer.execute_plan, df)
+
+    pd.testing.assert_frame_equal(df, before)
+    assert len(result) > 0
+    assert peak <= PLAN_PEAK_RATIO * retained, f"pico {peak / retained:.2f} veces la salida"
+
+
+def test_execute_plan_peak_reduction():
+    df = raw_sheet()
+    transformer = SpecTransformer(SPEC)
+    transformer.execute_plan(df)
+
+    result, _, plan_peak = traced(transformer.execute_plan, df)
+    expected, _, naive_peak = traced(materialize_each_step, df)
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert plan_peak <= PLAN_REDUCTION_RATIO * naive_peak, f"pico {plan_peak / naive_peak:.2f} del de referencia"
+
+
+@pytest.mark.parametrize("inplace", [False, True])
+def test_helper_chain_peak(inplace):
+    transformer = HelperTransformer()
+    df = helper_frame()
+    before = df.copy()
+
+    result, retained, peak = traced(helper_chain, transformer, df, inplace)
+    expected, _, deep_peak = traced(deep_copy_chain, transformer, before.copy())
+
+    pd.testing.assert_frame_equal(result, expected)
+    if inplace:
+        assert result is df
+    else:
+        pd.testing.assert_frame_equal(df, before)
+    assert peak <= HELPERS_REDUCTION_RATIO * deep_peak, f"pico {peak / deep_peak:.2f} del de la cadena con copias"
+    column_bytes = ROWS * np.dtype(np.float64).itemsize
+    assert peak <= retained + CONVERSION_COLUMNS * column_bytes, \
+        f"pico {(peak - retained) / column_bytes:.2f} columnas sobre lo retenido"
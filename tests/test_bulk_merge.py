@@ -0,0 +1,160 @@
+"""
+SQL y parámetros de conexion_db.bulk_merge, con una conexión y un cursor simulados.
+
+Uso:
+    python -m pytest -q tests/test_bulk_merge.py
+"""
+
+import os
+import sys
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    import pyodbc  # noqa: F401
+except ImportError:  # sin el driver instalado basta con los nombres que usa conexion_db
+    fake_pyodbc = types.ModuleType('pyodbc')
+    fake_pyodbc.Error = type('Error', (Exception,), {})
+    fake_pyodbc.SQL_DRIVER_NAME = 6
+    sys.modules['pyodbc'] = fake_pyodbc
+
+import loading.conexion_db as conexion_db
+from loading.conexion_db import bulk_merge, get_db_connection, supports_fast_executemany
+
+TABLE = "BB_RFVTransPuestoBolsaMP"
+STAGE = f"#stage_{TABLE}"
+COLUMNS = {"participante": "participante", "transado_usd": "transado_usd", "fecha": "fecha"}
+
+SELECT_INTO = f"SELECT TOP 0 [participante], [transado_usd], [fecha] INTO [{STAGE}] FROM [{TABLE}]"
+INSERT = f"INSERT INTO [{STAGE}] ([participante], [transado_usd], [fecha]) VALUES (?, ?, ?)"
+MERGE = (
+    f"MERGE [{TABLE}] WITH (HOLDLOCK) AS target "
+    f"USING [{STAGE}] AS source "
+    "ON target.[participante] = source.[participante] AND target.[fecha] = source.[fecha] "
+    "WHEN MATCHED THEN UPDATE SET target.[transado_usd] = source.[transado_usd] "
+    "WHEN NOT MATCHED THEN INSERT ([participante], [transado_usd], [fecha]) "
+    "VALUES (source.[participante], source.[transado_usd], source.[fecha]);"
+)
+
+
+class FakeCursor:
+    def __init__(self):
+        self.statements = []
+        self.fast_executemany = False
+        self.fast_flags = []
+        self.rowcount = -1
+        self.closed = False
+
+    def execute(self, sql, *params):
+        self.statements.append(("execute", sql))
+        self.rowcount = 2 if sql.startswith("MERGE") else -1
+
+    def executemany(self, sql, rows):
+        self.statements.append(("executemany", sql, list(rows)))
+        self.fast_flags.append(self.fast_executemany)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    def __init__(self, driver):
+        self.driver = driver
+        self.cursors = []
+
+    def cursor(self):
+        self.cursors.append(FakeCursor())
+        return self.cursors[-1]
+
+    def getinfo(self, info_type):
+        return self.driver
+
+
+def frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        "participante": ["PUESTO A", "PUESTO B", "PUESTO A", "PUESTO C"],
+        "transado_usd": [1.5, np.nan, 3.0, 4.25],
+        "fecha": pd.to_datetime(["2025-03-18", "2025-03-18", "2025-03-18", "2025-03-19"]),
+    })
+
+
+def test_bulk_merge_sql_and_parameters():
+    conn = FakeConnection("msodbcsql17.dll")
+
+    merged = bulk_merge(conn, frame(), TABLE, keys=["participante", "fecha"], columns=COLUMNS)
+
+    cursor, = conn.cursors
+    assert cursor.statements == [
+        ("execute", f"IF OBJECT_ID('tempdb..[{STAGE}]') IS NOT NULL DROP TABLE [{STAGE}]"),
+        ("execute", SELECT_INTO),
+        # La clave repetida (PUESTO A, 18/03) queda con la última fila; NaN como None y fechas como date
+        ("executemany", INSERT, [
+            ("PUESTO B", None, pd.Timestamp("2025-03-18").date()),
+            ("PUESTO A", 3.0, pd.Timestamp("2025-03-18").date()),
+            ("PUESTO C", 4.25, pd.Timestamp("2025-03-19").date()),
+        ]),
+        ("execute", MERGE),
+        ("execute", f"TRUNCATE TABLE [{STAGE}]"),
+        ("execute", f"DROP TABLE [{STAGE}]"),
+    ]
+    assert cursor.fast_flags == [True]
+    assert cursor.closed
+    assert merged == 2
+
+
+def test_bulk_merge_batches():
+    conn = FakeConnection("libmsodbcsql-18.3.so.2.1")
+
+    merged = bulk_merge(conn, frame(), TABLE, keys=["participante", "fecha"], columns=COLUMNS, batch_rows=2)
+
+    cursor, = conn.cursors
+    kinds = [statement[0] if statement[0] == "executemany" else statement[1].split()[0]
+             for statement in cursor.statements[2:]]
+    assert kinds == ["executemany", "MERGE", "TRUNCATE", "executemany", "MERGE", "TRUNCATE", "DROP"]
+    batches = [statement[2] for statement in cursor.statements if statement[0] == "executemany"]
+    assert [len(rows) for rows in batches] == [2, 1]
+    assert merged == 4
+
+
+@pytest.mark.parametrize("driver, fast", [
+    ("msodbcsql17.dll", True),
+    ("libmsodbcsql-18.3.so.2.1", True),
+    ("SQLSRV32.DLL", False),
+])
+def test_fast_executemany_only_with_supported_drivers(driver, fast):
+    conn = FakeConnection(driver)
+    assert supports_fast_executemany(conn) is fast
+
+    bulk_merge(conn, frame(), TABLE, keys=["participante", "fecha"], columns=COLUMNS)
+    assert conn.cursors[0].fast_flags == [fast]
+
+
+def test_bulk_merge_empty_frame_runs_nothing():
+    conn = FakeConnection("msodbcsql17.dll")
+
+    assert bulk_merge(conn, frame().iloc[:0], TABLE, keys=["participante", "fecha"], columns=COLUMNS) == 0
+    assert conn.cursors == []
+
+
+@pytest.mark.parametrize("env, driver, expected", [
+    (None, None, "SQL Server"),
+    ("ODBC Driver 18 for SQL Server", None, "ODBC Driver 18 for SQL Server"),
+    ("ODBC Driver 18 for SQL Server", "ODBC Driver 17 for SQL Server", "ODBC Driver 17 for SQL Server"),
+])
+def test_driver_default_and_opt_in(monkeypatch, env, driver, expected):
+    connections = []
+    monkeypatch.setattr(conexion_db.pyodbc, "connect", connections.append, raising=False)
+    if env is None:
+        monkeypatch.delenv(conexion_db.DB_DRIVER_ENV, raising=False)
+    else:
+        monkeypatch.setenv(conexion_db.DB_DRIVER_ENV, env)
+
+    get_db_connection(driver)
+
+    conn_str, = connections
+    assert conn_str.startswith(f"Driver={{{expected}}};")
@@ -0,0 +1,48 @@
+"""
+Huellas del registro de cargas: cambian con el contenido crudo y con la especificación de la hoja.
+
+Uso:
+    python -m pytest -q tests/test_fingerprint_ledger.py
+"""
+
+import copy
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from extraction.fingerprint_ledger import FingerprintLedger, fingerprint_dataframe
+from transformers.Sheet_transformers.BB_RFVTransPuestoBolsaMP import SPEC
+
+FECHA = "18-03-2025"
+
+
+def sheet() -> pd.DataFrame:
+    return pd.DataFrame({0: ["Participante", "PUESTO A"], 1: ["USD", "1,500.00"], "Fecha": [FECHA, FECHA]})
+
+
+def test_version_estable_y_sensible_a_la_especificacion():
+    assert SPEC.version() == copy.deepcopy(SPEC).version()
+
+    changed_read = copy.deepcopy(SPEC)
+    changed_read.read_spec.start_occurrence += 1
+    changed_columns = copy.deepcopy(SPEC)
+    changed_columns.numeric_columns.remove("transado_usd")
+
+    versions = {SPEC.version(), changed_read.version(), changed_columns.version()}
+    assert len(versions) == 3
+
+
+def test_cambio_de_especificacion_recarga_la_hoja(tmp_path):
+    ledger = FingerprintLedger(str(tmp_path / "fingerprints.json"))
+    ledger.record(SPEC.name, FECHA, fingerprint_dataframe(sheet(), SPEC.version()))
+    ledger.flush()
+
+    ledger = FingerprintLedger(str(tmp_path / "fingerprints.json"))
+    assert ledger.is_unchanged(SPEC.name, FECHA, fingerprint_dataframe(sheet(), SPEC.version()))
+
+    changed = copy.deepcopy(SPEC)
+    changed.strip_columns = []
+    assert not ledger.is_unchanged(SPEC.name, FECHA, fingerprint_dataframe(sheet(), changed.version()))
@@ -0,0 +1,164 @@
+"""
+Fechas fallidas en el modo incremental: una descarga o un parseo fallidos no se confunden con
+un día sin boletín, así la marca de agua no avanza por encima de una fecha que hay que reintentar.
+
+Uso:
+    python -m pytest -q tests/test_incremental_manager.py
+"""
+
+import datetime
+import os
+import sys
+import types
+from io import BytesIO
+
+import pandas as pd
+import pytest
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'extraction'))
+
+try:
+    import pyodbc  # noqa: F401
+except ImportError:  # los cargadores solo necesitan los nombres al importarse
+    fake_pyodbc = types.ModuleType('pyodbc')
+    fake_pyodbc.Error = type('Error', (Exception,), {})
+    fake_pyodbc.SQL_DRIVER_NAME = 6
+    sys.modules['pyodbc'] = fake_pyodbc
+
+import database_manager
+from extraction.scraper import BulletinNotFoundError, BVRDScraper, ScraperBase, ScraperUtils
+
+SHEETS = ["BB_RFMPOperDia", "BB_ResumenGeneralMercado"]
+DIA_N = "17-03-2025"
+DIA_N1 = "18-03-2025"
+
+
+def workbook(sheets) -> BytesIO:
+    content = BytesIO()
+    with pd.ExcelWriter(content, engine="openpyxl") as writer:
+        for sheet in sheets:
+            pd.DataFrame({"valor": [1, 2]}).to_excel(writer, sheet_name=sheet, index=False)
+    content.seek(0)
+    return content
+
+
+@pytest.fixture
+def fake_server(monkeypatch):
+    """
+    Respuestas por fecha: "404", "error" (descarga fallida), "corrupto" (bytes que no son un libro)
+    o la lista de hojas del libro.
+    """
+    responses = {}
+
+    def download_excel_file(url, http=None, cache=None, raise_not_found=False, **kwargs):
+        response = next(value for date_str, value in responses.items() if date_str in url)
+        if response == "404":
+            if raise_not_found:
+                raise BulletinNotFoundError(url)
+            return None
+        if response == "error":
+            return None
+        if response == "corrupto":
+            return BytesIO(b"no es un libro")
+        return workbook(response)
+
+    monkeypatch.setattr(ScraperUtils, "download_excel_file", staticmethod(download_excel_file))
+    monkeypatch.setattr(ScraperBase, "USE_TRADING_CALENDAR", False)
+    return responses
+
+
+@pytest.mark.parametrize("parse_workers", [0, 1])
+def test_iter_workbooks_separa_fallos_de_dias_sin_boletin(fake_server, parse_workers):
+    fake_server.update({
+        "14-03-2025": "404",
+        "15-03-2025": "error",
+        "16-03-2025": "corrupto",
+        DIA_N: ["RFMPOperDia"],
+    })
+
+    with BVRDScraper(max_workers=2, use_cache=False, requests_per_second=1000,
+                     parse_workers=parse_workers) as scraper:
+        results = dict(scraper.iter_workbooks(list(fake_server), SHEETS))
+
+    assert results["14-03-2025"] == {}
+    assert results["15-03-2025"] is None
+    assert results["16-03-2025"] is None
+    # Libro válido: la hoja que falta no aparece y la encontrada usa el nombre solicitado
+    assert list(results[DIA_N]) == [f"BB_RFMPOperDia_{DIA_N}"]
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """
+    incremental_manager con marcas de agua, scraper y cargadores simulados.
+    Devuelve las cargas realizadas como (hoja, fecha).
+    """
+    loads = []
+
+    def inserter(base_name):
+        def insert(df):
+            loads.append((base_name, df["Fecha"].iloc[0]))
+            return True
+        return insert
+
+    transformers = {sheet: (lambda df: df) for sheet in SHEETS}
+    inserters = {sheet: inserter(sheet) for sheet in SHEETS}
+    watermark = datetime.date(2025, 3, 16)
+
+    monkeypatch.setattr(database_manager, "get_pipeline", lambda: (set(SHEETS), transformers, inserters))
+    monkeypatch.setattr(database_manager, "get_read_specs", lambda: {})
+    monkeypatch.setattr(database_manager, "get_max_fechas", lambda sheets: {sheet: watermark for sheet in sheets})
+    monkeypatch.setattr(database_manager, "get_category_dictionary",
+                        lambda: types.SimpleNamespace(flush=lambda: None))
+    return loads
+
+
+def run_incremental(monkeypatch, workbooks):
+    class FakeScraper:
+        def __init__(self, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            pass
+
+        def iter_workbooks(self, dates, sheets_to_extract):
+            assert dates == list(workbooks)
+            yield from workbooks.items()
+
+    monkeypatch.setattr(database_manager, "BVRDScraper", FakeScraper)
+    return database_manager.incremental_manager(end_date="2025-03-18")
+
+
+def sheets_of(fecha, sheets):
+    return {f"{sheet}_{fecha}": pd.DataFrame({"valor": [1], "Fecha": [fecha]}) for sheet in sheets}
+
+
+def test_descarga_fallida_detiene_las_fechas_siguientes(monkeypatch, pipeline):
+    # Día N falla la descarga y N+1 se obtiene bien: N+1 no se carga, MAX(fecha) sigue antes de N
+    processed = run_incremental(monkeypatch, {DIA_N: None, DIA_N1: sheets_of(DIA_N1, SHEETS)})
+
+    assert processed == 0
+    assert pipeline == []
+
+
+def test_dia_sin_boletin_no_detiene_el_procesamiento(monkeypatch, pipeline):
+    processed = run_incremental(monkeypatch, {DIA_N: {}, DIA_N1: sheets_of(DIA_N1, SHEETS)})
+
+    assert processed == 1
+    assert sorted(pipeline) == [(sheet, DIA_N1) for sheet in SHEETS]
+
+
+def test_hoja_ausente_en_un_libro_valido_falla_solo_esa_hoja(monkeypatch, pipeline):
+    processed = run_incremental(monkeypatch, {
+        DIA_N: sheets_of(DIA_N, ["BB_ResumenGeneralMercado"]),
+        DIA_N1: sheets_of(DIA_N1, SHEETS),
+    })
+
+    # En N+1 la única hoja pendiente es la que sigue cargando
+    assert processed == 1
+    assert pipeline == [("BB_ResumenGeneralMercado", DIA_N), ("BB_ResumenGeneralMercado", DIA_N1)]
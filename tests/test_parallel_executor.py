@@ -0,0 +1,85 @@
+"""
+Paridad de ParallelTransformExecutor con la ejecución secuencial sobre el boletín de ejemplo,
+con columnas numpy y con columnas Arrow (dtype_backend="pyarrow").
+
+Uso:
+    python -m pytest -q tests/test_parallel_executor.py
+"""
+
+import os
+import sys
+from io import BytesIO
+
+import pandas as pd
+import pytest
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, ROOT)
+
+pytest.importorskip("pyarrow")
+
+from extraction.scraper import ScraperUtils
+from transformers.Sheet_transformers import (
+    transform_resumen_general_mercado,
+    transform_rfmp_oper_dia,
+    transform_rfv_trans_puesto_bolsa_mp,
+)
+from transformers.Sheet_transformers.BB_ResumenGeneralMercado import READ_SPEC as resumen_spec
+from transformers.Sheet_transformers.BB_RFVTransPuestoBolsaMP import READ_SPEC as rfv_trans_puesto_spec
+from transformers.category_dictionary import CategoryDictionary, use_category_dictionary
+from transformers.parallel_executor import ParallelTransformExecutor, from_payload, to_payload
+
+WORKBOOK = os.path.join(ROOT, "18-03-2025-Boletin+BVRD+Consolidado+excel.xlsx")
+FECHA = "18-03-2025"
+TRANSFORMERS = {
+    "BB_ResumenGeneralMercado": transform_resumen_general_mercado,
+    "BB_RFVTransPuestoBolsaMP": transform_rfv_trans_puesto_bolsa_mp,
+    "BB_RFMPOperDia": transform_rfmp_oper_dia,
+}
+READ_SPECS = {
+    "BB_ResumenGeneralMercado": resumen_spec,
+    "BB_RFVTransPuestoBolsaMP": rfv_trans_puesto_spec,
+}
+
+
+def extract(dtype_backend):
+    with open(WORKBOOK, "rb") as f:
+        content = BytesIO(f.read())
+    sheets = ScraperUtils.extract_sheets_from_excel(content, FECHA, list(TRANSFORMERS), read_specs=READ_SPECS,
+                                                    dtype_backend=dtype_backend)
+    return {key[:-len(f"_{FECHA}")]: df for key, df in sheets.items()}
+
+
+@pytest.fixture(autouse=True)
+def memory_dictionary():
+    # Sin escribir el diccionario de categorías persistente
+    use_category_dictionary(CategoryDictionary(path=None))
+
+
+def test_payload_conserva_columnas_arrow():
+    df = extract("pyarrow")["BB_RFMPOperDia"]
+    transformed = transform_rfmp_oper_dia(df)
+
+    for frame in (df, transformed):
+        restored = from_payload(to_payload(frame))
+        pd.testing.assert_frame_equal(restored, frame)
+        assert restored.attrs == frame.attrs
+
+
+@pytest.mark.parametrize("dtype_backend", [None, "pyarrow"])
+def test_paralelo_igual_a_secuencial(dtype_backend):
+    sheets = extract(dtype_backend)
+    assert set(sheets) == set(TRANSFORMERS)
+
+    sequential = {name: TRANSFORMERS[name](df) for name, df in sheets.items()}
+    with ParallelTransformExecutor(workers=2) as executor:
+        tasks = ((name, TRANSFORMERS[name], df) for name, df in sheets.items())
+        parallel = {}
+        for name, df_transformed, error in executor.map(tasks):
+            assert error is None
+            parallel[name] = df_transformed
+
+    for name, expected in sequential.items():
+        if dtype_backend == "pyarrow":
+            assert any(isinstance(dtype, pd.ArrowDtype) for dtype in parallel[name].dtypes)
+        pd.testing.assert_frame_equal(parallel[name], expected)
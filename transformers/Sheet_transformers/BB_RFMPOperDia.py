@@ -1,50 +1,79 @@
-import pandas as pd
-import sys
-import os
-
-# Agregar el directorio raíz del proyecto al path para importaciones
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
-
-
-from transformers.Sheet_transformers.funciones_de_limpieza import LimpiezaExcel
-
-def transform_rfmp_oper_dia(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Transforma los datos de la hoja BB_RFMPOperDia.
-    
-    Args:
-        df (pd.DataFrame): DataFrame original
-        
-    Returns:
-        pd.DataFrame: DataFrame transformado
-    """
-    df.drop(columns=[df.columns[5]], inplace=True)
-    
-    df.columns = [
-        "numero_operacion",
-        "rueda",
-        "Cod_Local",
-        "Cod_ISIN",
-        "Cod_Emisor",
-        "Fecha_Venc",
-        "Frec_Pago",
-        "Tasa_Cupon",
-        "Nom_Unit",
-        "Valor_Negociado",
-        "Precio",
-        "Valor_Transado",
-        "Rend_Equiv",
-        "Mon",
-        "Equiv_en_DOP",
-        "Fecha_Liq",
-        "Dias_Venc",
-        "Fecha"
-    ]
-
-
-    # Crear una copia del DataFrame
-    df = df.dropna(subset=[df.columns[0]])
-    df = df.iloc[:-1]
-    df = LimpiezaExcel().recortar_df(df, columna=0, palabra_inicial="Número Operación", palabra_final=None, n_inicial=1, n_final=1)
-    return df
-
+import pandas as pd
+import sys
+import os
+from typing import List
+
+# Agregar el directorio raíz del proyecto al path para importaciones
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+
+from extraction.sheet_read_spec import SheetReadSpec
+from transformers.base_transformer import SpecTransformer
+from transformers.sheet_spec import SheetSpec
+
+# Filas desde el encabezado "Número Operación"; la columna 5 de la hoja está vacía
+READ_SPEC = SheetReadSpec(
+    columns=[0, 1, 2, 3, 4, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17],
+    start_anchor="Número Operación",
+)
+
+SPEC = SheetSpec(
+    name="BB_RFMPOperDia",
+    read_spec=READ_SPEC,
+    columns={
+        0: "numero_operacion",
+        1: "rueda",
+        2: "Cod_Local",
+        3: "Cod_ISIN",
+        4: "Cod_Emisor",
+        6: "Fecha_Venc",
+        7: "Frec_Pago",
+        8: "Tasa_Cupon",
+        9: "Nom_Unit",
+        10: "Valor_Negociado",
+        11: "Precio",
+        12: "Valor_Transado",
+        13: "Rend_Equiv",
+        14: "Mon",
+        15: "Equiv_en_DOP",
+        16: "Fecha_Liq",
+        17: "Dias_Venc",
+        "Fecha": "Fecha",
+    },
+    numeric_columns=[
+        "Frec_Pago", "Tasa_Cupon", "Nom_Unit", "Valor_Negociado", "Precio",
+        "Valor_Transado", "Rend_Equiv", "Equiv_en_DOP", "Dias_Venc",
+    ],
+    date_columns=["Fecha_Venc", "Fecha_Liq", "Fecha"],
+    # Cod_Local y Cod_ISIN son casi únicos por operación: quedan como texto
+    category_columns=["rueda", "Cod_Emisor", "Mon"],
+    critical_columns=["numero_operacion"],
+    # La última fila no vacía es la nota al pie de la hoja
+    drop_trailing_rows=1,
+)
+
+_transformer = SpecTransformer(SPEC)
+
+def transform_rfmp_oper_dia(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Transforma los datos de la hoja BB_RFMPOperDia.
+    
+    Args:
+        df (pd.DataFrame): DataFrame original, completo o ya leído con READ_SPEC
+        
+    Returns:
+        pd.DataFrame: DataFrame transformado
+    """
+    return _transformer.transform(df)
+
+def transform_rfmp_oper_dia_batch(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Transforma varias fechas de BB_RFMPOperDia en una sola pasada.
+    
+    Args:
+        frames (List[pd.DataFrame]): DataFrames originales de la hoja, uno por fecha
+        
+    Returns:
+        pd.DataFrame: DataFrame transformado de todas las fechas
+    """
+    return _transformer.transform_batch(frames)
@@ -1,40 +1,62 @@
-import pandas as pd
-import sys
-import os
-
-# Agregar el directorio raíz del proyecto al path para importaciones
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
-
-# Importar desde la ubicación correcta
-from transformers.Sheet_transformers.funciones_de_limpieza import LimpiezaExcel
-
-def transform_rfv_trans_puesto_bolsa_mp(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Transforma los datos de la hoja BB_RFVTransPuestoBolsaMP.
-    
-    Args:
-        df (pd.DataFrame): DataFrame original
-        
-    Returns:
-        pd.DataFrame: DataFrame transformado
-    """
-    # Aplicar la función recortar_df dentro de la función de transformación
-    # Usar la segunda coincidencia de "Participante" y la primera de "Total"
-    df = LimpiezaExcel().recortar_df(df, columna=0, palabra_inicial="Participante", palabra_final="Total", n_inicial=2, n_final=1)
-    
-    # Seleccionar solo las columnas necesarias
-    df = LimpiezaExcel().seleccionar_columnas(df, [0, 1, 2, 3, 7])
-
-    # Renombrar las columnas
-    df.columns = [
-        "participante", 
-        'transado_usd',
-        'usd_equivalente_dop',
-        'transado_dop',
-        'fecha'
-    ]
-    
-    # Limpiar espacios en blanco de la columna participante
-    df['participante'] = df['participante'].str.strip()
-    
-    return df
+import pandas as pd
+import sys
+import os
+from typing import List
+
+# Agregar el directorio raíz del proyecto al path para importaciones
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Importar desde la ubicación correcta
+from extraction.sheet_read_spec import SheetReadSpec
+from transformers.base_transformer import SpecTransformer
+from transformers.sheet_spec import SheetSpec
+
+# Filas entre la segunda coincidencia de "Participante" y la primera de "Total", columnas 0 a 3
+READ_SPEC = SheetReadSpec(
+    columns=[0, 1, 2, 3],
+    start_anchor="Participante",
+    end_anchor="Total",
+    start_occurrence=2,
+)
+
+SPEC = SheetSpec(
+    name="BB_RFVTransPuestoBolsaMP",
+    read_spec=READ_SPEC,
+    columns={
+        0: "participante",
+        1: "transado_usd",
+        2: "usd_equivalente_dop",
+        3: "transado_dop",
+        "Fecha": "fecha",
+    },
+    strip_columns=["participante"],
+    category_columns=["participante"],
+    numeric_columns=["transado_usd", "usd_equivalente_dop", "transado_dop"],
+    date_columns=["fecha"],
+)
+
+_transformer = SpecTransformer(SPEC)
+
+def transform_rfv_trans_puesto_bolsa_mp(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Transforma los datos de la hoja BB_RFVTransPuestoBolsaMP.
+    
+    Args:
+        df (pd.DataFrame): DataFrame original, completo o ya leído con READ_SPEC
+        
+    Returns:
+        pd.DataFrame: DataFrame transformado
+    """
+    return _transformer.transform(df)
+
+def transform_rfv_trans_puesto_bolsa_mp_batch(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Transforma varias fechas de BB_RFVTransPuestoBolsaMP en una sola pasada.
+    
+    Args:
+        frames (List[pd.DataFrame]): DataFrames originales de la hoja, uno por fecha
+        
+    Returns:
+        pd.DataFrame: DataFrame transformado de todas las fechas
+    """
+    return _transformer.transform_batch(frames)
@@ -1,103 +1,74 @@
-"""
-Transformador para la hoja ResumenGeneralmercado.
-Desarrollo y limpieza de datos.
-#Esta pendiente el cambio de las funciones de limpieza
-
-"""
-
-import pandas as pd
-import sys
-import os
-
-# Agregar el directorio raíz del proyecto al path para importaciones
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
-
-def transform_resumen_general_mercado(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Transforma el DataFrame de ResumenGeneralmercado.
-    
-    Args:
-        df (pd.DataFrame): DataFrame original de ResumenGeneralmercado
-        
-    Returns:
-        pd.DataFrame: DataFrame transformado
-    """
-    def recortar_df(df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Recorta del dataframe las filas que estén en el rango definido.
-        """
-        # Buscar "Operaciones del Día"
-        inicio_mask = df.iloc[:, 0].str.contains("Operaciones del Día", na=False)
-        if not inicio_mask.any():
-            return df
-        
-        inicio_idx = inicio_mask.idxmax()
-        
-        # Buscar "Acumulado de la Semana"
-        fin_mask = df.iloc[:, 0].str.contains("Acumulado de la Semana", na=False)
-        if not fin_mask.any():
-            # Si no encuentra el fin, usar todo el DataFrame desde el inicio
-            return df.iloc[inicio_idx+1:].reset_index(drop=True)
-        
-        fin_idx = fin_mask.idxmax()
-        return df.iloc[inicio_idx+2:fin_idx].reset_index(drop=True)
-    
-
-    def eliminar_filas_innecesarias(df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Elimina filas que contengan nombres específicos en la columna 0.
-        """
-        # Lista de nombres a eliminar
-        nombres_a_eliminar = [
-            "Mercado de Renta Fija",
-            "Mercado de Renta Variable", 
-            "Total Día",
-        ]
-        # Crear máscara para identificar filas a eliminar
-        filas_a_eliminar = (df.iloc[:, 0].str.contains('|'.join(nombres_a_eliminar), na=False))
-        
-        # Eliminar las filas que contengan esos nombres
-        df_limpio = df[~filas_a_eliminar].reset_index(drop=True)
-        
-        return df_limpio
-
-    def seleccionar_columnas(df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Selecciona solo las columnas necesarias: Fecha y las columnas 1, 4, 5, 6, 7
-        """
-        # Seleccionar columnas específicas por posición
-        columnas_seleccionadas = df.iloc[:, [2, 3, 5, 6, 7, 8]]  # Fecha está en la columna 0
-        return columnas_seleccionadas
-
-    def definir_columnas(df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Define los nombres de las columnas según el orden especificado.
-        """
-        df.columns = [
-            "mercado", 
-            'transado_usd',
-            'usd_equivalente_dop',
-            'transado_dop',
-            'total_transado_dop',
-            'fecha'
-        ]
-        
-        # Limpiar el campo mercado eliminando espacios en blanco y caracteres especiales
-        df['mercado'] = df['mercado'].str.strip().str.replace('\n', ' ').str.replace('\r', ' ')
-        
-        # Eliminar caracteres especiales y normalizar espacios múltiples
-        df['mercado'] = df['mercado'].str.replace(r'\s+', ' ', regex=True)
-        
-        # Convertir a mayúsculas para consistencia
-        df['mercado'] = df['mercado'].str.upper()
-        # Eliminar filas donde la columna "mercado" tenga valores nulos
-        df = df.dropna(subset=["mercado"]).reset_index(drop=True)
-        
-        return df
-    
-    # Aplicar las transformaciones en orden correcto
-    df = recortar_df(df)
-    df = eliminar_filas_innecesarias(df)
-    df = seleccionar_columnas(df)
-    df = definir_columnas(df)
-    return df
+"""
+Transformador para la hoja ResumenGeneralmercado.
+Desarrollo y limpieza de datos.
+#Esta pendiente el cambio de las funciones de limpieza
+
+"""
+
+import pandas as pd
+import sys
+import os
+from typing import List
+
+# Agregar el directorio raíz del proyecto al path para importaciones
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from extraction.sheet_read_spec import SheetReadSpec
+from transformers.base_transformer import SpecTransformer
+from transformers.sheet_spec import SheetSpec
+
+# Filas entre "Operaciones del Día" (sin su fila de encabezados) y "Acumulado de la Semana";
+# la columna 0 se lee solo para descartar las filas de subtotales
+READ_SPEC = SheetReadSpec(
+    columns=[0, 2, 3, 5, 6, 7],
+    start_anchor="Operaciones del Día",
+    end_anchor="Acumulado de la Semana",
+    skip_rows_after_start=1,
+)
+
+SPEC = SheetSpec(
+    name="BB_ResumenGeneralMercado",
+    read_spec=READ_SPEC,
+    columns={
+        2: "mercado",
+        3: "transado_usd",
+        5: "usd_equivalente_dop",
+        6: "transado_dop",
+        7: "total_transado_dop",
+        "Fecha": "fecha",
+    },
+    # Filas de subtotales
+    exclude_rows={0: ["Mercado de Renta Fija", "Mercado de Renta Variable", "Total Día"]},
+    # Sin espacios ni saltos de línea sobrantes y en mayúsculas para consistencia
+    normalize_columns=["mercado"],
+    numeric_columns=["transado_usd", "usd_equivalente_dop", "transado_dop", "total_transado_dop"],
+    date_columns=["fecha"],
+    category_columns=["mercado"],
+    critical_columns=["mercado"],
+)
+
+_transformer = SpecTransformer(SPEC)
+
+def transform_resumen_general_mercado(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Transforma el DataFrame de ResumenGeneralmercado.
+    
+    Args:
+        df (pd.DataFrame): DataFrame de ResumenGeneralmercado, completo o ya leído con READ_SPEC
+        
+    Returns:
+        pd.DataFrame: DataFrame transformado
+    """
+    return _transformer.transform(df)
+
+def transform_resumen_general_mercado_batch(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Transforma varias fechas de ResumenGeneralmercado en una sola pasada.
+    
+    Args:
+        frames (List[pd.DataFrame]): DataFrames originales de la hoja, uno por fecha
+        
+    Returns:
+        pd.DataFrame: DataFrame transformado de todas las fechas
+    """
+    return _transformer.transform_batch(frames)
@@ -1,21 +1,24 @@
-# Sheet transformers package for BVRD data pipeline 
-
-from .BB_ResumenGeneralMercado import transform_resumen_general_mercado
-from .BB_RFVTransPuestoBolsaMP import transform_rfv_trans_puesto_bolsa_mp
-from .BB_RFMPOperDia import transform_rfmp_oper_dia
-from .BB_RFMPOperDiaFirme import transform_rfmp_oper_dia_firme
-from .BB_RFMSOperDia import transform_rfms_oper_dia
-from .BB_RFMSOperPlazos import transform_rfms_oper_plazos
-from .BB_RentaFijaOperacionesFuturasA import transform_renta_fija_operaciones_futuras
-from .BB_RFEmisionesCorpV import transform_rf_emisiones_corp_v
-
-__all__ = [
-    'transform_resumen_general_mercado',
-    'transform_rfv_trans_puesto_bolsa_mp',
-    'transform_rfmp_oper_dia',
-    'transform_rfmp_oper_dia_firme',
-    'transform_rfms_oper_dia',
-    'transform_rfms_oper_plazos',
-    'transform_renta_fija_operaciones_futuras',
-    'transform_rf_emisiones_corp_v'
+# Sheet transformers package for BVRD data pipeline 
+
+from .BB_ResumenGeneralMercado import transform_resumen_general_mercado, transform_resumen_general_mercado_batch
+from .BB_RFVTransPuestoBolsaMP import transform_rfv_trans_puesto_bolsa_mp, transform_rfv_trans_puesto_bolsa_mp_batch
+from .BB_RFMPOperDia import transform_rfmp_oper_dia, transform_rfmp_oper_dia_batch
+from .BB_RFMPOperDiaFirme import transform_rfmp_oper_dia_firme
+from .BB_RFMSOperDia import transform_rfms_oper_dia
+from .BB_RFMSOperPlazos import transform_rfms_oper_plazos
+from .BB_RentaFijaOperacionesFuturasA import transform_renta_fija_operaciones_futuras
+from .BB_RFEmisionesCorpV import transform_rf_emisiones_corp_v
+
+__all__ = [
+    'transform_resumen_general_mercado',
+    'transform_resumen_general_mercado_batch',
+    'transform_rfv_trans_puesto_bolsa_mp',
+    'transform_rfv_trans_puesto_bolsa_mp_batch',
+    'transform_rfmp_oper_dia',
+    'transform_rfmp_oper_dia_batch',
+    'transform_rfmp_oper_dia_firme',
+    'transform_rfms_oper_dia',
+    'transform_rfms_oper_plazos',
+    'transform_renta_fija_operaciones_futuras',
+    'transform_rf_emisiones_corp_v'
 ] 
\ No newline at end of file
@@ -1,101 +1,147 @@
-"""
-BANCO DE FUNCIONES DE LIMPIEZA DE DATOS
-=======================================
-
-Este módulo contiene funciones útiles para la limpieza y procesamiento de DataFrames.
-Cada función está documentada con su propósito, parámetros y ejemplos de uso.
-
-Autor: Francisco Castillo
-Fecha de creación: 19/06/2025
-Última actualización: 19/06/2025
-"""
-
-import pandas as pd
-import numpy as np
-from typing import Union, List, Optional
-
-
-# =============================================================================
-# FUNCIÓN 1: RECORTE DE DATAFRAMES
-# =============================================================================
-
-class LimpiezaExcel:
-    """
-    Clase para realizar operaciones de limpieza y procesamiento de DataFrames de Excel.
-    
-    Esta clase contiene métodos útiles para la limpieza y procesamiento de datos
-    extraídos de archivos Excel, incluyendo recorte de DataFrames, limpieza de columnas,
-    y otras operaciones comunes de limpieza de datos.
-    """
-    
-    def __init__(self):
-        """
-        Inicializa la clase LimpiezaExcel.
-        """
-        pass
-    def recortar_df(self, df: pd.DataFrame, columna: Union[int, str] = 0, palabra_inicial: str = None, palabra_final: str = None, n_inicial: int = 1, n_final: int = 1) -> pd.DataFrame:
-        """
-        Recorta el DataFrame excluyendo las filas que contienen palabra_inicial y palabra_final (coincidencia parcial).
-        Permite elegir la n-ésima coincidencia de cada palabra.
-        
-        Args:
-            df: DataFrame a procesar.
-            columna: Índice o nombre de la columna donde buscar las palabras (por defecto 0).
-            palabra_inicial: Palabra que marca el inicio del recorte (requerido).
-            palabra_final: Palabra que marca el fin del recorte (opcional).
-            n_inicial: Número de coincidencia de palabra_inicial a usar (por defecto 1, es decir, la primera).
-            n_final: Número de coincidencia de palabra_final a usar (por defecto 1, es decir, la primera).
-        
-        Returns:
-            DataFrame recortado desde después de palabra_inicial hasta antes de palabra_final.
-            
-        Raises:
-            ValueError: Si no se encuentra la coincidencia requerida para palabra_inicial o palabra_final, o si la columna no existe.
-        """
-        if palabra_inicial is None:
-            raise ValueError("Debe proporcionar una palabra_inicial para el recorte")
-
-        # Obtener columna objetivo
-        if isinstance(columna, str):
-            if columna not in df.columns:
-                raise ValueError(f"La columna '{columna}' no existe en el DataFrame")
-            columna_data = df[columna]
-        else:
-            if columna >= len(df.columns):
-                raise ValueError(f"El índice de columna {columna} está fuera de rango")
-            columna_data = df.iloc[:, columna]
-
-        columna_str = columna_data.astype(str).str.lower().str.strip()
-
-        # Buscar la n-ésima coincidencia de palabra_inicial
-        idxs_inicio = columna_str[columna_str.str.contains(palabra_inicial.lower(), na=False)].index
-        if len(idxs_inicio) < n_inicial:
-            raise ValueError(f"No se encontró la {n_inicial}-ésima coincidencia para '{palabra_inicial}'")
-        idx_inicio = idxs_inicio[n_inicial - 1]
-
-        if palabra_final:
-            idxs_final = columna_str[columna_str.str.contains(palabra_final.lower(), na=False)].index
-            if len(idxs_final) < n_final:
-                raise ValueError(f"No se encontró la {n_final}-ésima coincidencia para '{palabra_final}'")
-            idx_final = idxs_final[n_final - 1]
-            
-            return df.iloc[idx_inicio + 1: idx_final].reset_index(drop=True)
-        else:
-            return df.iloc[idx_inicio + 1:].reset_index(drop=True)
-        
-    def seleccionar_columnas(self, df: pd.DataFrame, columnas: List[int]) -> pd.DataFrame:
-        """
-        Selecciona solo las columnas necesarias: Fecha y las columnas 1, 4, 5, 6, 7
-        """
-        # Seleccionar columnas específicas por posición
-        df = df.iloc[:, columnas].reset_index(drop=True)  # Fecha está en la columna 0
-        return df
-    
-    def eliminar_filas_con_valor_en_columna(self, df: pd.DataFrame, columna: str, valor: str) -> pd.DataFrame:
-        """
-        Elimina las filas que contienen el valor en la columna especificada.
-        """
-        df = df[df[columna] != valor]
-        return df
-
-
+"""
+BANCO DE FUNCIONES DE LIMPIEZA DE DATOS
+=======================================
+
+Este módulo contiene funciones útiles para la limpieza y procesamiento de DataFrames.
+Cada función está documentada con su propósito, parámetros y ejemplos de uso.
+
+Autor: Francisco Castillo
+Fecha de creación: 19/06/2025
+Última actualización: 19/06/2025
+"""
+
+import os
+import sys
+import weakref
+import pandas as pd
+import numpy as np
+from typing import Dict, Union, List, Optional, Tuple
+
+# Agregar el directorio raíz del proyecto al path para importaciones
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from extraction.sheet_read_spec import Anchor, SectionLocator
+
+
+# =============================================================================
+# FUNCIÓN 1: RECORTE DE DATAFRAMES
+# =============================================================================
+
+class LimpiezaExcel:
+    """
+    Clase para realizar operaciones de limpieza y procesamiento de DataFrames de Excel.
+    
+    Esta clase contiene métodos útiles para la limpieza y procesamiento de datos
+    extraídos de archivos Excel, incluyendo recorte de DataFrames, limpieza de columnas,
+    y otras operaciones comunes de limpieza de datos.
+    """
+    
+    def __init__(self):
+        """
+        Inicializa la clase LimpiezaExcel.
+        """
+        # Localizador por (DataFrame, columna): la columna se normaliza una sola vez por DataFrame
+        self._localizadores: Dict[Tuple[int, Union[int, str]], Tuple[weakref.ref, SectionLocator]] = {}
+    
+    def localizador(self, df: pd.DataFrame, columna: Union[int, str] = 0) -> SectionLocator:
+        """
+        Devuelve el localizador de secciones de una columna del DataFrame, reutilizándolo
+        mientras el DataFrame exista.
+        
+        Args:
+            df: DataFrame a procesar.
+            columna: Índice o nombre de la columna donde buscar las anclas (por defecto 0).
+            
+        Returns:
+            SectionLocator: Localizador con la columna ya normalizada.
+            
+        Raises:
+            ValueError: Si la columna no existe.
+        """
+        clave = (id(df), columna)
+        entrada = self._localizadores.get(clave)
+        if entrada is not None and entrada[0]() is df:
+            return entrada[1]
+        
+        # Obtener columna objetivo
+        if isinstance(columna, str):
+            if columna not in df.columns:
+                raise ValueError(f"La columna '{columna}' no existe en el DataFrame")
+            columna_data = df[columna]
+        else:
+            if columna >= len(df.columns):
+                raise ValueError(f"El índice de columna {columna} está fuera de rango")
+            columna_data = df.iloc[:, columna]
+        
+        localizador = SectionLocator(columna_data)
+        # Las entradas de DataFrames ya liberados se descartan solas
+        self._localizadores[clave] = (weakref.ref(df, lambda _, clave=clave: self._localizadores.pop(clave, None)),
+                                      localizador)
+        return localizador
+    
+    def recortar_df(self, df: pd.DataFrame, columna: Union[int, str] = 0, palabra_inicial: str = None, palabra_final: str = None, n_inicial: int = 1, n_final: int = 1) -> pd.DataFrame:
+        """
+        Recorta el DataFrame excluyendo las filas que contienen palabra_inicial y palabra_final (coincidencia parcial).
+        Permite elegir la n-ésima coincidencia de cada palabra.
+        
+        Args:
+            df: DataFrame a procesar.
+            columna: Índice o nombre de la columna donde buscar las palabras (por defecto 0).
+            palabra_inicial: Palabra que marca el inicio del recorte (requerido).
+            palabra_final: Palabra que marca el fin del recorte (opcional).
+            n_inicial: Número de coincidencia de palabra_inicial a usar (por defecto 1, es decir, la primera).
+            n_final: Número de coincidencia de palabra_final a usar (por defecto 1, es decir, la primera).
+        
+        Returns:
+            DataFrame recortado desde después de palabra_inicial hasta antes de palabra_final.
+            
+        Raises:
+            ValueError: Si no se encuentra la coincidencia requerida para palabra_inicial o palabra_final, o si la columna no existe.
+        """
+        if palabra_inicial is None:
+            raise ValueError("Debe proporcionar una palabra_inicial para el recorte")
+
+        final = (palabra_final, n_final) if palabra_final else None
+        return self.recortar_secciones(df, [((palabra_inicial, n_inicial), final)], columna)[0]
+    
+    def recortar_secciones(self, df: pd.DataFrame, secciones: List[Tuple[Anchor, Optional[Anchor]]],
+                           columna: Union[int, str] = 0) -> List[pd.DataFrame]:
+        """
+        Recorta varios bloques de una misma hoja; todas las anclas se buscan en una sola pasada.
+        
+        Args:
+            df: DataFrame a procesar.
+            secciones: Lista de (ancla inicial, ancla final o None = hasta el final). Cada ancla es
+                       un texto (primera coincidencia) o (texto, n-ésima coincidencia).
+            columna: Índice o nombre de la columna donde buscar las anclas (por defecto 0).
+        
+        Returns:
+            Lista de DataFrames, uno por sección, sin las filas de las anclas.
+            
+        Raises:
+            ValueError: Si no se encuentra alguna coincidencia requerida, o si la columna no existe.
+            
+        Example:
+            >>> limpieza = LimpiezaExcel()
+            >>> compras, ventas = limpieza.recortar_secciones(df, [(("Participante", 1), "Total"),
+            ...                                                    (("Participante", 2), ("Total", 2))])
+        """
+        ventanas = self.localizador(df, columna).sections(secciones)
+        return [df.iloc[inicio:fin].reset_index(drop=True) for inicio, fin in ventanas]
+        
+    def seleccionar_columnas(self, df: pd.DataFrame, columnas: List[int]) -> pd.DataFrame:
+        """
+        Selecciona solo las columnas necesarias: Fecha y las columnas 1, 4, 5, 6, 7
+        """
+        # Seleccionar columnas específicas por posición
+        df = df.iloc[:, columnas].reset_index(drop=True)  # Fecha está en la columna 0
+        return df
+    
+    def eliminar_filas_con_valor_en_columna(self, df: pd.DataFrame, columna: str, valor: str) -> pd.DataFrame:
+        """
+        Elimina las filas que contienen el valor en la columna especificada.
+        """
+        df = df[df[columna] != valor]
+        return df
+
+
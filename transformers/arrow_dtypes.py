@@ -0,0 +1,68 @@
+"""
+Tipos Arrow de extremo a extremo.
+Cuando la extracción entrega columnas Arrow (ScraperBase.DTYPE_BACKEND = "pyarrow"), los
+transformadores devuelven también columnas Arrow: texto como string, números como double
+con nulos en lugar de NaN y fechas como date32, que los cargadores envían a la base de datos
+sin formatearlas a texto.
+"""
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype, is_bool_dtype, is_datetime64_dtype, is_numeric_dtype
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow es opcional: sin él las hojas se extraen con los tipos originales
+    pa = None
+
+
+def is_arrow_frame(df: pd.DataFrame) -> bool:
+    """
+    Indica si el DataFrame viene de una extracción con columnas Arrow.
+    """
+    return any(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+
+
+def arrow_dtype(values: pd.Series):
+    """
+    Tipo Arrow de una columna transformada, o None si debe quedar como está
+    (ya es Arrow, es categórica o es texto mezclado con otros valores).
+    """
+    dtype = values.dtype
+    if isinstance(dtype, (pd.ArrowDtype, pd.CategoricalDtype)):
+        return None
+    if is_datetime64_dtype(dtype):
+        # Las fechas de los boletines son días: date32 salvo que alguna tenga hora
+        stamps = values.to_numpy()
+        if (stamps.astype('datetime64[D]') == stamps)[~np.isnat(stamps)].all():
+            return pd.ArrowDtype(pa.date32())
+        return pd.ArrowDtype(pa.timestamp('us'))
+    if is_numeric_dtype(dtype) or is_bool_dtype(dtype):
+        return pd.ArrowDtype(pa.from_numpy_dtype(dtype))
+    if infer_dtype(values, skipna=True) in ("string", "empty"):
+        return pd.ArrowDtype(pa.string())
+    return None
+
+
+def to_arrow_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convierte en sitio las columnas numpy de un DataFrame transformado a tipos Arrow.
+    Los NaN y NaT pasan a nulos; las columnas categóricas se conservan.
+
+    Args:
+        df (pd.DataFrame): DataFrame transformado (propiedad de quien llama)
+
+    Returns:
+        pd.DataFrame: El mismo DataFrame
+
+    Example:
+        >>> to_arrow_dtypes(df).dtypes
+        fecha              date32[day][pyarrow]
+        transado_usd       double[pyarrow]
+    """
+    for position in range(df.shape[1]):
+        values = df.iloc[:, position]
+        dtype = arrow_dtype(values)
+        if dtype is not None:
+            df.isetitem(position, values.astype(dtype))
+    return df
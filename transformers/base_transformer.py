@@ -1,143 +1,506 @@
-import pandas as pd
-from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
-import numpy as np
-
-class BaseTransformer(ABC):
-    """
-    Clase base abstracta para todos los transformadores de hojas.
-    Define la interfaz común y proporciona utilidades compartidas.
-    """
-    
-    def __init__(self):
-        self.required_columns = []
-        self.output_columns = []
-        self.date_columns = []
-        self.numeric_columns = []
-        
-    @abstractmethod
-    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Método principal de transformación que debe ser implementado por cada transformador específico.
-        
-        Args:
-            df (pd.DataFrame): DataFrame original a transformar
-            
-        Returns:
-            pd.DataFrame: DataFrame transformado
-        """
-        pass
-    
-    def validate_input(self, df: pd.DataFrame) -> bool:
-        """
-        Valida que el DataFrame de entrada tenga las columnas requeridas.
-        
-        Args:
-            df (pd.DataFrame): DataFrame a validar
-            
-        Returns:
-            bool: True si el DataFrame es válido, False en caso contrario
-        """
-        missing_columns = [col for col in self.required_columns if col not in df.columns]
-        if missing_columns:
-            print(f"Error: Faltan las siguientes columnas requeridas: {missing_columns}")
-            return False
-        return True
-    
-    def clean_numeric_columns(self, df: pd.DataFrame, columns: Optional[list] = None) -> pd.DataFrame:
-        """
-        Limpia y convierte columnas numéricas, manejando diferentes formatos.
-        
-        Args:
-            df (pd.DataFrame): DataFrame a limpiar
-            columns (list, optional): Lista de columnas a limpiar. Si es None, usa self.numeric_columns
-            
-        Returns:
-            pd.DataFrame: DataFrame con columnas numéricas limpias
-        """
-        columns = columns or self.numeric_columns
-        df_copy = df.copy()
-        
-        for col in columns:
-            if col in df_copy.columns:
-                # Convertir a string primero para manejar diferentes tipos de datos
-                df_copy[col] = df_copy[col].astype(str)
-                
-                # Limpiar caracteres no numéricos excepto punto y coma
-                df_copy[col] = df_copy[col].str.replace('[^0-9\.\-\,]', '', regex=True)
-                
-                # Reemplazar coma por punto si es separador decimal
-                df_copy[col] = df_copy[col].str.replace(',', '.')
-                
-                # Convertir a float
-                df_copy[col] = pd.to_numeric(df_copy[col], errors='coerce')
-                
-        return df_copy
-    
-    def clean_date_columns(self, df: pd.DataFrame, columns: Optional[list] = None, 
-                         format: str = '%d/%m/%Y') -> pd.DataFrame:
-        """
-        Limpia y convierte columnas de fecha al formato especificado.
-        
-        Args:
-            df (pd.DataFrame): DataFrame a limpiar
-            columns (list, optional): Lista de columnas a limpiar. Si es None, usa self.date_columns
-            format (str): Formato esperado de las fechas
-            
-        Returns:
-            pd.DataFrame: DataFrame con columnas de fecha limpias
-        """
-        columns = columns or self.date_columns
-        df_copy = df.copy()
-        
-        for col in columns:
-            if col in df_copy.columns:
-                df_copy[col] = pd.to_datetime(df_copy[col], format=format, errors='coerce')
-                
-        return df_copy
-    
-    def drop_empty_rows(self, df: pd.DataFrame, subset: Optional[list] = None) -> pd.DataFrame:
-        """
-        Elimina filas que están completamente vacías en las columnas especificadas.
-        
-        Args:
-            df (pd.DataFrame): DataFrame a limpiar
-            subset (list, optional): Lista de columnas a considerar
-            
-        Returns:
-            pd.DataFrame: DataFrame sin filas vacías
-        """
-        return df.dropna(subset=subset or self.required_columns, how='all')
-    
-    def standardize_column_names(self, df: pd.DataFrame) -> pd.DataFrame:
-        """
-        Estandariza los nombres de las columnas: lowercase, sin espacios ni caracteres especiales.
-        
-        Args:
-            df (pd.DataFrame): DataFrame a estandarizar
-            
-        Returns:
-            pd.DataFrame: DataFrame con nombres de columnas estandarizados
-        """
-        df_copy = df.copy()
-        df_copy.columns = df_copy.columns.str.lower()
-        df_copy.columns = df_copy.columns.str.normalize('NFKD').str.encode('ascii', errors='ignore').str.decode('utf-8')
-        df_copy.columns = df_copy.columns.str.replace('[^0-9a-zA-Z]+', '_', regex=True)
-        df_copy.columns = df_copy.columns.str.strip('_')
-        return df_copy
-    
-    def add_metadata(self, df: pd.DataFrame, metadata: Dict[str, Any]) -> pd.DataFrame:
-        """
-        Agrega columnas de metadata al DataFrame.
-        
-        Args:
-            df (pd.DataFrame): DataFrame original
-            metadata (dict): Diccionario con metadata a agregar
-            
-        Returns:
-            pd.DataFrame: DataFrame con metadata agregada
-        """
-        df_copy = df.copy()
-        for key, value in metadata.items():
-            df_copy[key] = value
-        return df_copy 
\ No newline at end of file
+import logging
+import pandas as pd
+from abc import ABC, abstractmethod
+from typing import Optional, Dict, Any, Sequence
+import numpy as np
+from pandas.api.types import is_datetime64_any_dtype, is_object_dtype
+
+from .arrow_dtypes import is_arrow_frame, to_arrow_dtypes
+from .category_dictionary import get_category_dictionary
+from .date_parser import parse_dates
+from .distinct_values import factorize_in_blocks
+from .numeric_parser import parse_numeric
+from .polars_backend import execute_plan_polars, pl
+from .sheet_spec import SheetSpec, TransformPlan
+
+logger = logging.getLogger(__name__)
+
+# Motores que ejecutan los planes compilados
+PANDAS_BACKEND = "pandas"
+POLARS_BACKEND = "polars"
+
+_backend = PANDAS_BACKEND
+_sort_output = True
+
+
+def get_transform_backend() -> str:
+    """
+    Motor con que se ejecutan los planes de transformación en este proceso.
+    """
+    return _backend
+
+
+def use_transform_backend(backend: Optional[str]) -> str:
+    """
+    Selecciona el motor de los planes de transformación del proceso ("pandas" o "polars").
+    Si se pide Polars y no está instalado, se sigue con pandas.
+    
+    Args:
+        backend (Optional[str]): Motor a usar. None equivale a "pandas".
+        
+    Returns:
+        str: Motor efectivo
+        
+    Raises:
+        ValueError: Si el motor no existe
+        
+    Example:
+        >>> previous = get_transform_backend()
+        >>> use_transform_backend("polars")
+        >>> ...
+        >>> use_transform_backend(previous)
+    """
+    global _backend
+    backend = backend or PANDAS_BACKEND
+    if backend not in (PANDAS_BACKEND, POLARS_BACKEND):
+        raise ValueError(f"Motor de transformación desconocido: {backend}")
+    if backend == POLARS_BACKEND and pl is None:
+        logger.info("polars no está instalado, los planes se ejecutan con pandas")
+        backend = PANDAS_BACKEND
+    _backend = backend
+    return backend
+
+
+def get_output_sort() -> bool:
+    """
+    Indica si los planes de este proceso ordenan su salida por sort_by.
+    """
+    return _sort_output
+
+
+def use_output_sort(sort: bool) -> bool:
+    """
+    Activa o desactiva el orden final de los planes (sort_by) en este proceso.
+    La base de datos no necesita el orden: sin él la salida queda en el orden de la hoja.
+    
+    Args:
+        sort (bool): Ordenar la salida por sort_by
+        
+    Returns:
+        bool: Valor anterior
+        
+    Example:
+        >>> previous = use_output_sort(False)
+        >>> ...
+        >>> use_output_sort(previous)
+    """
+    global _sort_output
+    previous, _sort_output = _sort_output, bool(sort)
+    return previous
+
+
+class BaseTransformer(ABC):
+    """
+    Clase base abstracta para todos los transformadores de hojas.
+    Define la interfaz común y proporciona utilidades compartidas.
+    
+    Propiedad de los DataFrames: por defecto las utilidades no modifican el DataFrame recibido;
+    devuelven una copia superficial (comparte los datos de las columnas que no tocan) en la que
+    solo se reemplazan las columnas convertidas. Con inplace=True modifican y devuelven el mismo
+    DataFrame, para encadenarlas sobre un DataFrame que ya es propiedad de quien llama.
+    """
+    
+    def __init__(self, spec: Optional[SheetSpec] = None):
+        """
+        Args:
+            spec (Optional[SheetSpec]): Especificación declarativa de la hoja. Si se indica,
+                                        se compila una sola vez en self.plan.
+        """
+        self.required_columns = []
+        self.output_columns = []
+        self.date_columns = []
+        self.numeric_columns = []
+        self.spec = spec
+        self.plan: Optional[TransformPlan] = None
+        
+        if spec is not None:
+            self.plan = spec.compile()
+            self.required_columns = list(spec.critical_columns)
+            self.output_columns = [target for _, target in self.plan.columns]
+            self.date_columns = list(spec.date_columns)
+            self.numeric_columns = list(spec.numeric_columns)
+        
+    @abstractmethod
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Método principal de transformación que debe ser implementado por cada transformador específico.
+        
+        Args:
+            df (pd.DataFrame): DataFrame original a transformar
+            
+        Returns:
+            pd.DataFrame: DataFrame transformado
+        """
+        pass
+    
+    def execute_plan(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Ejecuta el plan compilado de la hoja en una sola pasada: cada columna de salida se
+        toma del DataFrame de entrada y se convierte una vez, las filas se filtran con una única
+        máscara combinada y el resultado se construye y ordena una sola vez (sin orden con
+        use_output_sort(False)).
+        El DataFrame de entrada no se modifica y el resultado no comparte memoria con él:
+        se asigna una sola vez, al final, y pertenece a quien llama (p. ej. el cargador puede
+        modificarlo en sitio). Si la entrada tiene columnas Arrow, la salida también
+        (ver arrow_dtypes.to_arrow_dtypes).
+        
+        Args:
+            df (pd.DataFrame): Hoja extraída (completa o ya leída con read_spec)
+            
+        Returns:
+            pd.DataFrame: DataFrame transformado
+        """
+        plan = self._require_plan()
+        if plan.read_spec is not None:
+            df = plan.read_spec.apply(df)
+        return self._run_plan(df, np.zeros(1, dtype=np.int64))
+    
+    def execute_plan_batch(self, frames: Sequence[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Ejecuta el plan sobre varias fechas de la misma hoja en una sola pasada.
+        La ventana de filas de read_spec se aplica a cada libro por separado; luego las
+        ventanas se concatenan y la limpieza, conversión, filtrado y orden se hacen una sola
+        vez sobre el conjunto (los valores repetidos entre fechas se convierten una vez).
+        drop_trailing_rows se sigue aplicando al final de cada libro y sort_by ordena el
+        conjunto completo.
+        
+        Args:
+            frames (Sequence[pd.DataFrame]): Hojas extraídas, una por fecha
+            
+        Returns:
+            pd.DataFrame: DataFrame transformado de todas las fechas
+            
+        Example:
+            >>> df_transformed = transformer.execute_plan_batch([df_17, df_18, df_19])
+        """
+        plan = self._require_plan()
+        windows = []
+        for df in frames:
+            if plan.read_spec is not None:
+                # Los encabezados leídos cambian entre libros: se etiqueta por posición
+                # (la 'Fecha' agregada sigue al final con su nombre)
+                df = plan.read_spec.apply(df).copy(deep=False)
+                labels = list(range(df.shape[1]))
+                if len(labels) and df.columns[-1] == 'Fecha':
+                    labels[-1] = 'Fecha'
+                df.columns = labels
+            windows.append(df)
+        if not windows:
+            return pd.DataFrame(columns=self.output_columns)
+        
+        starts = np.cumsum([0] + [len(window) for window in windows[:-1]])
+        return self._run_plan(pd.concat(windows, ignore_index=True), starts)
+    
+    def _require_plan(self) -> TransformPlan:
+        if self.plan is None:
+            raise ValueError("El transformador no tiene especificación que ejecutar")
+        return self.plan
+    
+    @staticmethod
+    def _drop_trailing_rows(rows: np.ndarray, starts: np.ndarray, count: int) -> np.ndarray:
+        """
+        Quita las últimas count filas conservadas de cada libro (segmentos que empiezan en starts).
+        """
+        segment = np.searchsorted(starts, rows, side='right') - 1
+        # Índice en rows de la última fila de cada segmento, y distancia de cada fila a ella
+        last = np.flatnonzero(np.r_[segment[1:] != segment[:-1], True])
+        from_end = last[np.searchsorted(last, np.arange(len(rows)))] - np.arange(len(rows))
+        return rows[from_end >= count]
+    
+    def _run_plan(self, df: pd.DataFrame, starts: np.ndarray) -> pd.DataFrame:
+        """
+        Cuerpo de execute_plan sobre un DataFrame ya recortado; starts son las posiciones
+        donde empieza cada libro (una sola en el caso normal). El plan se ejecuta con el
+        motor del proceso (ver use_transform_backend).
+        """
+        plan = self.plan
+        
+        # Columnas de salida (vistas de las columnas de entrada, sin copiar el DataFrame)
+        if plan.keep_unmapped:
+            columns = {plan.rename.get(label, label): series for label, series in df.items()}
+        else:
+            columns = {
+                target: df.iloc[:, source] if isinstance(source, int) else df[source]
+                for source, target in plan.columns
+            }
+        
+        if _backend == POLARS_BACKEND:
+            df_transformed = execute_plan_polars(plan, df, columns, starts, sort=_sort_output)
+        else:
+            df_transformed = self._run_plan_pandas(df, columns, starts)
+        
+        # Al final, para que el orden anterior siga siendo alfabético y no por código
+        if plan.category_columns:
+            dictionary = get_category_dictionary()
+            for col in plan.category_columns:
+                if col in df_transformed.columns:
+                    df_transformed[col] = dictionary.encode(col, df_transformed[col])
+        
+        # Entrada Arrow (extracción con dtype_backend="pyarrow"): la salida también es Arrow
+        if is_arrow_frame(df):
+            to_arrow_dtypes(df_transformed)
+        return df_transformed
+    
+    def _run_plan_pandas(self, df: pd.DataFrame, columns: Dict[str, pd.Series], starts: np.ndarray) -> pd.DataFrame:
+        """
+        Ejecuta el plan con pandas. Solo las columnas que deciden las filas (críticas, de orden y
+        las fechas de sus diferencias en días) se limpian y convierten completas; las demás se
+        recortan primero a las filas de salida y se convierten directamente en la salida, así el
+        pico de memoria queda en torno a un DataFrame de salida.
+        """
+        plan = self.plan
+        
+        # Filas a descartar según el contenido original de la hoja
+        keep = None
+        for source, pattern in plan.exclude_rows:
+            values = df.iloc[:, source] if isinstance(source, int) else df[source]
+            if isinstance(values.dtype, pd.ArrowDtype):
+                # Las columnas Arrow buscan con su propio motor de expresiones, que recibe el texto
+                pattern = pattern.pattern
+            excluded = values.str.contains(pattern, na=False).to_numpy(dtype=bool)
+            keep = ~excluded if keep is None else keep & ~excluded
+        
+        day_diffs = {
+            col: bounds for col, bounds in plan.day_diff_columns.items()
+            if col not in columns and all(bound in columns for bound in bounds)
+        }
+        row_columns = set(plan.critical_columns) | (set(plan.sort_by) if _sort_output else set())
+        for col in row_columns & set(day_diffs):
+            row_columns.update(day_diffs[col])
+        
+        # Columnas que deciden las filas, completas
+        full = {}
+        for col in row_columns:
+            if col in columns:
+                full[col] = self._convert_column(col, columns[col])
+        for col in row_columns & set(day_diffs):
+            start_col, end_col = day_diffs[col]
+            full[col] = (full[end_col] - full[start_col]).dt.days
+        
+        for col in plan.critical_columns:
+            present = full[col].notna().to_numpy()
+            keep = present if keep is None else keep & present
+        
+        # Filas de salida como posiciones: filtro, filas finales y orden se resuelven antes de copiar
+        rows = np.arange(len(df)) if keep is None else np.flatnonzero(keep)
+        if plan.drop_trailing_rows:
+            rows = self._drop_trailing_rows(rows, starts, plan.drop_trailing_rows)
+        if plan.sort_by and _sort_output:
+            sort_keys = pd.DataFrame({col: full[col] for col in plan.sort_by}, copy=False).take(rows)
+            order = sort_keys.reset_index(drop=True).sort_values(plan.sort_by, ascending=plan.ascending).index
+            rows = rows[order.to_numpy()]
+        
+        # Única copia del resultado: cada columna se selecciona una vez y se convierte ya recortada
+        index = pd.RangeIndex(len(rows))
+        output = {}
+        for col, values in columns.items():
+            if col in full:
+                output[col] = self._take(full.pop(col), rows, index)
+            else:
+                output[col] = self._convert_column(col, self._take(values, rows, index))
+        for col, (start_col, end_col) in day_diffs.items():
+            output[col] = self._take(full[col], rows, index) if col in full else \
+                (output[end_col] - output[start_col]).dt.days
+        return pd.DataFrame(output, copy=False)
+    
+    @staticmethod
+    def _take(values: pd.Series, rows: np.ndarray, index: pd.Index) -> pd.Series:
+        """
+        Filas rows de una columna, con el índice de la salida (sin armar el índice seleccionado).
+        """
+        return pd.Series(values.array.take(rows), index=index, name=values.name, dtype=values.dtype, copy=False)
+    
+    def _convert_column(self, col: str, values: pd.Series) -> pd.Series:
+        """
+        Limpieza de texto y conversión de una columna según el plan (la columna se devuelve
+        tal cual si el plan no la toca).
+        """
+        plan = self.plan
+        mode = plan.text.get(col)
+        if mode is not None:
+            values = self._clean_text(values, mode)
+        
+        conversion = plan.conversions.get(col)
+        if conversion == TransformPlan.DATE:
+            # El formato inferido en una fecha se reutiliza en las siguientes
+            values, plan.date_formats[col] = parse_dates(values, plan.date_formats.get(col))
+        elif conversion is not None:
+            values = parse_numeric(values, percent=conversion == TransformPlan.PERCENT)
+        return values
+    
+    @staticmethod
+    def _clean_text(values: pd.Series, mode: str) -> pd.Series:
+        """
+        Limpieza de texto de una columna. En las columnas object solo se limpian los valores
+        distintos y las filas comparten el texto limpio (no se crea una cadena por fila); los
+        nulos se conservan tal cual.
+        """
+        def clean(texts: pd.Series) -> pd.Series:
+            texts = texts.str.strip()
+            if mode == TransformPlan.UPPER:
+                texts = texts.str.upper()
+            elif mode == TransformPlan.NORMALIZE:
+                texts = texts.str.replace(r'\s+', ' ', regex=True).str.upper()
+            return texts
+        
+        if not is_object_dtype(values.dtype):
+            return clean(values)
+        codes, uniques = factorize_in_blocks(values)
+        cleaned = clean(pd.Series(uniques, dtype=object)).to_numpy(dtype=object)
+        result = np.append(cleaned, None)[codes]
+        missing = codes < 0
+        if missing.any():
+            result[missing] = values.to_numpy()[missing]
+        return pd.Series(result, index=values.index, name=values.name, dtype=object, copy=False)
+    
+    def validate_input(self, df: pd.DataFrame) -> bool:
+        """
+        Valida que el DataFrame de entrada tenga las columnas requeridas.
+        
+        Args:
+            df (pd.DataFrame): DataFrame a validar
+            
+        Returns:
+            bool: True si el DataFrame es válido, False en caso contrario
+        """
+        missing_columns = [col for col in self.required_columns if col not in df.columns]
+        if missing_columns:
+            print(f"Error: Faltan las siguientes columnas requeridas: {missing_columns}")
+            return False
+        return True
+    
+    def clean_numeric_columns(self, df: pd.DataFrame, columns: Optional[list] = None,
+                              inplace: bool = False) -> pd.DataFrame:
+        """
+        Limpia y convierte columnas numéricas, manejando diferentes formatos
+        (separadores de miles, coma decimal, %, $, 'días' y negativos entre paréntesis).
+        
+        Args:
+            df (pd.DataFrame): DataFrame a limpiar
+            columns (list, optional): Lista de columnas a limpiar. Si es None, usa self.numeric_columns
+            inplace (bool): Si es True, modifica y devuelve el mismo DataFrame
+            
+        Returns:
+            pd.DataFrame: DataFrame con columnas numéricas limpias
+        """
+        columns = columns or self.numeric_columns
+        df_copy = df if inplace else df.copy(deep=False)
+        
+        for col in columns:
+            if col in df_copy.columns:
+                df_copy[col] = parse_numeric(df_copy[col])
+                
+        return df_copy
+    
+    def clean_date_columns(self, df: pd.DataFrame, columns: Optional[list] = None, 
+                         format: str = '%d/%m/%Y', inplace: bool = False) -> pd.DataFrame:
+        """
+        Limpia y convierte columnas de fecha al formato especificado.
+        
+        Args:
+            df (pd.DataFrame): DataFrame a limpiar
+            columns (list, optional): Lista de columnas a limpiar. Si es None, usa self.date_columns
+            format (str): Formato esperado de las fechas
+            inplace (bool): Si es True, modifica y devuelve el mismo DataFrame
+            
+        Returns:
+            pd.DataFrame: DataFrame con columnas de fecha limpias
+        """
+        columns = columns or self.date_columns
+        df_copy = df if inplace else df.copy(deep=False)
+        
+        for col in columns:
+            if col in df_copy.columns and not is_datetime64_any_dtype(df_copy[col].dtype):
+                # Solo se convierten los valores distintos; los códigos los reparten a las filas
+                codes, uniques = factorize_in_blocks(df_copy[col])
+                converted = pd.to_datetime(pd.Series(uniques, dtype=object), format=format, errors='coerce')
+                df_copy[col] = pd.Series(converted.array.take(codes, allow_fill=True), index=df_copy.index)
+                
+        return df_copy
+    
+    def drop_empty_rows(self, df: pd.DataFrame, subset: Optional[list] = None) -> pd.DataFrame:
+        """
+        Elimina filas que están completamente vacías en las columnas especificadas.
+        
+        Args:
+            df (pd.DataFrame): DataFrame a limpiar
+            subset (list, optional): Lista de columnas a considerar
+            
+        Returns:
+            pd.DataFrame: DataFrame sin filas vacías
+        """
+        return df.dropna(subset=subset or self.required_columns, how='all')
+    
+    def standardize_column_names(self, df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        """
+        Estandariza los nombres de las columnas: lowercase, sin espacios ni caracteres especiales.
+        
+        Args:
+            df (pd.DataFrame): DataFrame a estandarizar
+            inplace (bool): Si es True, renombra y devuelve el mismo DataFrame
+            
+        Returns:
+            pd.DataFrame: DataFrame con nombres de columnas estandarizados
+        """
+        # Solo cambian las etiquetas: la copia superficial no duplica los datos
+        df_copy = df if inplace else df.copy(deep=False)
+        names = df_copy.columns.str.lower()
+        names = names.str.normalize('NFKD').str.encode('ascii', errors='ignore').str.decode('utf-8')
+        names = names.str.replace('[^0-9a-zA-Z]+', '_', regex=True)
+        df_copy.columns = names.str.strip('_')
+        return df_copy
+    
+    def add_metadata(self, df: pd.DataFrame, metadata: Dict[str, Any], inplace: bool = False) -> pd.DataFrame:
+        """
+        Agrega columnas de metadata al DataFrame.
+        
+        Args:
+            df (pd.DataFrame): DataFrame original
+            metadata (dict): Diccionario con metadata a agregar
+            inplace (bool): Si es True, agrega las columnas al mismo DataFrame
+            
+        Returns:
+            pd.DataFrame: DataFrame con metadata agregada
+        """
+        df_copy = df if inplace else df.copy(deep=False)
+        for key, value in metadata.items():
+            df_copy[key] = value
+        return df_copy
+
+
+class SpecTransformer(BaseTransformer):
+    """
+    Transformador genérico de una hoja descrita por una SheetSpec.
+    Agregar una hoja nueva solo requiere declarar su especificación.
+    
+    Example:
+        >>> transformer = SpecTransformer(SPEC)
+        >>> df_transformed = transformer.transform(df)
+    """
+    
+    def __init__(self, spec: SheetSpec):
+        super().__init__(spec)
+    
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Transforma la hoja ejecutando el plan compilado de su especificación.
+        
+        Args:
+            df (pd.DataFrame): DataFrame original de la hoja
+            
+        Returns:
+            pd.DataFrame: DataFrame transformado
+        """
+        return self.execute_plan(df)
+    
+    def transform_batch(self, frames: Sequence[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Transforma varias fechas de la hoja en una sola pasada (ver execute_plan_batch).
+        
+        Args:
+            frames (Sequence[pd.DataFrame]): DataFrames originales de la hoja, uno por fecha
+            
+        Returns:
+            pd.DataFrame: DataFrame transformado de todas las fechas
+        """
+        return self.execute_plan_batch(frames)
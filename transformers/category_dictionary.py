@@ -0,0 +1,173 @@
+"""
+Diccionario persistente de categorías para las columnas de texto repetitivo
+(mercado, participante, rueda, emisor, moneda...).
+Cada columna guarda sus valores en orden de aparición y solo agrega los nuevos, de modo que
+el código de un valor es el mismo en todas las fechas y ejecuciones y los DataFrames de
+distintas fechas se pueden concatenar sin perder el tipo categórico.
+Solo conviene para columnas de pocos valores distintos: el diccionario nunca olvida un valor.
+Los valores nuevos se guardan en disco una vez por ejecución, con flush().
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CATEGORIES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'cache', 'categories.json')
+
+
+class CategoryDictionary:
+    """
+    Categorías compartidas por nombre de columna de salida.
+
+    Example:
+        >>> dictionary = CategoryDictionary()
+        >>> df['moneda'] = dictionary.encode('moneda', df['moneda'])
+        >>> df['moneda'].cat.codes   # estables entre fechas
+        >>> dictionary.flush()       # al terminar la ejecución
+    """
+
+    def __init__(self, path: Optional[str] = CATEGORIES_FILE):
+        """
+        Args:
+            path (Optional[str]): Archivo JSON del diccionario. Si es None, el diccionario
+                                  vive solo en memoria (p. ej. en los procesos de transformación).
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._categories: Dict[str, List[str]] = self._load()
+        self._dtypes: Dict[str, pd.CategoricalDtype] = {}
+        # Hay valores registrados que aún no están en disco
+        self._dirty = False
+
+    def _load(self) -> Dict[str, List[str]]:
+        if self.path is None:
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Diccionario de categorías ilegible, se reconstruirá: {e}")
+            return {}
+
+    def dtype(self, column: str) -> pd.CategoricalDtype:
+        """
+        Tipo categórico actual de la columna (todas las categorías conocidas, en orden de aparición).
+        """
+        with self._lock:
+            if column not in self._dtypes:
+                self._dtypes[column] = pd.CategoricalDtype(self._categories.get(column, []))
+            return self._dtypes[column]
+
+    def encode(self, column: str, values: pd.Series) -> pd.Series:
+        """
+        Convierte una columna de texto a categórica con las categorías compartidas,
+        registrando los valores que aún no estaban en el diccionario (se guardan con flush()).
+
+        Args:
+            column (str): Nombre de la columna de salida (p. ej. 'moneda')
+            values (pd.Series): Valores de texto o categóricos (p. ej. codificados con otro
+                                diccionario); los nulos quedan como nulos
+
+        Returns:
+            pd.Series: Columna categórica
+        """
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Se recodifica por valor sin pasar por texto; los nuevos se registran en orden de aparición
+            self._register(column, values.dropna().unique())
+            return values.cat.set_categories(self.dtype(column).categories)
+
+        uniques = values.dropna().unique()
+        if any(not isinstance(value, str) for value in uniques):
+            values = values.where(values.isna(), values.astype(str))
+            uniques = values.dropna().unique()
+
+        self._register(column, uniques)
+        return values.astype(self.dtype(column))
+
+    def _register(self, column: str, values) -> None:
+        """
+        Agrega al final de la columna los valores que aún no conoce (en memoria).
+        """
+        known = self.dtype(column).categories
+        new = [value for value in values if value not in known]
+        if new:
+            with self._lock:
+                self._categories[column] = self._categories.get(column, []) + list(new)
+                self._dtypes.pop(column, None)
+                self._dirty = True
+
+    def flush(self) -> None:
+        """
+        Guarda el diccionario si se registraron valores nuevos desde la última escritura.
+        """
+        with self._lock:
+            if self._dirty:
+                self._save()
+                self._dirty = False
+
+    def align(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Lleva las columnas categóricas del diccionario a sus categorías actuales, para que
+        DataFrames transformados en fechas distintas se concatenen sin volver a texto.
+        Como las categorías solo crecen al final, los códigos existentes no cambian.
+
+        Args:
+            df (pd.DataFrame): DataFrame transformado (se modifica en sitio)
+
+        Returns:
+            pd.DataFrame: El mismo DataFrame
+
+        Example:
+            >>> year = pd.concat([dictionary.align(df) for df in frames], ignore_index=True)
+        """
+        for col in df.columns:
+            if isinstance(df[col].dtype, pd.CategoricalDtype) and col in self._categories:
+                dtype = self.dtype(col)
+                if df[col].dtype != dtype:
+                    df[col] = df[col].cat.set_categories(dtype.categories)
+        return df
+
+    def _save(self) -> None:
+        """
+        Escribe el diccionario de forma atómica (se llama con el lock tomado).
+        """
+        if self.path is None:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self._categories, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+_shared_dictionary = None
+
+
+def get_category_dictionary() -> CategoryDictionary:
+    """
+    Diccionario compartido por todos los transformadores del proceso (se carga al primer uso).
+    """
+    global _shared_dictionary
+    if _shared_dictionary is None:
+        _shared_dictionary = CategoryDictionary()
+    return _shared_dictionary
+
+
+def use_category_dictionary(dictionary: CategoryDictionary) -> None:
+    """
+    Reemplaza el diccionario compartido del proceso. Los procesos de transformación en paralelo
+    usan uno en memoria y el proceso principal recodifica sus resultados con el persistente,
+    para que los códigos no dependan de qué proceso vio primero cada valor.
+    """
+    global _shared_dictionary
+    _shared_dictionary = dictionary
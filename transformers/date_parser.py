@@ -0,0 +1,143 @@
+"""
+Conversión de columnas de fecha de los boletines a datetime64.
+El formato se infiere una vez por columna a partir de una muestra y solo se convierten
+los valores distintos de la columna; el resultado se reparte a las filas por código.
+"""
+
+import warnings
+from datetime import date, datetime
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
+
+from .distinct_values import factorize_in_blocks
+
+# Formatos candidatos, en orden de preferencia (día primero, como en los boletines de la BVRD)
+DATE_FORMATS = [
+    '%d-%m-%Y',
+    '%d/%m/%Y',
+    '%Y-%m-%d',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y/%m/%d',
+    '%d-%m-%y',
+    '%d/%m/%y',
+    '%d.%m.%Y',
+]
+
+# Valores distintos usados para inferir el formato de una columna
+DATE_SAMPLE_SIZE = 50
+
+# Resolución de salida: cubre fechas hasta 9999-12-31 (vencimientos "perpetuos")
+DATE_DTYPE = 'datetime64[us]'
+
+
+def infer_date_format(samples: Sequence[str]) -> Optional[str]:
+    """
+    Elige el formato de DATE_FORMATS que convierte más valores de la muestra.
+
+    Args:
+        samples (Sequence[str]): Textos de fecha de la columna (idealmente distintos)
+
+    Returns:
+        Optional[str]: Formato strptime, o None si ninguno convierte algún valor
+
+    Example:
+        >>> infer_date_format(['03-04-2025', '18-03-2025'])
+        '%d-%m-%Y'
+    """
+    if len(samples) == 0:
+        return None
+    sample = pd.Series(list(samples), dtype=object)
+    best_format, best_hits = None, 0
+    for fmt in DATE_FORMATS:
+        hits = int(pd.to_datetime(sample, format=fmt, errors='coerce').notna().sum())
+        if hits > best_hits:
+            best_format, best_hits = fmt, hits
+            if hits == len(sample):
+                break
+    return best_format
+
+
+def _parse_unknown(text: str) -> pd.Timestamp:
+    """
+    Último recurso para un valor que no sigue el formato de su columna.
+    """
+    try:
+        with warnings.catch_warnings():
+            # dayfirst no aplica a los textos ISO; pandas avisa pero los convierte bien
+            warnings.simplefilter('ignore', UserWarning)
+            return pd.to_datetime(text, dayfirst=True)
+    except (ValueError, OverflowError):
+        return pd.NaT
+
+
+def parse_dates(values: pd.Series, fmt: Optional[str] = None) -> Tuple[pd.Series, Optional[str]]:
+    """
+    Convierte una columna a datetime64.
+
+    Las columnas ya convertidas se devuelven tal cual. En las demás se factoriza la columna:
+    los objetos fecha de Excel pasan directo y los textos distintos se convierten con el formato
+    de la columna (inferido si no se indica o si ya no aplica a la mayoría); los que no lo siguen
+    se convierten uno a uno. Los valores que no son fecha quedan en NaT.
+
+    Args:
+        values (pd.Series): Columna a convertir
+        fmt (Optional[str]): Formato conocido de la columna (p. ej. inferido en una fecha anterior)
+
+    Returns:
+        Tuple[pd.Series, Optional[str]]: Columna datetime64 y formato usado, para reutilizarlo
+
+    Example:
+        >>> fechas, fmt = parse_dates(pd.Series(['18-03-2025', '18-03-2025', None]))
+        >>> fmt
+        '%d-%m-%Y'
+    """
+    if is_datetime64_any_dtype(values.dtype):
+        return values, fmt
+
+    codes, uniques = factorize_in_blocks(values)
+    parsed = pd.Series(pd.NaT, index=range(len(uniques)), dtype=DATE_DTYPE)
+
+    is_date = np.fromiter((isinstance(u, (datetime, date, np.datetime64)) for u in uniques),
+                          dtype=bool, count=len(uniques))
+    if is_date.any():
+        parsed[is_date] = pd.to_datetime(pd.Series(uniques[is_date], dtype=object), errors='coerce').to_numpy()
+
+    is_text = np.fromiter((isinstance(u, str) for u in uniques), dtype=bool, count=len(uniques))
+    if is_text.any():
+        texts = pd.Series(uniques[is_text], dtype=object).str.strip()
+        converted = None
+        if fmt is not None:
+            converted = pd.to_datetime(texts, format=fmt, errors='coerce')
+        if converted is None or converted.isna().mean() > 0.5:
+            fmt = infer_date_format(texts.iloc[:DATE_SAMPLE_SIZE].tolist())
+            if fmt is not None:
+                converted = pd.to_datetime(texts, format=fmt, errors='coerce')
+            else:
+                converted = pd.Series(pd.NaT, index=texts.index, dtype=DATE_DTYPE)
+        converted = converted.astype(DATE_DTYPE)
+
+        failed = (converted.isna() & (texts != '')).to_numpy()
+        if failed.any():
+            converted[failed] = [_parse_unknown(text) for text in texts[failed]]
+        parsed[is_text] = converted.to_numpy()
+
+    # Un NaT agregado al final recibe los nulos (código -1): una sola selección, sin máscaras
+    result = np.append(parsed.to_numpy(), np.datetime64('NaT'))[codes]
+    return pd.Series(result, index=values.index, name=values.name, copy=False), fmt
+
+
+def ensure_datetime(values: pd.Series) -> pd.Series:
+    """
+    Devuelve la columna como datetime64, convirtiéndola solo si aún no lo es.
+    Los cargadores la usan para no volver a convertir fechas que ya vienen del transformador.
+
+    Args:
+        values (pd.Series): Columna de fechas
+
+    Returns:
+        pd.Series: Columna datetime64
+    """
+    return parse_dates(values)[0]
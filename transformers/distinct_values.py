@@ -0,0 +1,49 @@
+"""
+Factorización por bloques de las columnas de las hojas.
+Los parsers de número y fecha y la limpieza de texto trabajan sobre los valores distintos de
+cada columna. pd.factorize arma una tabla hash del tamaño de la columna completa; por bloques,
+la memoria temporal queda acotada por FACTORIZE_BLOCK_ROWS y no por el largo de la hoja.
+"""
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+# Filas por bloque: la tabla hash de un bloque ocupa unas decenas de bytes por fila
+FACTORIZE_BLOCK_ROWS = 16384
+
+
+def factorize_in_blocks(values: pd.Series, block_rows: int = FACTORIZE_BLOCK_ROWS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Equivalente a pd.factorize (nulos con código -1, valores distintos en orden de aparición)
+    con la memoria temporal acotada por block_rows.
+
+    Args:
+        values (pd.Series): Columna a factorizar
+        block_rows (int): Filas por bloque
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Códigos por fila y valores distintos (object)
+
+    Example:
+        >>> factorize_in_blocks(pd.Series(['a', None, 'b', 'a']), block_rows=2)
+        (array([ 0, -1,  1,  0]), array(['a', 'b'], dtype=object))
+    """
+    if len(values) <= block_rows:
+        codes, uniques = pd.factorize(values)
+        return codes, np.asarray(uniques, dtype=object)
+
+    codes = np.empty(len(values), dtype=np.intp)
+    # Valor distinto -> código global (los valores iguales para pandas también lo son aquí)
+    positions = {}
+    for start in range(0, len(values), block_rows):
+        block_codes, block_uniques = pd.factorize(values.iloc[start:start + block_rows])
+        remap = np.fromiter((positions.setdefault(value, len(positions)) for value in block_uniques),
+                            dtype=np.intp, count=len(block_uniques))
+        # Un -1 agregado al final recibe los nulos del bloque
+        codes[start:start + block_rows] = np.append(remap, -1)[block_codes]
+
+    uniques = np.empty(len(positions), dtype=object)
+    uniques[:] = list(positions)
+    return codes, uniques
@@ -0,0 +1,125 @@
+"""
+Conversión de texto numérico de los boletines a float.
+Reconoce separadores de miles, comas decimales, %, $, "días" y negativos entre paréntesis
+en una sola pasada por valor, y convierte cada valor distinto de una columna una sola vez.
+"""
+
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+from .distinct_values import factorize_in_blocks
+
+# Valores distintos recordados entre columnas y fechas (precios, tasas y plazos se repiten mucho)
+PARSE_CACHE_SIZE = 65536
+
+# Texto que no forma parte del número: monedas, %, unidades de plazo y espacios
+# (los patrones también los usan las expresiones del backend Polars)
+NOISE_PATTERN = r'RD\$|US\$|[$%\s]|d[ií]as?'
+THOUSANDS_COMMA_PATTERN = r'^[+-]?\d{1,3}(,\d{3})+$'
+THOUSANDS_DOT_PATTERN = r'^[+-]?\d{1,3}(\.\d{3}){2,}$'
+
+_NOISE = re.compile(NOISE_PATTERN, re.IGNORECASE)
+_THOUSANDS_COMMA = re.compile(THOUSANDS_COMMA_PATTERN)
+_THOUSANDS_DOT = re.compile(THOUSANDS_DOT_PATTERN)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_number(text: str) -> float:
+    """
+    Convierte un texto numérico a float.
+
+    Reglas:
+        - '(1,234.50)' es negativo.
+        - Con coma y punto, el separador que aparece último es el decimal ('1,234.5' y '1.234,5').
+        - Solo con comas: '1,234' o '1,234,567' son miles; '7,25' es coma decimal.
+        - Solo con puntos: '1.234.567' son miles; '1.234' es decimal.
+
+    Args:
+        text (str): Texto a convertir (p. ej. '1,234.50', '5.25%', '$ 100', '30 días', '(3)')
+
+    Returns:
+        float: Valor numérico, o NaN si el texto no es un número
+
+    Example:
+        >>> parse_number('(1.234,50)')
+        -1234.5
+    """
+    value = text.strip()
+    negative = value.startswith('(') and value.endswith(')')
+    if negative:
+        value = value[1:-1]
+    value = _NOISE.sub('', value)
+
+    comma, dot = value.rfind(','), value.rfind('.')
+    if comma != -1:
+        if dot > comma:
+            value = value.replace(',', '')
+        elif dot != -1:
+            value = value.replace('.', '').replace(',', '.')
+        elif _THOUSANDS_COMMA.match(value):
+            value = value.replace(',', '')
+        else:
+            value = value.replace(',', '.')
+    elif _THOUSANDS_DOT.match(value):
+        value = value.replace('.', '')
+
+    try:
+        number = float(value)
+    except ValueError:
+        return np.nan
+    return -number if negative else number
+
+
+def parse_numeric(values: pd.Series, percent: bool = False) -> pd.Series:
+    """
+    Convierte una columna a float64.
+
+    Las columnas ya numéricas se devuelven tal cual (sin copia). En las demás se factoriza la
+    columna y solo se convierten sus valores distintos: primero con el parser vectorizado de
+    pandas y, para los que no son números limpios, con parse_number (memoizado). El resultado
+    se reparte a las filas con los códigos de la factorización.
+
+    Args:
+        values (pd.Series): Columna a convertir (texto, números o mezcla)
+        percent (bool): Si es True, el resultado se divide entre 100
+
+    Returns:
+        pd.Series: Columna float64 con NaN en los valores no numéricos
+
+    Example:
+        >>> parse_numeric(pd.Series(['1,234.5', '5%', None, '(3)']))
+        0    1234.5
+        1       5.0
+        2       NaN
+        3      -3.0
+        dtype: float64
+    """
+    if is_numeric_dtype(values.dtype) and not is_bool_dtype(values.dtype):
+        return values / 100 if percent else values
+
+    codes, uniques = factorize_in_blocks(values)
+    parsed = np.full(len(uniques), np.nan)
+
+    is_number = np.fromiter(
+        (isinstance(u, (int, float, np.number)) and not isinstance(u, (bool, np.bool_)) for u in uniques),
+        dtype=bool, count=len(uniques)
+    )
+    parsed[is_number] = uniques[is_number].astype(float)
+
+    is_text = np.fromiter((isinstance(u, str) for u in uniques), dtype=bool, count=len(uniques))
+    if is_text.any():
+        texts = uniques[is_text]
+        converted = pd.to_numeric(pd.Series(texts, dtype=object), errors='coerce').to_numpy(dtype=float, copy=True)
+        dirty = np.isnan(converted)
+        converted[dirty] = [parse_number(text) for text in texts[dirty]]
+        parsed[is_text] = converted
+
+    # Un NaN agregado al final recibe los nulos (código -1): una sola selección, sin máscaras
+    result = np.append(parsed, np.nan)[codes]
+    if percent:
+        result /= 100
+    return pd.Series(result, index=values.index, name=values.name, copy=False)
@@ -0,0 +1,239 @@
+"""
+Ejecución en paralelo de los transformadores de hojas.
+Cada partición (hoja, fecha o lote de fechas) se transforma en un proceso del pool y los
+resultados se entregan en el orden de envío. Los resultados (columnas ya tipadas) y las hojas
+extraídas con columnas Arrow (dtype_backend="pyarrow") viajan como flujos Arrow IPC cuando
+pyarrow está instalado. Las hojas crudas con columnas object viajan con pickle: cada columna
+mezcla encabezados de texto, números y fechas, y pasarlas a texto en el proceso principal
+cuesta más que serializarlas (y cambiaría lo que ven los transformadores).
+"""
+
+import logging
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Optional, Tuple
+
+import pandas as pd
+from pandas.api.types import infer_dtype, is_object_dtype
+
+from .arrow_dtypes import is_arrow_frame
+from .base_transformer import POLARS_BACKEND, get_output_sort, get_transform_backend, use_output_sort, use_transform_backend
+from .category_dictionary import CategoryDictionary, get_category_dictionary, use_category_dictionary
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow es opcional: sin él los DataFrames viajan con pickle
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+# Particiones en vuelo por proceso: acota la memoria sin dejar procesos ociosos
+IN_FLIGHT_PER_WORKER = 2
+
+# ("arrow", bytes IPC, attrs) o ("pickle", DataFrame, {})
+Payload = Tuple[str, Any, Dict[str, Any]]
+
+# Marca en los attrs del payload de los DataFrames con columnas Arrow (no llega al DataFrame reconstruido)
+ARROW_FRAME_ATTR = "__arrow_frame"
+
+
+def to_payload(df: pd.DataFrame, use_arrow: bool = True) -> Payload:
+    """
+    Prepara un DataFrame para enviarlo a otro proceso.
+    Se usa un flujo Arrow IPC si pyarrow está instalado y las columnas se representan en Arrow
+    sin cambiar de tipo; las hojas crudas con columnas object que mezclan texto, números y fechas
+    se envían con pickle (Arrow convertiría, p. ej., 0 y 101373.14 a double).
+
+    Args:
+        df (pd.DataFrame): DataFrame a enviar
+        use_arrow (bool): Intentar Arrow IPC
+
+    Returns:
+        Payload: Contenido serializable para from_payload
+    """
+    if use_arrow and pa is not None and all(
+        infer_dtype(values, skipna=True) in ("string", "empty")
+        for _, values in df.items() if is_object_dtype(values.dtype)
+    ):
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowException, ValueError, TypeError):
+            pass
+        else:
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            attrs = dict(df.attrs)
+            if is_arrow_frame(df):
+                attrs[ARROW_FRAME_ATTR] = True
+            return "arrow", sink.getvalue().to_pybytes(), attrs
+    return "pickle", df, {}
+
+
+def _arrow_types(arrow_type):
+    # Los diccionarios vuelven como categóricas (como las deja to_arrow_dtypes); el resto como ArrowDtype
+    return None if pa.types.is_dictionary(arrow_type) else pd.ArrowDtype(arrow_type)
+
+
+def from_payload(payload: Payload) -> pd.DataFrame:
+    """
+    Reconstruye el DataFrame enviado con to_payload.
+    Los DataFrames que tenían columnas Arrow las recuperan como ArrowDtype, no como numpy.
+    """
+    kind, data, attrs = payload
+    if kind == "arrow":
+        attrs = dict(attrs)
+        types_mapper = _arrow_types if attrs.pop(ARROW_FRAME_ATTR, False) else None
+        df = pa.ipc.open_stream(data).read_all().to_pandas(types_mapper=types_mapper)
+        df.attrs.update(attrs)
+        return df
+    return data
+
+
+def _init_worker(backend: str, sort_output: bool) -> None:
+    # Cada proceso codifica con un diccionario en memoria; el principal recodifica con el persistente
+    use_category_dictionary(CategoryDictionary(path=None))
+    use_transform_backend(backend)
+    use_output_sort(sort_output)
+
+
+def _run_transform(transformer: Callable[[Any], pd.DataFrame], payload: Any, use_arrow: bool) -> Payload:
+    """
+    Tarea del pool: reconstruye la entrada (un DataFrame o una lista de DataFrames para los
+    transformadores por lotes), la transforma y devuelve el resultado serializado.
+    """
+    if isinstance(payload, list):
+        data = [from_payload(item) for item in payload]
+    else:
+        data = from_payload(payload)
+    return to_payload(transformer(data), use_arrow)
+
+
+class ParallelTransformExecutor:
+    """
+    Pool de procesos para transformar particiones independientes en paralelo.
+
+    Los transformadores deben ser funciones de módulo (se envían por referencia), como las de
+    transformers.Sheet_transformers. Las columnas categóricas de los resultados se recodifican
+    en este proceso con el diccionario compartido, en el orden de envío, así que los códigos son
+    los mismos que en una ejecución secuencial.
+
+    Example:
+        >>> with ParallelTransformExecutor(workers=4) as executor:
+        ...     for key, df_transformed, error in executor.map(tasks):
+        ...         ...
+    """
+
+    def __init__(self, workers: Optional[int] = None, use_arrow: bool = True, backend: Optional[str] = None):
+        """
+        Args:
+            workers (Optional[int]): Procesos del pool. Si es None, uno por núcleo menos el principal.
+            use_arrow (bool): Enviar como Arrow IPC, si pyarrow está instalado, los resultados y
+                              las hojas extraídas con columnas Arrow
+            backend (Optional[str]): Motor de los planes en los procesos ("pandas" o "polars").
+                                     Si es None, el de este proceso. El orden de salida
+                                     (use_output_sort) siempre es el de este proceso.
+        """
+        self.workers = workers or max(1, (os.cpu_count() or 1) - 1)
+        if use_arrow and pa is None:
+            logger.info("pyarrow no está instalado, los DataFrames se envían a los procesos con pickle")
+        self.use_arrow = use_arrow and pa is not None
+        self.backend = backend or get_transform_backend()
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "ParallelTransformExecutor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Cierra el pool de procesos.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """
+        Pool de procesos, creado la primera vez que se usa.
+        """
+        if self._pool is None:
+            # Polars no admite fork una vez iniciado su pool de hilos: con ese motor los procesos se crean con spawn
+            context = multiprocessing.get_context("spawn") if self.backend == POLARS_BACKEND else None
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                             initializer=_init_worker, initargs=(self.backend, get_output_sort()))
+        return self._pool
+
+    def submit(self, transformer: Callable[[Any], pd.DataFrame], data: Any) -> Future:
+        """
+        Envía una partición al pool.
+
+        Args:
+            transformer (Callable): Transformador de la hoja (función de módulo)
+            data (Any): DataFrame, o lista de DataFrames para un transformador por lotes
+
+        Returns:
+            Future: Resultado serializado; se obtiene con collect()
+        """
+        if isinstance(data, list):
+            payload = [self._input_payload(df) for df in data]
+        else:
+            payload = self._input_payload(data)
+        return self._get_pool().submit(_run_transform, transformer, payload, self.use_arrow)
+
+    def _input_payload(self, df: pd.DataFrame) -> Payload:
+        """
+        Entrada de una tarea: Arrow IPC solo para hojas con columnas Arrow; las hojas crudas
+        con columnas object van directo con pickle, sin revisar sus tipos.
+        """
+        return to_payload(df, self.use_arrow and is_arrow_frame(df))
+    
+    def collect(self, future: Future) -> pd.DataFrame:
+        """
+        Espera el resultado de una partición y recodifica sus columnas categóricas.
+        """
+        df = from_payload(future.result())
+        dictionary = get_category_dictionary()
+        for col in df.columns:
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = dictionary.encode(col, df[col])
+        return df
+
+    def map(self, tasks: Iterable[Tuple[Hashable, Callable[[Any], pd.DataFrame], Any]]
+            ) -> Iterator[Tuple[Hashable, Optional[pd.DataFrame], Optional[Exception]]]:
+        """
+        Transforma las tareas en paralelo y entrega los resultados en el orden de envío.
+        Las tareas se consumen a medida que hay lugar en la ventana (IN_FLIGHT_PER_WORKER por
+        proceso), así que pueden venir de un generador que todavía está descargando.
+
+        Args:
+            tasks (Iterable): (clave, transformador, DataFrame o lista de DataFrames)
+
+        Yields:
+            Tuple: (clave, DataFrame transformado o None, excepción o None)
+        """
+        window = IN_FLIGHT_PER_WORKER * self.workers
+        in_flight = deque()  # (clave, Future)
+
+        def next_result() -> Tuple[Hashable, Optional[pd.DataFrame], Optional[Exception]]:
+            key, future = in_flight.popleft()
+            try:
+                return key, self.collect(future), None
+            except Exception as e:
+                return key, None, e
+
+        try:
+            for key, transformer, data in tasks:
+                in_flight.append((key, self.submit(transformer, data)))
+                while len(in_flight) >= window:
+                    yield next_result()
+            while in_flight:
+                yield next_result()
+        finally:
+            # Si el consumidor abandona el generador, no seguir transformando
+            for _, future in in_flight:
+                future.cancel()
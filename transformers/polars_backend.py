@@ -0,0 +1,397 @@
+"""
+Backend Polars para los planes de transformación de las hojas.
+El plan compilado (TransformPlan) se expresa como una sola consulta LazyFrame sobre las columnas
+crudas de la hoja: primero se descartan las filas excluidas y las que no tienen columnas
+críticas, luego se quitan las filas finales de cada libro y recién entonces se limpian y
+convierten las demás columnas, con expresiones de Polars (str.replace_all, cast y
+str.strptime) que se ejecutan en varios hilos. Solo se materializan las filas y columnas de
+salida, que vuelven a pandas con to_pandas y los mismos tipos que el backend pandas.
+"""
+
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_datetime64_dtype, is_numeric_dtype
+
+from .arrow_dtypes import is_arrow_frame
+from .date_parser import DATE_DTYPE, DATE_SAMPLE_SIZE, _parse_unknown, infer_date_format
+from .distinct_values import factorize_in_blocks
+from .numeric_parser import NOISE_PATTERN, THOUSANDS_COMMA_PATTERN, THOUSANDS_DOT_PATTERN, parse_number
+from .sheet_spec import TransformPlan
+
+try:
+    import polars as pl
+except ImportError:  # polars es opcional: sin él los planes se ejecutan con pandas
+    pl = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # solo hace falta con columnas Arrow
+    pa = None
+
+# Columna auxiliar de la consulta (no llega a la salida)
+ROW_COLUMN = "__row"
+
+# Partes de una columna cruda: una hoja de Excel mezcla texto, números y fechas en una columna
+TEXT = "text"
+NUMBER = "number"
+DATE = "date"
+
+
+def raw_parts(values: pd.Series) -> Dict[str, "pl.Series"]:
+    """
+    Separa una columna cruda de pandas en columnas de Polars por tipo de valor (texto, número y
+    fecha), sin convertir nada: cada conversión toma de ellas lo mismo que numeric_parser y
+    date_parser (los números pasan directo a número, los objetos fecha a fecha y los textos se
+    convierten). Solo se devuelven las partes que tienen algún valor.
+    Las columnas numéricas, de fecha y Arrow pasan enteras; las object se separan por valor
+    distinto y se reparten a las filas por código.
+
+    Args:
+        values (pd.Series): Columna cruda
+
+    Returns:
+        Dict[str, pl.Series]: Partes de la columna por tipo (TEXT, NUMBER, DATE)
+    """
+    dtype = values.dtype
+    series = None
+    if isinstance(dtype, pd.ArrowDtype):
+        series = pl.from_arrow(pa.array(values))
+    elif is_datetime64_dtype(dtype) or (is_numeric_dtype(dtype) and not is_bool_dtype(dtype)
+                                        and not isinstance(dtype, pd.CategoricalDtype)):
+        series = pl.Series(values.to_numpy(), nan_to_null=True)
+    if series is not None:
+        if series.dtype == pl.String:
+            return {TEXT: series}
+        if series.dtype.is_temporal():
+            return {DATE: series}
+        if series.dtype.is_numeric():
+            return {NUMBER: series}
+        return {}
+
+    codes, uniques = factorize_in_blocks(values)
+    # Los nulos (código -1) apuntan a un nulo agregado al final de cada parte
+    positions = pl.Series(np.where(codes >= 0, codes, len(uniques)))
+    parts = {}
+
+    texts = [u if isinstance(u, str) else None for u in uniques]
+    if any(text is not None for text in texts):
+        parts[TEXT] = pl.Series(texts + [None], dtype=pl.String).gather(positions)
+
+    is_number = np.fromiter(
+        (isinstance(u, (int, float, np.number)) and not isinstance(u, (bool, np.bool_)) for u in uniques),
+        dtype=bool, count=len(uniques)
+    )
+    if is_number.any():
+        numbers = np.full(len(uniques) + 1, np.nan)
+        numbers[:-1][is_number] = uniques[is_number].astype(float)
+        parts[NUMBER] = pl.Series(numbers, nan_to_null=True).gather(positions)
+
+    is_date = np.fromiter((isinstance(u, (datetime, date, np.datetime64)) for u in uniques),
+                          dtype=bool, count=len(uniques))
+    if is_date.any():
+        dates = np.full(len(uniques) + 1, np.datetime64('NaT'), dtype=DATE_DTYPE)
+        dates[:-1][is_date] = pd.to_datetime(pd.Series(uniques[is_date], dtype=object),
+                                             errors='coerce').astype(DATE_DTYPE).to_numpy()
+        parts[DATE] = pl.Series(dates).gather(positions)
+    return parts
+
+
+def _text_expression(text: "pl.Expr", mode: Optional[str]) -> "pl.Expr":
+    """
+    Limpieza de texto de una columna, equivalente a la del backend pandas.
+    """
+    if mode is None:
+        return text
+    text = text.str.strip_chars()
+    if mode == TransformPlan.UPPER:
+        text = text.str.to_uppercase()
+    elif mode == TransformPlan.NORMALIZE:
+        text = text.str.replace_all(r"\s+", " ").str.to_uppercase()
+    return text
+
+
+def _fallback(text: "pl.Expr", parse: Callable, dtype: "pl.DataType") -> "pl.Expr":
+    """
+    Convierte con una función de Python los valores distintos de text (los que la expresión de
+    la columna no pudo convertir; las demás filas llegan nulas), como último recurso.
+    """
+    def apply(texts: "pl.Series") -> "pl.Series":
+        distinct = texts.drop_nulls().unique()
+        if distinct.is_empty():
+            return pl.Series(texts.name, dtype=dtype).extend_constant(None, len(texts))
+        converted = pd.Series([parse(value) for value in distinct])
+        if dtype == pl.Float64:
+            converted = converted.astype(float)
+        else:
+            converted = converted.astype(DATE_DTYPE)
+        return texts.replace_strict(distinct, pl.Series(converted.to_numpy(), nan_to_null=True),
+                                    default=None, return_dtype=dtype)
+
+    return text.map_batches(apply, return_dtype=dtype, is_elementwise=True)
+
+
+def _number_stages(text: "pl.Expr", prefix: str) -> Tuple[List[List["pl.Expr"]], "pl.Expr"]:
+    """
+    parse_number como expresiones de Polars: negativos entre paréntesis, monedas, % y "días",
+    y el separador decimal según las mismas reglas. Lo que el cast no convierte se pasa por
+    parse_number, así que el resultado es el mismo que el del backend pandas.
+    El texto limpio se calcula antes en columnas auxiliares (prefix): las ramas de when/then
+    repiten su expresión completa en cada referencia.
+
+    Returns:
+        Tuple[List[List[pl.Expr]], pl.Expr]: Columnas auxiliares (por etapa) y expresión del número
+    """
+    stripped = text.str.strip_chars()
+    negative, digits = f"{prefix}_negative", f"{prefix}_digits"
+    auxiliary = [[
+        stripped.str.contains(r"(?s)^\(.*\)$").alias(negative),
+        stripped.str.replace(r"(?s)^\((.*)\)$", "$1").str.replace_all(f"(?i){NOISE_PATTERN}", "").alias(digits),
+    ]]
+
+    value = pl.col(digits)
+    comma = value.str.contains(",", literal=True)
+    without_commas = value.str.replace_all(",", "", literal=True)
+    value = (
+        # Con coma y punto, el separador que aparece último es el decimal
+        pl.when(comma & value.str.contains(r"\.[^,]*$")).then(without_commas)
+        .when(comma & value.str.contains(".", literal=True))
+        .then(value.str.replace_all(".", "", literal=True).str.replace_all(",", ".", literal=True))
+        .when(comma & value.str.contains(THOUSANDS_COMMA_PATTERN)).then(without_commas)
+        .when(comma).then(value.str.replace_all(",", ".", literal=True))
+        .when(value.str.contains(THOUSANDS_DOT_PATTERN)).then(value.str.replace_all(".", "", literal=True))
+        .otherwise(value)
+    )
+    sign = pl.when(pl.col(negative)).then(-1.0).otherwise(1.0)
+    number = f"{prefix}_number"
+    auxiliary.append([(value.cast(pl.Float64, strict=False).fill_nan(None) * sign).alias(number)])
+
+    failed = pl.when(pl.col(number).is_null() & (stripped != "")).then(text)
+    return auxiliary, pl.coalesce(pl.col(number), _fallback(failed, parse_number, pl.Float64).fill_nan(None))
+
+
+def _date_stages(text: "pl.Expr", fmt: Optional[str], prefix: str) -> Tuple[List[List["pl.Expr"]], "pl.Expr"]:
+    """
+    Fechas de texto con el formato de la columna; las que no lo siguen se convierten una a una
+    (como en parse_dates). La conversión con el formato queda en una columna auxiliar (prefix).
+
+    Returns:
+        Tuple[List[List[pl.Expr]], pl.Expr]: Columnas auxiliares (por etapa) y expresión de la fecha
+    """
+    value = text.str.strip_chars()
+    parsed = f"{prefix}_parsed"
+    if fmt is None:
+        auxiliary = [[pl.lit(None, dtype=pl.Datetime("us")).alias(parsed)]]
+    else:
+        auxiliary = [[value.str.strptime(pl.Datetime("us"), fmt, strict=False).alias(parsed)]]
+    failed = pl.when(pl.col(parsed).is_null() & (value != "")).then(value)
+    return auxiliary, pl.coalesce(pl.col(parsed), _fallback(failed, _parse_unknown, pl.Datetime("us")))
+
+
+def _date_format(texts: "pl.Series", fmt: Optional[str]) -> Optional[str]:
+    """
+    Formato de una columna de fecha, con la regla de parse_dates: el conocido mientras convierta
+    al menos la mitad de los textos distintos; si no, el que se infiere de una muestra.
+    """
+    distinct = texts.str.strip_chars().drop_nulls().unique(maintain_order=True)
+    if distinct.is_empty():
+        return fmt
+    if fmt is not None and distinct.str.strptime(pl.Datetime("us"), fmt, strict=False).null_count() <= len(distinct) / 2:
+        return fmt
+    return infer_date_format(distinct.head(DATE_SAMPLE_SIZE).to_list())
+
+
+def _day_diff(col: str, bounds) -> "pl.Expr":
+    """
+    Días entre dos columnas de fecha ya convertidas (Int64; al pasar a pandas es float si a
+    alguna fila de salida le falta una fecha, como en el backend pandas).
+    """
+    start, end = bounds
+    return (pl.col(end) - pl.col(start)).dt.total_days().alias(col)
+
+
+def _arrow_output(result: "pl.DataFrame", plan: TransformPlan, columns: Dict[str, pd.Series],
+                  day_diffs: Dict) -> "pl.DataFrame":
+    """
+    Ajusta los tipos del resultado a los de arrow_dtypes.to_arrow_dtypes antes de pasarlo a
+    pandas con columnas Arrow: fechas de texto como date32 si no tienen hora y diferencias en
+    días como double si a alguna fila le falta una fecha.
+    """
+    casts = []
+    for col, conversion in plan.conversions.items():
+        dtype = columns[col].dtype if col in columns else None
+        if conversion != TransformPlan.DATE or dtype is None or \
+                (isinstance(dtype, pd.ArrowDtype) and is_datetime64_any_dtype(dtype)):
+            # Las fechas que ya venían como Arrow quedan como están, igual que en parse_dates
+            continue
+        values = result[col]
+        if (values.dt.truncate("1d") == values).all():
+            casts.append(pl.col(col).cast(pl.Date))
+        else:
+            casts.append(pl.col(col).cast(pl.Datetime("us")))
+    for col in day_diffs:
+        if result[col].null_count():
+            casts.append(pl.col(col).cast(pl.Float64))
+    return result.with_columns(casts) if casts else result
+
+
+def execute_plan_polars(plan: TransformPlan, df: pd.DataFrame, columns: Dict[str, pd.Series],
+                        starts: np.ndarray, sort: bool = True) -> pd.DataFrame:
+    """
+    Ejecuta un plan compilado con una consulta LazyFrame de Polars.
+
+    La consulta parte de las columnas crudas que el plan usa (convertidas, limpias, de filtro o
+    de orden); las demás se toman de la entrada con las posiciones de fila que devuelve la
+    consulta. Los formatos de fecha se resuelven antes, sobre los textos distintos de cada
+    columna, y quedan guardados en el plan.
+
+    Args:
+        plan (TransformPlan): Plan de la hoja
+        df (pd.DataFrame): Hoja ya recortada por read_spec
+        columns (Dict[str, pd.Series]): Columnas de salida (vistas de la entrada) por nombre
+        starts (np.ndarray): Posición donde empieza cada libro
+        sort (bool): Ordenar por plan.sort_by (la base de datos no lo necesita)
+
+    Returns:
+        pd.DataFrame: DataFrame transformado, sin categorías (las aplica BaseTransformer)
+    """
+    frame: Dict[str, "pl.Series"] = {}
+
+    def source(key: str, values: pd.Series) -> Dict[str, "pl.Expr"]:
+        # Partes crudas de una columna, agregadas a la consulta
+        parts = {}
+        for kind, series in raw_parts(values).items():
+            frame[f"__{key}_{kind}"] = series
+            parts[kind] = pl.col(f"__{key}_{kind}")
+        return parts
+
+    day_diffs = {
+        col: bounds for col, bounds in plan.day_diff_columns.items()
+        if col not in columns and all(bound in columns for bound in bounds)
+    }
+
+    # Columnas que la consulta limpia o convierte, con sus columnas auxiliares por etapa
+    computed = [col for col in columns if col in plan.conversions or col in plan.text]
+    expressions: Dict[str, "pl.Expr"] = {}
+    auxiliary: Dict[str, List[List["pl.Expr"]]] = {}
+    for position, col in enumerate(computed):
+        parts = source(str(position), columns[col])
+        text = parts.get(TEXT)
+        if text is not None:
+            text = _text_expression(text, plan.text.get(col))
+        conversion = plan.conversions.get(col)
+        if conversion == TransformPlan.DATE:
+            dtype = pl.Datetime("us")
+            if text is not None:
+                plan.date_formats[col] = _date_format(frame[f"__{position}_{TEXT}"], plan.date_formats.get(col))
+                auxiliary[col], text = _date_stages(text, plan.date_formats[col], f"__{position}_parse")
+            candidates = [part for part in (parts.get(DATE), text) if part is not None]
+        elif conversion is not None:
+            dtype = pl.Float64
+            if text is not None:
+                auxiliary[col], text = _number_stages(text, f"__{position}_parse")
+            candidates = [part for part in (parts.get(NUMBER), text) if part is not None]
+            if conversion == TransformPlan.PERCENT:
+                candidates = [part / 100 for part in candidates]
+        else:
+            dtype = pl.String
+            candidates = [text] if text is not None else []
+        if not candidates:
+            expression = pl.lit(None, dtype=dtype)
+        else:
+            expression = candidates[0] if len(candidates) == 1 else pl.coalesce(candidates)
+        expressions[col] = expression.alias(col)
+
+    def convert(query: "pl.LazyFrame", cols: List[str]) -> "pl.LazyFrame":
+        # Etapas auxiliares de las columnas, luego las columnas
+        depth = max((len(auxiliary.get(col, ())) for col in cols), default=0)
+        for stage in range(depth):
+            query = query.with_columns([
+                expression for col in cols if stage < len(auxiliary.get(col, ()))
+                for expression in auxiliary[col][stage]
+            ])
+        return query.with_columns([expressions[col] for col in cols])
+
+    # Columnas sin conversión que deciden las filas: se filtra y ordena por su valor crudo
+    present: Dict[str, "pl.Expr"] = {col: pl.col(col).is_not_null() for col in expressions}
+    keys: Dict[str, "pl.Expr"] = {col: pl.col(col) for col in list(expressions) + list(day_diffs)}
+    for col in plan.critical_columns + plan.sort_by:
+        if col in columns and col not in keys:
+            parts = source(f"key_{len(keys)}", columns[col])
+            values = list(parts.values())
+            keys[col] = parts.get(TEXT, values[0] if values else pl.lit(None))
+            present[col] = pl.any_horizontal([part.is_not_null() for part in values]) if values else pl.lit(False)
+    for col in day_diffs:
+        present[col] = pl.col(col).is_not_null()
+
+    exclusions = []
+    for i, (key, texts) in enumerate(plan.exclude_texts):
+        text = source(f"exclude_{i}", df.iloc[:, key] if isinstance(key, int) else df[key]).get(TEXT)
+        if text is not None:
+            exclusions.append(~text.str.contains_any(texts).fill_null(False))
+
+    if frame:
+        query = pl.LazyFrame(frame, height=len(df)).with_row_index(ROW_COLUMN)
+    else:
+        query = pl.LazyFrame({ROW_COLUMN: pl.int_range(len(df), dtype=pl.UInt32, eager=True)})
+
+    # Filas excluidas primero, sobre el texto crudo
+    for condition in exclusions:
+        query = query.filter(condition)
+
+    # Solo las columnas críticas (y las fechas de sus diferencias en días) se convierten antes de su filtro
+    critical = [col for col in plan.critical_columns if col in columns or col in day_diffs]
+    first = [col for col in critical if col in expressions]
+    critical_diffs = [col for col in critical if col in day_diffs]
+    for col in critical_diffs:
+        first += [bound for bound in day_diffs[col] if bound in expressions and bound not in first]
+    if first:
+        query = convert(query, first)
+    if critical_diffs:
+        query = query.with_columns([_day_diff(col, day_diffs[col]) for col in critical_diffs])
+    if critical:
+        query = query.filter(pl.all_horizontal([present[col] for col in critical]))
+
+    if plan.drop_trailing_rows:
+        # Posición de cada fila contada desde el final de su libro
+        segment = pl.lit(pl.Series(starts)).search_sorted(pl.col(ROW_COLUMN), side="right")
+        from_end = pl.len().over(segment) - pl.int_range(pl.len()).over(segment)
+        query = query.filter(from_end > plan.drop_trailing_rows)
+
+    # Las demás columnas se limpian y convierten solo en las filas que quedaron
+    rest = [col for col in expressions if col not in first]
+    if rest:
+        query = convert(query, rest)
+    rest_diffs = [col for col in day_diffs if col not in critical_diffs]
+    if rest_diffs:
+        query = query.with_columns([_day_diff(col, day_diffs[col]) for col in rest_diffs])
+
+    if sort and plan.sort_by:
+        ascending = plan.ascending if isinstance(plan.ascending, (list, tuple)) else [plan.ascending] * len(plan.sort_by)
+        query = query.sort([keys[col] for col in plan.sort_by], descending=[not a for a in ascending],
+                           nulls_last=True, maintain_order=True)
+
+    result = query.select([ROW_COLUMN] + list(expressions) + list(day_diffs)).collect()
+    rows = result[ROW_COLUMN].to_numpy()
+
+    arrow = is_arrow_frame(df)
+    if arrow:
+        result = _arrow_output(result, plan, columns, day_diffs)
+    converted = result.drop(ROW_COLUMN).to_pandas(use_pyarrow_extension_array=arrow)
+
+    index = pd.RangeIndex(len(rows))
+    output = {}
+    for col, values in columns.items():
+        if col in expressions:
+            series = converted[col]
+            if col not in plan.conversions and series.dtype != values.dtype:
+                # El texto limpio conserva el tipo de la columna de entrada (object, str o Arrow)
+                series = series.astype(values.dtype)
+            output[col] = series
+        else:
+            output[col] = pd.Series(values.array.take(rows), index=index, dtype=values.dtype, copy=False)
+    for col in day_diffs:
+        output[col] = converted[col]
+    return pd.DataFrame(output, copy=False)
@@ -0,0 +1,208 @@
+"""
+Especificación declarativa de transformación por hoja.
+Cada hoja describe qué columnas conserva y cómo se llaman, qué tipos tienen, qué filas
+descarta y cómo se ordena; SheetSpec.compile() lo resuelve una sola vez en un TransformPlan
+que BaseTransformer ejecuta en una única pasada por columna.
+"""
+
+import hashlib
+import re
+import sys
+import os
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple, Union
+
+# Agregar el directorio raíz del proyecto al path para importaciones
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from extraction.sheet_read_spec import SheetReadSpec
+
+# Clave de columna de origen: posición en la hoja original (int) o etiqueta (str, p. ej. 'Fecha')
+ColumnKey = Union[int, str]
+
+# Versión del código que ejecuta las especificaciones (BaseTransformer, parsers, backends).
+# Subirla cuando un cambio de código altera la salida de una misma SheetSpec, para que
+# las hojas ya cargadas se vuelvan a transformar (ver SheetSpec.version)
+TRANSFORM_VERSION = 1
+
+
+class SheetSpec:
+    """
+    Descripción declarativa de la transformación de una hoja.
+
+    Las claves enteras de columns y exclude_rows son posiciones de la hoja original (las mismas
+    que usa read_spec); las claves de texto son etiquetas de columna, como la 'Fecha' que agrega
+    la extracción. Todas las demás listas usan los nombres de salida.
+
+    Example:
+        >>> SPEC = SheetSpec(
+        ...     name="BB_RFVTransPuestoBolsaMP",
+        ...     read_spec=SheetReadSpec(columns=[0, 1, 2, 3], start_anchor="Participante",
+        ...                             end_anchor="Total", start_occurrence=2),
+        ...     columns={0: "participante", 1: "transado_usd", 2: "usd_equivalente_dop",
+        ...              3: "transado_dop", "Fecha": "fecha"},
+        ...     strip_columns=["participante"],
+        ... )
+    """
+
+    def __init__(self, name: str, columns: Dict[ColumnKey, str], read_spec: Optional[SheetReadSpec] = None,
+                 keep_unmapped: bool = False, exclude_rows: Optional[Dict[ColumnKey, List[str]]] = None,
+                 date_columns: Sequence[str] = (), numeric_columns: Sequence[str] = (),
+                 percent_columns: Sequence[str] = (), strip_columns: Sequence[str] = (),
+                 upper_columns: Sequence[str] = (), normalize_columns: Sequence[str] = (),
+                 day_diff_columns: Optional[Dict[str, Tuple[str, str]]] = None,
+                 category_columns: Sequence[str] = (), critical_columns: Sequence[str] = (),
+                 drop_trailing_rows: int = 0,
+                 sort_by: Sequence[str] = (), ascending: Union[bool, Sequence[bool]] = True):
+        """
+        Args:
+            name (str): Nombre de la hoja (p. ej. 'BB_RFMPOperDia')
+            columns (Dict[ColumnKey, str]): Columna de origen -> nombre de salida, en el orden de salida
+            read_spec (Optional[SheetReadSpec]): Columnas y ventana de filas entre anclas a leer de la hoja
+            keep_unmapped (bool): Conservar todas las columnas del DataFrame en su orden y solo renombrar
+                                  las de columns (claves de texto), como DataFrame.rename
+            exclude_rows (Optional[Dict[ColumnKey, List[str]]]): Descarta las filas cuya columna contiene
+                                                                  alguno de los textos (p. ej. subtotales)
+            date_columns (Sequence[str]): Columnas a convertir a fecha (ver date_parser.parse_dates)
+            numeric_columns (Sequence[str]): Columnas a convertir a número (ver numeric_parser.parse_numeric)
+            percent_columns (Sequence[str]): Columnas numéricas en porcentaje, que se dividen entre 100
+            strip_columns (Sequence[str]): Texto sin espacios en los extremos
+            upper_columns (Sequence[str]): Texto en mayúsculas y sin espacios en los extremos
+            normalize_columns (Sequence[str]): Texto en mayúsculas con los espacios y saltos de línea colapsados
+            day_diff_columns (Optional[Dict[str, Tuple[str, str]]]): Columna -> (fecha_inicio, fecha_fin); se calcula
+                                                                     en días solo si la columna no viene en la hoja
+            category_columns (Sequence[str]): Texto repetitivo que se entrega como categórico, con las
+                                              categorías compartidas entre fechas (ver category_dictionary)
+            critical_columns (Sequence[str]): Se descartan las filas con nulos en cualquiera de ellas
+            drop_trailing_rows (int): Filas finales a descartar tras el filtrado (p. ej. notas al pie)
+            sort_by (Sequence[str]): Columnas de ordenamiento
+            ascending (Union[bool, Sequence[bool]]): Sentido del ordenamiento
+        """
+        self.name = name
+        self.columns = dict(columns)
+        self.read_spec = read_spec
+        self.keep_unmapped = keep_unmapped
+        self.exclude_rows = dict(exclude_rows or {})
+        self.date_columns = list(date_columns)
+        self.numeric_columns = list(numeric_columns)
+        self.percent_columns = list(percent_columns)
+        self.strip_columns = list(strip_columns)
+        self.upper_columns = list(upper_columns)
+        self.normalize_columns = list(normalize_columns)
+        self.day_diff_columns = dict(day_diff_columns or {})
+        self.category_columns = list(category_columns)
+        self.critical_columns = list(critical_columns)
+        self.drop_trailing_rows = drop_trailing_rows
+        self.sort_by = list(sort_by)
+        self.ascending = ascending
+
+    def compile(self) -> "TransformPlan":
+        """
+        Resuelve la especificación en un plan de ejecución.
+
+        Returns:
+            TransformPlan: Plan listo para BaseTransformer.execute_plan
+
+        Raises:
+            ValueError: Si la especificación es inconsistente
+        """
+        return TransformPlan(self)
+
+    def version(self) -> str:
+        """
+        Huella de la especificación (incluida su read_spec) y de TRANSFORM_VERSION.
+        Cambia con cualquier cambio de la transformación de la hoja, así el registro de
+        huellas no da por cargada una partición transformada con una especificación anterior.
+
+        Returns:
+            str: Hash hexadecimal estable entre ejecuciones
+
+        Example:
+            >>> SPEC.version() == SPEC.version()
+            True
+        """
+        state = {
+            key: vars(value) if isinstance(value, SheetReadSpec) else value
+            for key, value in vars(self).items()
+        }
+        content = repr((TRANSFORM_VERSION, sorted(state.items())))
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class TransformPlan:
+    """
+    Plan compilado de una SheetSpec: posiciones de columna ya traducidas al DataFrame que
+    produce read_spec, un paso de conversión por columna de salida y las expresiones
+    regulares precompiladas. Se construye una vez por hoja y se reutiliza en cada fecha.
+    """
+
+    # Conversión de cada columna de salida (a lo sumo una; el texto se limpia antes de convertir)
+    DATE = "date"
+    NUMERIC = "numeric"
+    PERCENT = "percent"
+
+    # Limpieza de texto
+    STRIP = "strip"
+    UPPER = "upper"
+    NORMALIZE = "normalize"
+
+    def __init__(self, spec: SheetSpec):
+        self.name = spec.name
+        self.read_spec = spec.read_spec
+        self.keep_unmapped = spec.keep_unmapped
+
+        self.columns: List[Tuple[ColumnKey, str]] = [
+            (self._resolve(spec, key), target) for key, target in spec.columns.items()
+        ]
+        self.rename: Dict[str, str] = {key: target for key, target in spec.columns.items() if isinstance(key, str)}
+        self.exclude_rows: List[Tuple[ColumnKey, Pattern]] = [
+            (self._resolve(spec, key), re.compile("|".join(re.escape(text) for text in texts)))
+            for key, texts in spec.exclude_rows.items()
+        ]
+        # Los mismos textos sin compilar, para motores que buscan literales (backend Polars)
+        self.exclude_texts: List[Tuple[ColumnKey, List[str]]] = [
+            (self._resolve(spec, key), list(texts)) for key, texts in spec.exclude_rows.items()
+        ]
+
+        unknown = set(spec.percent_columns) - set(spec.numeric_columns)
+        if unknown:
+            raise ValueError(f"{spec.name}: columnas porcentuales que no son numéricas: {sorted(unknown)}")
+        overlap = set(spec.date_columns) & set(spec.numeric_columns)
+        if overlap:
+            raise ValueError(f"{spec.name}: columnas declaradas como fecha y número a la vez: {sorted(overlap)}")
+
+        self.conversions: Dict[str, str] = {}
+        for col in spec.date_columns:
+            self.conversions[col] = self.DATE
+        for col in spec.numeric_columns:
+            self.conversions[col] = self.PERCENT if col in spec.percent_columns else self.NUMERIC
+
+        # Formato inferido de cada columna de fecha, que se completa en la primera ejecución
+        self.date_formats: Dict[str, Optional[str]] = {col: None for col in spec.date_columns}
+
+        self.text: Dict[str, str] = {}
+        for mode, cols in ((self.STRIP, spec.strip_columns), (self.UPPER, spec.upper_columns),
+                           (self.NORMALIZE, spec.normalize_columns)):
+            for col in cols:
+                self.text[col] = mode
+
+        self.day_diff_columns = dict(spec.day_diff_columns)
+        
+        overlap = set(spec.category_columns) & set(self.conversions)
+        if overlap:
+            raise ValueError(f"{spec.name}: columnas categóricas con conversión de fecha o número: {sorted(overlap)}")
+        self.category_columns = list(spec.category_columns)
+        self.critical_columns = list(spec.critical_columns)
+        self.drop_trailing_rows = spec.drop_trailing_rows
+        self.sort_by = list(spec.sort_by)
+        self.ascending = spec.ascending
+
+    @staticmethod
+    def _resolve(spec: SheetSpec, key: ColumnKey) -> ColumnKey:
+        """
+        Traduce una posición de la hoja original a su posición en el DataFrame recortado por read_spec.
+        """
+        if not isinstance(key, int) or spec.read_spec is None or spec.read_spec.columns is None:
+            return key
+        if key not in spec.read_spec.columns:
+            raise ValueError(f"{spec.name}: la columna {key} no está entre las columnas de read_spec")
+        return spec.read_spec.columns.index(key)